@@ -1,5 +1,9 @@
-def solve_part_1(input_data):
-    instructions = parse_instructions(input_data)
+def parse(input_data):
+    """Parse the wiring instructions once for both parts."""
+    return parse_instructions(input_data)
+
+
+def solve_part_1(instructions):
     wires = {}
 
     def get_signal(wire_or_value):
@@ -33,17 +37,15 @@ def solve_part_1(input_data):
 
     return get_signal('a')
 
-def solve_part_2(input_data):
+def solve_part_2(instructions):
     """
     Override wire b with the signal from wire a from part 1, then recalculate wire a
     """
     # First, get the signal from wire a in part 1
-    signal_a = solve_part_1(input_data)
-
-    # Parse instructions again
-    instructions = parse_instructions(input_data)
+    signal_a = solve_part_1(instructions)
 
-    # Override wire b with the signal from part 1
+    # Override wire b with the signal from part 1 (on a copy, the parsed instructions are shared)
+    instructions = dict(instructions)
     instructions['b'] = {'type': 'ASSIGN', 'input': str(signal_a)}
 
     # Reset and recalculate
@@ -1,7 +1,8 @@
-from typing import Any
+from typing import Any, List, Tuple
 
 
-def solve_part_1(input_data: str) -> Any:
+def parse(input_data: str) -> List[Tuple[int, int, int, int, int]]:
+    """Parse the df listing into (x, y, size, used, avail) nodes."""
     ls = input_data.strip().split('\n')[2:]
     ns = []
     for l in ls:
@@ -12,6 +13,10 @@ def solve_part_1(input_data: str) -> Any:
         u = int(p[2][:-1])
         a = int(p[3][:-1])
         ns.append((x, y, sz, u, a))
+    return ns
+
+
+def solve_part_1(ns: List[Tuple[int, int, int, int, int]]) -> Any:
     c = 0
     for i in range(len(ns)):
         for j in range(len(ns)):
@@ -20,18 +25,12 @@ def solve_part_1(input_data: str) -> Any:
     return c
 
 
-def solve_part_2(input_data: str) -> Any:
-    ls = input_data.strip().split('\n')[2:]
+def solve_part_2(nodes: List[Tuple[int, int, int, int, int]]) -> Any:
     ns = {}
     mx = my = 0
-    for l in ls:
-        p = l.split()
-        x = int(p[0].split('-')[1][1:])
-        y = int(p[0].split('-')[2][1:])
+    for x, y, sz, u, a in nodes:
         mx = max(mx, x)
         my = max(my, y)
-        sz = int(p[1][:-1])
-        u = int(p[2][:-1])
         ns[(x, y)] = (sz, u)
 
     emp = None
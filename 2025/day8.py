@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, List, Tuple
 import math
 try:
     import numpy as np
@@ -44,8 +44,8 @@ class UnionFind:
         return list(components.values())
 
 
-def solve_part_1(input_data: str) -> Any:
-    """Solve part 1 of the challenge."""
+def parse(input_data: str) -> Tuple[List[Tuple[int, int, int]], List[Tuple[float, int, int]]]:
+    """Parse the junction boxes and compute all pairwise distances, shortest first."""
     lines = input_data.strip().split('\n')
 
     boxes = []
@@ -65,6 +65,14 @@ def solve_part_1(input_data: str) -> Any:
 
     distances.sort()
 
+    return boxes, distances
+
+
+def solve_part_1(parsed) -> Any:
+    """Solve part 1 of the challenge."""
+    boxes, distances = parsed
+    n = len(boxes)
+
     uf = UnionFind(n)
 
     for idx, (dist, i, j) in enumerate(distances):
@@ -79,27 +87,11 @@ def solve_part_1(input_data: str) -> Any:
     return result
 
 
-def solve_part_2(input_data: str) -> Any:
+def solve_part_2(parsed) -> Any:
     """Solve part 2 of the challenge."""
-    lines = input_data.strip().split('\n')
-
-    boxes = []
-    for line in lines:
-        x, y, z = map(int, line.split(','))
-        boxes.append((x, y, z))
-
+    boxes, distances = parsed
     n = len(boxes)
 
-    distances = []
-    for i in range(n):
-        for j in range(i + 1, n):
-            x1, y1, z1 = boxes[i]
-            x2, y2, z2 = boxes[j]
-            dist = math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2 + (z1 - z2) ** 2)
-            distances.append((dist, i, j))
-
-    distances.sort()
-
     uf = UnionFind(n)
 
     for dist, i, j in distances:
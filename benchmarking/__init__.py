@@ -6,9 +6,30 @@ This package provides comprehensive benchmarking capabilities at different level
 - Full day (both parts)
 - Full year (all days in a year)
 - Full set (all available solutions)
+
+Submodules are imported lazily on first attribute access.
 """
 
-from .runner import BenchmarkRunner
-from .results import BenchmarkResult, BenchmarkStats
+from importlib import import_module
+
+_LAZY_IMPORTS = {
+    'BenchmarkRunner': '.runner',
+    'BenchmarkResult': '.results',
+    'BenchmarkStats': '.results',
+    'AdaptiveSettings': '.adaptive'
+}
+
+__all__ = ['BenchmarkRunner', 'BenchmarkResult', 'BenchmarkStats', 'AdaptiveSettings']
+
+
+def __getattr__(name: str):
+    """Import public names on first access so unused dependencies are never loaded."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ['BenchmarkRunner', 'BenchmarkResult', 'BenchmarkStats']
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,90 @@
+"""
+Adaptive run counts for benchmarks.
+
+A fixed run count is too many runs for a problem that takes seconds and too
+few for one that takes microseconds, whose timings are dominated by noise.
+An adaptive benchmark instead warms up until consecutive timings agree, then
+keeps measuring until the confidence interval of the median run time is
+narrow enough, or its time budget is spent.
+
+The interval is distribution-free: it is formed by two order statistics of
+the measured times, chosen with the binomial distribution (each time is
+below the true median with probability 1/2), so it holds for the skewed,
+long-tailed timings benchmarks produce.
+"""
+import math
+import statistics
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+# Above this many runs the binomial ranks come from the normal approximation
+_EXACT_RANK_LIMIT = 100
+
+
+@dataclass
+class AdaptiveSettings:
+    """When an adaptive benchmark stops warming up and measuring."""
+    target_width: float = 0.05  # CI width relative to the median (0.05: within 5%)
+    time_budget: float = 10.0  # seconds per problem, warmup included
+    confidence: float = 0.95
+    min_runs: int = 10
+    max_runs: int = 10_000
+    max_warmup_runs: int = 20
+    warmup_share: float = 0.2  # of the time budget, at most spent warming up
+    stable_window: int = 3  # warmup ends when the medians of the last two windows...
+    stable_tolerance: float = 0.05  # ...differ by at most this much
+
+
+def _median_rank(n: int, confidence: float) -> Optional[int]:
+    """
+    0-based rank of the lower bound of the median's confidence interval among n sorted values.
+
+    The upper bound has rank n - 1 - lower. Returns None if n values are too
+    few for the confidence level.
+    """
+    tail = (1 - confidence) / 2
+    if n <= _EXACT_RANK_LIMIT:
+        # Largest k with P(Binomial(n, 1/2) < k) <= tail; the bound is the k-th smallest value
+        total = 2 ** n
+        cumulative = 0
+        k = 0
+        while True:
+            cumulative += math.comb(n, k)
+            if cumulative / total > tail:
+                break
+            k += 1
+        return k - 1 if k else None
+
+    z = statistics.NormalDist().inv_cdf(1 - tail)
+    return max(math.floor((n - z * math.sqrt(n)) / 2) - 1, 0)
+
+
+def median_confidence_interval(sorted_times: Sequence[float],
+                               confidence: float = 0.95) -> Optional[Tuple[float, float]]:
+    """
+    Distribution-free confidence interval of the median of sorted run times.
+
+    Returns:
+        (lower, upper), or None if there are too few times (fewer than 6 at 95%)
+    """
+    n = len(sorted_times)
+    lower = _median_rank(n, confidence) if n else None
+    if lower is None:
+        return None
+    return sorted_times[lower], sorted_times[n - 1 - lower]
+
+
+def relative_width(interval: Optional[Tuple[float, float]], median: float) -> Optional[float]:
+    """Width of a confidence interval relative to the median (None without an interval)."""
+    if interval is None or median <= 0:
+        return None
+    return (interval[1] - interval[0]) / median
+
+
+def is_stable(times: Sequence[float], window: int = 3, tolerance: float = 0.05) -> bool:
+    """Check whether the median of the last window of times is within tolerance of the window before."""
+    if len(times) < 2 * window:
+        return False
+    previous = statistics.median(times[-2 * window:-window])
+    latest = statistics.median(times[-window:])
+    return previous > 0 and abs(latest - previous) / previous <= tolerance
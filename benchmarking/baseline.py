@@ -0,0 +1,196 @@
+"""
+Comparison of benchmark results against a saved baseline.
+
+`benchmark --baseline FILE` reads a file written by `benchmark --save`,
+benchmarks the same problems again and compares the run times of each with
+the baseline's using the one-sided Mann-Whitney U test of core.regressions,
+in both directions. A problem regresses when it is significantly slower by
+at least the threshold, or when it fails now but succeeded in the baseline;
+the command then exits non-zero, so a pipeline can gate changes on it.
+
+Per-call (`--micro`) and whole-call times, or adaptive and fixed run counts,
+aren't comparable, so the problems are benchmarked again in the mode saved
+with the baseline. Files saved before the mode was recorded tell micro runs
+by their loops and harness overhead, but not whether they were adaptive.
+"""
+import json
+import statistics
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from core.regressions import MIN_RUNS, MIN_SLOWDOWN, SIGNIFICANCE, mann_whitney_p_greater
+from core.run_stats import QuantileSketch
+from utils.display import DisplayFormatter
+from utils.time_utils import format_time
+from .adaptive import AdaptiveSettings
+from .results import BenchmarkStats
+
+# Years before this are day numbers of files saved without their year level
+_FIRST_YEAR = 2015
+
+
+@dataclass
+class Baseline:
+    """Run times (seconds) per problem of a saved benchmark results file."""
+    path: Path
+    timestamp: Optional[str]
+    hardware: Optional[Dict]
+    times: Dict[int, Dict[int, Dict[int, List[float]]]]  # year -> day -> part -> times
+    skipped: int = 0  # entries of older formats without a year or day
+    micro: bool = False  # per-call times measured with --micro
+    adaptive: Optional[AdaptiveSettings] = None  # settings of an --adaptive baseline
+    mode_saved: bool = True  # False for older files, which don't say whether they were adaptive
+
+    @property
+    def problems(self) -> List[tuple]:
+        """(year, day, part) of every problem in the baseline, sorted."""
+        return sorted((year, day, part) for year, days in self.times.items()
+                      for day, parts in days.items() for part in parts)
+
+
+def load_baseline(path: Path) -> Baseline:
+    """
+    Read a file written by save_benchmark_results.
+
+    Raises:
+        ValueError: If the file isn't a saved benchmark results file
+    """
+    with open(path) as f:
+        saved = json.load(f)
+    if not isinstance(saved, dict) or not isinstance(saved.get('results'), dict):
+        raise ValueError(f"{path} is not a saved benchmark results file")
+
+    times: Dict[int, Dict[int, Dict[int, List[float]]]] = {}
+    skipped = 0
+    micro = False
+    for year, days in saved['results'].items():
+        for day, parts in days.items():
+            # Older files saved single days as {year: {part: stats}} and years as {day: {part: stats}}
+            if 'times' in parts or int(year) < _FIRST_YEAR:
+                skipped += 1
+                continue
+            for part, stats in parts.items():
+                times.setdefault(int(year), {}).setdefault(int(day), {})[int(part)] = stats.get('times') or []
+                # Only micro runs batch calls or subtract the harness overhead
+                micro = micro or (stats.get('loops') or 1) > 1 or stats.get('harness_overhead') is not None
+
+    baseline = Baseline(Path(path), saved.get('timestamp'), saved.get('hardware'), times, skipped, micro)
+    mode = saved.get('mode')
+    if isinstance(mode, dict):
+        baseline.micro = bool(mode.get('micro'))
+        if mode.get('adaptive'):
+            names = {f.name for f in fields(AdaptiveSettings)}
+            baseline.adaptive = AdaptiveSettings(**{k: v for k, v in mode['adaptive'].items() if k in names})
+    else:
+        baseline.mode_saved = False
+    return baseline
+
+
+def _sketch(times: List[float]) -> QuantileSketch:
+    sketch = QuantileSketch()
+    sketch.add_all(seconds * 1000 for seconds in times)
+    return sketch
+
+
+@dataclass
+class BaselineComparison:
+    """Run times (seconds) of a problem now against its baseline."""
+    year: int
+    day: int
+    part: int
+    baseline_times: List[float]
+    times: List[float]
+    threshold: float = MIN_SLOWDOWN  # median ratio at which a significant slowdown is a regression
+    _p_values: Dict[str, float] = field(default_factory=dict, repr=False)
+
+    @property
+    def baseline_median(self) -> Optional[float]:
+        return statistics.median(self.baseline_times) if self.baseline_times else None
+
+    @property
+    def median(self) -> Optional[float]:
+        return statistics.median(self.times) if self.times else None
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """Current median over baseline median (above 1 means slower)."""
+        if not self.times or not self.baseline_times or not self.baseline_median:
+            return None
+        return self.median / self.baseline_median
+
+    @property
+    def comparable(self) -> bool:
+        """Whether both sides have enough runs for the test."""
+        return len(self.times) >= MIN_RUNS and len(self.baseline_times) >= MIN_RUNS
+
+    def _p_value(self, direction: str) -> float:
+        if not self.comparable:
+            return 1.0
+        if direction not in self._p_values:
+            current, baseline = _sketch(self.times), _sketch(self.baseline_times)
+            self._p_values[direction] = (mann_whitney_p_greater(current, baseline) if direction == 'slower'
+                                         else mann_whitney_p_greater(baseline, current))
+        return self._p_values[direction]
+
+    @property
+    def p_slower(self) -> float:
+        """Significance of the current runs being slower than the baseline's."""
+        return self._p_value('slower')
+
+    @property
+    def p_faster(self) -> float:
+        """Significance of the current runs being faster than the baseline's."""
+        return self._p_value('faster')
+
+    @property
+    def status(self) -> str:
+        """'regression', 'slower', 'faster', 'unchanged', 'failed', 'too few runs' or 'no baseline'."""
+        if not self.baseline_times:
+            return 'no baseline'
+        if not self.times:
+            return 'failed'
+        if not self.comparable:
+            return 'too few runs'
+        if self.p_slower < SIGNIFICANCE:
+            return 'regression' if self.ratio >= self.threshold else 'slower'
+        if self.p_faster < SIGNIFICANCE:
+            return 'faster'
+        return 'unchanged'
+
+    @property
+    def is_regression(self) -> bool:
+        return self.status in ('regression', 'failed')
+
+
+def compare_with_baseline(baseline: Baseline, results: Dict[int, Dict[int, Dict[int, BenchmarkStats]]],
+                          threshold: float = MIN_SLOWDOWN) -> List[BaselineComparison]:
+    """Compare new results (year -> day -> part -> stats) with the baseline, per baseline problem."""
+    comparisons = []
+    for year, day, part in baseline.problems:
+        stats = results.get(year, {}).get(day, {}).get(part)
+        comparisons.append(BaselineComparison(year, day, part, baseline.times[year][day][part],
+                                              stats.times if stats else [], threshold))
+    return comparisons
+
+
+_STATUS_ICONS = {'regression': '🐢', 'failed': '❌', 'faster': '🚀'}
+
+
+def format_comparison_table(comparisons: List[BaselineComparison]) -> str:
+    """Terminal table of the median change of every problem against its baseline."""
+    rows = []
+    for c in comparisons:
+        baseline_median = format_time(c.baseline_median * 1000) if c.baseline_times else "—"
+        median = format_time(c.median * 1000) if c.times else "—"
+        ratio = c.ratio
+        rows.append([
+            f"{_STATUS_ICONS.get(c.status, '  ')} {c.year} Day {c.day} Part {c.part}",
+            f"{baseline_median} → {median}",
+            f"{(ratio - 1) * 100:+.1f}%" if ratio is not None else "—",
+            f"{min(c.p_slower, c.p_faster):.2g}" if c.comparable else "—",
+            f"{len(c.baseline_times)} → {len(c.times)}",
+            c.status
+        ])
+    headers = ["Problem", "Median", "Change", "p-value", "Runs", "Status"]
+    return DisplayFormatter().format_table_for_terminal(headers, rows)
@@ -0,0 +1,201 @@
+"""
+Hardware performance counters for benchmark runs (Linux only).
+
+With `benchmark --counters`, every run also counts the CPU's instructions,
+cycles, cache misses and branch misses of the solve call, through the
+`perf_event_open` system call (no `perf` binary needed). Together they tell
+what bounds a solution: few instructions per cycle with many cache misses
+per thousand instructions is memory-bound, a high IPC with few misses is
+plain interpreter work.
+
+The counters form one group, so all of them count over exactly the same
+interval, and count user space only, which unprivileged processes may do
+with the default `kernel.perf_event_paranoid` setting of 2. They belong to
+the thread that opened them: CounterGroup.counted() reopens them when the
+solve call runs on another thread (the timed executor's worker is replaced
+after a timeout). Enabling and disabling the group adds two ioctl calls to
+each run's time, about a microsecond. Virtual machines often expose no
+hardware counters at all; available() then says why.
+"""
+import ctypes
+import errno
+import os
+import platform
+import struct
+import threading
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows; perf_event_open is Linux-only anyway
+    fcntl = None
+
+# perf_event_open system call numbers per machine
+_SYSCALL_NUMBERS = {
+    'x86_64': 298,
+    'i386': 336, 'i686': 336,
+    'aarch64': 241, 'arm64': 241, 'riscv64': 241,
+    'armv7l': 364,
+    'ppc64le': 319, 'ppc64': 319,
+    's390x': 331,
+}
+
+_PERF_TYPE_HARDWARE = 0
+
+# Counted events and their PERF_COUNT_HW_* configs; the first leads the group
+EVENTS = {
+    'cycles': 0,
+    'instructions': 1,
+    'cache_misses': 3,
+    'branch_misses': 5,
+}
+
+_FLAG_DISABLED = 1 << 0
+_FLAG_EXCLUDE_KERNEL = 1 << 5
+_FLAG_EXCLUDE_HV = 1 << 6
+
+_FORMAT_TOTAL_TIME_ENABLED = 1 << 0
+_FORMAT_TOTAL_TIME_RUNNING = 1 << 1
+_FORMAT_GROUP = 1 << 3
+
+_IOC_ENABLE = 0x2400
+_IOC_DISABLE = 0x2401
+_IOC_RESET = 0x2403
+_IOC_FLAG_GROUP = 1
+
+
+class _EventAttr(ctypes.Structure):
+    """The first 64 bytes of struct perf_event_attr (PERF_ATTR_SIZE_VER0), accepted by every kernel."""
+    _fields_ = [
+        ('type', ctypes.c_uint32),
+        ('size', ctypes.c_uint32),
+        ('config', ctypes.c_uint64),
+        ('sample_period', ctypes.c_uint64),
+        ('sample_type', ctypes.c_uint64),
+        ('read_format', ctypes.c_uint64),
+        ('flags', ctypes.c_uint64),
+        ('wakeup_events', ctypes.c_uint32),
+        ('bp_type', ctypes.c_uint32),
+        ('config1', ctypes.c_uint64),
+    ]
+
+
+_libc = None
+
+
+def _perf_event_open(config: int, group_fd: int) -> int:
+    """Open a user-space hardware counter of the calling thread, disabled. Raises OSError."""
+    global _libc
+    number = _SYSCALL_NUMBERS.get(platform.machine())
+    if platform.system() != 'Linux' or number is None:
+        raise OSError(errno.ENOSYS, f"perf_event_open isn't supported on {platform.system()} {platform.machine()}")
+    if _libc is None:
+        _libc = ctypes.CDLL(None, use_errno=True)
+        _libc.syscall.restype = ctypes.c_long
+
+    attr = _EventAttr(type=_PERF_TYPE_HARDWARE, size=ctypes.sizeof(_EventAttr), config=config,
+                      read_format=_FORMAT_GROUP | _FORMAT_TOTAL_TIME_ENABLED | _FORMAT_TOTAL_TIME_RUNNING,
+                      flags=(_FLAG_DISABLED if group_fd == -1 else 0) | _FLAG_EXCLUDE_KERNEL | _FLAG_EXCLUDE_HV)
+    fd = _libc.syscall(number, ctypes.byref(attr), 0, -1, group_fd, 0)
+    if fd < 0:
+        code = ctypes.get_errno()
+        raise OSError(code, os.strerror(code))
+    return fd
+
+
+def _describe(error: OSError) -> str:
+    """Why counters can't be opened, in the terms of its usual cause."""
+    if error.errno == errno.ENOENT:
+        return "the CPU exposes no hardware counters (common in virtual machines)"
+    if error.errno in (errno.EACCES, errno.EPERM):
+        return "not permitted, lower kernel.perf_event_paranoid to 2 or less"
+    if error.errno == errno.ENOSYS:
+        return error.strerror
+    return f"perf_event_open failed: {error.strerror}"
+
+
+def available() -> Optional[str]:
+    """None if this thread can count the hardware events, else the reason it can't."""
+    try:
+        group = CounterGroup()
+        group.open()
+    except OSError as e:
+        return _describe(e)
+    group.close()
+    return None
+
+
+class CounterGroup:
+    """Hardware event counters of one thread, counting only around counted calls."""
+
+    def __init__(self):
+        self._fds = []
+        self._thread: Optional[int] = None
+
+    def open(self) -> None:
+        """Open the counters for the calling thread (closing any others). Raises OSError."""
+        self.close()
+        leader = -1
+        try:
+            for config in EVENTS.values():
+                fd = _perf_event_open(config, leader)
+                self._fds.append(fd)
+                if leader == -1:
+                    leader = fd
+        except OSError:
+            self.close()
+            raise
+        self._thread = threading.get_ident()
+
+    def close(self) -> None:
+        """Close the counters."""
+        for fd in self._fds:
+            os.close(fd)
+        self._fds = []
+        self._thread = None
+
+    def reset(self) -> None:
+        """Zero the counts (from any thread), before a counted call."""
+        if self._fds:
+            fcntl.ioctl(self._fds[0], _IOC_RESET, _IOC_FLAG_GROUP)
+
+    def counted(self, func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        """A function that calls func(arg) with the counters counting."""
+        def run_counted(arg: Any) -> Any:
+            if self._thread != threading.get_ident():
+                # Fresh counters start at zero
+                self.open()
+            leader = self._fds[0]
+            fcntl.ioctl(leader, _IOC_ENABLE, _IOC_FLAG_GROUP)
+            try:
+                return func(arg)
+            finally:
+                fcntl.ioctl(leader, _IOC_DISABLE, _IOC_FLAG_GROUP)
+
+        return run_counted
+
+    def read(self) -> Optional[Dict[str, float]]:
+        """
+        Counts of the last counted call per event.
+
+        Counts are scaled up when the kernel had to share the hardware with
+        other groups for part of the call. Returns None if the group never
+        got onto the hardware.
+        """
+        if not self._fds:
+            return None
+        size = 8 * (3 + len(EVENTS))
+        data = os.read(self._fds[0], size)
+        count, enabled, running, *values = struct.unpack(f"{len(data) // 8}Q", data)
+        if not running or count != len(EVENTS):
+            return None
+        scale = enabled / running
+        return {name: value * scale for name, value in zip(EVENTS, values)}
+
+
+def format_count(count: float) -> str:
+    """Format an event count with a k/M/G suffix."""
+    for suffix, size in (('G', 1e9), ('M', 1e6), ('k', 1e3)):
+        if count >= size:
+            return f"{count / size:.1f}{suffix}"
+    return f"{count:.0f}"
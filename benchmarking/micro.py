@@ -0,0 +1,65 @@
+"""
+Micro-benchmark timing for solutions that finish in microseconds.
+
+A closed-form solution (2016 day 19, 2015 day 25, ...) returns in less time
+than the timer calls, loop and hand-off around it, so one call's measured
+time is mostly harness. In micro mode every sample calls the solve function
+`loops` times in a row, with loops calibrated as in timeit's autorange until
+a sample takes at least MIN_SAMPLE_TIME. The time of the same loop around a
+function that does nothing is subtracted from every sample, and the rest is
+divided by loops to give the time per call.
+
+Every call of a sample gets the same input (or parsed value), so solutions
+that modify their input in place can't be micro-benchmarked.
+"""
+from typing import Any, Callable
+
+from core.timed_executor import TimedExecutor
+
+# A calibrated sample takes at least this long (seconds)
+MIN_SAMPLE_TIME = 0.05
+
+# Calibration gives up growing the loop count here
+MAX_LOOPS = 10_000_000
+
+# Samples of the empty loop whose minimum is taken as the harness overhead
+OVERHEAD_SAMPLES = 5
+
+
+def batch(func: Callable[[Any], Any], loops: int) -> Callable[[Any], Any]:
+    """A function that calls func(arg) loops times and returns the last result."""
+    if loops == 1:
+        return func
+
+    def run_batch(arg: Any) -> Any:
+        for _ in range(loops - 1):
+            func(arg)
+        return func(arg)
+
+    return run_batch
+
+
+def _do_nothing(arg: Any) -> None:
+    return None
+
+
+def autorange(executor: TimedExecutor, func: Callable[[Any], Any], arg: Any,
+              timeout: float = None, min_sample_time: float = MIN_SAMPLE_TIME) -> int:
+    """
+    Smallest loop count of 1, 2, 5, 10, 20, 50, ... whose sample takes at least min_sample_time.
+
+    Raises whatever func raises (or TimeoutError from the executor).
+    """
+    loops = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            count = loops * multiplier
+            if count >= MAX_LOOPS or executor.call(batch(func, count), arg, timeout).execution_time >= min_sample_time:
+                return count
+        loops *= 10
+
+
+def harness_overhead(executor: TimedExecutor, loops: int, timeout: float = None) -> float:
+    """Seconds a sample of loops calls takes around a function that does nothing."""
+    do_nothing = batch(_do_nothing, loops)
+    return min(executor.call(do_nothing, None, timeout).execution_time for _ in range(OVERHEAD_SAMPLES))
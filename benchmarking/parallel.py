@@ -0,0 +1,192 @@
+"""
+Process-pool execution of benchmark units.
+
+A benchmark unit is a single (year, day, part) problem. Units are independent,
+so a full sweep can be fanned out across worker processes. Each worker loads
+its own solution module and input, runs the regular warmup/measurement loop
+and sends the resulting statistics back to the parent for merging.
+"""
+
+import contextlib
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .adaptive import AdaptiveSettings
+from .results import BenchmarkResult, BenchmarkStats
+
+
+BenchmarkUnit = Tuple[int, int, int]
+
+# Per-worker state, populated by the pool initializer
+_worker_state: Dict = {}
+
+
+def parse_cpu_list(spec: str) -> List[int]:
+    """
+    Parse a CPU list such as "0-3,6,8-9" into a sorted list of CPU ids.
+
+    Args:
+        spec: Comma separated CPU ids and inclusive ranges
+
+    Returns:
+        Sorted list of unique CPU ids
+    """
+    cpus = set()
+    for chunk in spec.split(','):
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        if '-' in chunk:
+            start, end = chunk.split('-', 1)
+            cpus.update(range(int(start), int(end) + 1))
+        else:
+            cpus.add(int(chunk))
+
+    if not cpus:
+        raise ValueError(f"Empty CPU list: {spec!r}")
+    return sorted(cpus)
+
+
+def supports_cpu_affinity() -> bool:
+    """Check if the platform allows restricting processes to specific CPUs."""
+    return hasattr(os, 'sched_setaffinity')
+
+
+def get_available_cpus() -> List[int]:
+    """Get the CPUs the current process is allowed to run on."""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _init_worker(cpu_queue, cpus: Optional[List[int]], expected_values: Dict[int, str],
+                 adaptive: Optional[AdaptiveSettings], micro: bool, counters: bool, resource_runs: int) -> None:
+    """Pool initializer: apply CPU placement and prepare a quiet runner."""
+    if supports_cpu_affinity():
+        if cpu_queue is not None:
+            # Dedicated core per worker so concurrent jobs don't share caches/timeslices
+            os.sched_setaffinity(0, {cpu_queue.get()})
+        elif cpus:
+            os.sched_setaffinity(0, set(cpus))
+
+    from .runner import BenchmarkRunner
+    _worker_state['runner'] = BenchmarkRunner(expected_values=expected_values, adaptive=adaptive, micro=micro,
+                                              counters=counters, resource_runs=resource_runs)
+
+
+def _run_unit(unit: BenchmarkUnit, runs: int, warmup_runs: int,
+              timeout: float) -> Tuple[BenchmarkUnit, BenchmarkStats, List[BenchmarkResult]]:
+    """Benchmark a single unit inside a worker process."""
+    year, day, part = unit
+    runner = _worker_state['runner']
+    runner.results = []
+
+    # Per-run progress output from concurrent workers would interleave, so it's discarded
+    with contextlib.redirect_stdout(io.StringIO()):
+        stats = runner.benchmark_problem(year, day, part, runs=runs,
+                                         warmup_runs=warmup_runs, timeout=timeout)
+
+    # Solution results can be arbitrary objects; only their string form is needed upstream
+    results = []
+    for result in runner.results:
+        if result.result is not None:
+            result.result = str(result.result)
+        results.append(result)
+
+    return unit, stats, results
+
+
+class ParallelBenchmarkExecutor:
+    """Runs benchmark units concurrently in a pool of worker processes."""
+
+    def __init__(self, jobs: int, cpus: Optional[List[int]] = None, pin_cpus: bool = False,
+                 expected_values: Dict[int, str] = None, adaptive: AdaptiveSettings = None,
+                 micro: bool = False, counters: bool = False, resource_runs: int = 0):
+        """
+        Initialize the executor.
+
+        Args:
+            jobs: Number of worker processes
+            cpus: CPUs the workers may use (defaults to all available CPUs)
+            pin_cpus: Pin every worker to its own dedicated CPU
+            expected_values: Expected results per part, passed on to the workers
+            adaptive: Adaptive run count settings, passed on to the workers
+            micro: Time calibrated batches of calls, passed on to the workers
+            counters: Count hardware events, passed on to the workers
+            resource_runs: Instrumented runs per pass measuring CPU time and memory, passed on to the workers
+        """
+        self.cpus = cpus
+        self.pin_cpus = pin_cpus
+        self.expected_values = expected_values or {}
+        self.adaptive = adaptive
+        self.micro = micro
+        self.counters = counters
+        self.resource_runs = resource_runs
+
+        if (cpus or pin_cpus) and not supports_cpu_affinity():
+            print("⚠️  CPU pinning is not supported on this platform, running without it")
+            self.cpus = None
+            self.pin_cpus = False
+
+        if self.pin_cpus:
+            usable = self.cpus or get_available_cpus()
+            if jobs > len(usable):
+                print(f"⚠️  Only {len(usable)} CPUs available for pinning, limiting to {len(usable)} jobs")
+                jobs = len(usable)
+            self.cpus = usable[:jobs]
+
+        self.jobs = max(1, jobs)
+
+    def run(self, units: List[BenchmarkUnit], runs: int, warmup_runs: int, timeout: float,
+            on_complete: Callable[[BenchmarkUnit, BenchmarkStats, List[BenchmarkResult]], None] = None
+            ) -> Dict[int, Dict[int, Dict[int, BenchmarkStats]]]:
+        """
+        Benchmark all units and merge the results.
+
+        Args:
+            units: (year, day, part) problems to benchmark
+            runs: Measurement runs per unit (ignored in adaptive mode)
+            warmup_runs: Warmup runs per unit (ignored in adaptive mode)
+            timeout: Timeout per individual run in seconds
+            on_complete: Optional callback invoked in the parent as each unit finishes
+
+        Returns:
+            Nested dict year -> day -> part -> BenchmarkStats
+        """
+        cpu_queue = None
+        if self.pin_cpus:
+            cpu_queue = multiprocessing.Queue()
+            for cpu in self.cpus:
+                cpu_queue.put(cpu)
+
+        merged: Dict[int, Dict[int, Dict[int, BenchmarkStats]]] = {}
+
+        with ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker,
+                                 initargs=(cpu_queue, self.cpus, self.expected_values, self.adaptive,
+                                           self.micro, self.counters, self.resource_runs)) as pool:
+            futures = {pool.submit(_run_unit, unit, runs, warmup_runs, timeout): unit for unit in units}
+
+            for future in as_completed(futures):
+                year, day, part = futures[future]
+                try:
+                    _, stats, results = future.result()
+                except Exception as e:
+                    print(f"❌ Worker failed on {year} Day {day} Part {part}: {e}")
+                    stats = BenchmarkStats(0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, [])
+                    results = []
+
+                merged.setdefault(year, {}).setdefault(day, {})[part] = stats
+                if on_complete:
+                    on_complete((year, day, part), stats, results)
+
+        # Completion order is arbitrary; restore the sorted layout of the sequential path
+        return {
+            year: {
+                day: dict(sorted(parts.items()))
+                for day, parts in sorted(days.items())
+            }
+            for year, days in sorted(merged.items())
+        }
@@ -0,0 +1,92 @@
+"""
+CPU time and memory use of solve calls, measured in instrumented runs.
+
+Wall time hides what limits a solver that builds a multi-million-element
+list or a dict that grows with every step: memory. With `benchmark
+--resources N`, every problem gets N more runs after its timed ones, in two
+instrumented passes whose timings are discarded, so they never distort the
+measured times:
+
+1. **Usage**: the process CPU time of the call, the change of the process's
+   resident set size (RSS) and the net number of memory blocks the call
+   allocated and left allocated (its result, caches, leaks). These are
+   read around the call and cost next to nothing, but their times are kept
+   out of the measured ones all the same.
+2. **Traced**: the peak of the Python heap during the call, with
+   `tracemalloc`. Tracing every allocation slows solutions down several
+   times, hence its own pass.
+
+CPython has no counter of all allocations a call makes, so the block count
+is the net one; a solver that allocates and frees heavily shows up in its
+traced peak and CPU time instead.
+"""
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes (Linux only, else None)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+@dataclass
+class ResourceUsage:
+    """CPU time and memory use of one instrumented call."""
+    cpu_time: Optional[float] = None  # seconds of process CPU time
+    rss_delta: Optional[int] = None  # bytes the resident set grew by (negative if it shrank)
+    allocated_blocks: Optional[int] = None  # net memory blocks allocated
+    traced_peak: Optional[int] = None  # bytes of peak Python heap above its level before the call
+
+
+def measure_usage(func: Callable[[Any], Any], usage: ResourceUsage) -> Callable[[Any], Any]:
+    """A function that calls func(arg), recording its CPU time, RSS change and net allocated blocks in usage."""
+    def run_measured(arg: Any) -> Any:
+        rss = current_rss()
+        blocks = sys.getallocatedblocks()
+        cpu_start = time.process_time()
+        try:
+            return func(arg)
+        finally:
+            usage.cpu_time = time.process_time() - cpu_start
+            usage.allocated_blocks = sys.getallocatedblocks() - blocks
+            if rss is not None:
+                usage.rss_delta = current_rss() - rss
+
+    return run_measured
+
+
+def measure_traced_peak(func: Callable[[Any], Any], usage: ResourceUsage) -> Callable[[Any], Any]:
+    """A function that calls func(arg) under tracemalloc, recording its peak heap use in usage."""
+    def run_traced(arg: Any) -> Any:
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        elif hasattr(tracemalloc, 'reset_peak'):  # Python 3.9+
+            tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        try:
+            return func(arg)
+        finally:
+            usage.traced_peak = tracemalloc.get_traced_memory()[1] - baseline
+            if not was_tracing:
+                tracemalloc.stop()
+
+    return run_traced
+
+
+def format_bytes(size: float) -> str:
+    """Format a byte count (which may be negative) in KB, MB or GB."""
+    for suffix, unit in (('GB', 1024 ** 3), ('MB', 1024 ** 2), ('KB', 1024)):
+        if abs(size) >= unit:
+            return f"{size / unit:.1f} {suffix}"
+    return f"{size:.0f} B"
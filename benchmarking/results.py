@@ -1,8 +1,11 @@
 """
 Data structures for benchmark results and statistics.
 """
+import statistics
 from dataclasses import dataclass
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from .adaptive import relative_width
 
 
 @dataclass
@@ -13,9 +16,19 @@ class BenchmarkResult:
     part: int
     success: bool
     result: Any
-    execution_time: float  # in seconds
+    execution_time: float  # in seconds (per call, in micro mode)
     error_message: Optional[str] = None
     validation_passed: Optional[bool] = None  # None if no validation requested
+    parse_time: Optional[float] = None  # in seconds, for solutions with a parse hook
+    phases: Optional[Dict[str, float]] = None  # seconds per phase (utils.phase_timer)
+    loops: int = 1  # calls timed together in this sample (micro mode)
+    counters: Optional[Dict[str, float]] = None  # hardware event counts (per call in micro mode)
+    # Instrumented runs ('usage' or 'traced', see benchmarking.resources), whose times aren't measurements
+    instrumented: Optional[str] = None
+    cpu_time: Optional[float] = None  # seconds of process CPU time
+    rss_delta: Optional[int] = None  # bytes the resident set grew by
+    allocated_blocks: Optional[int] = None  # net memory blocks allocated
+    traced_peak: Optional[int] = None  # bytes of peak Python heap (tracemalloc)
 
 
 @dataclass
@@ -33,3 +46,30 @@ class BenchmarkStats:
     validation_enabled: bool = False
     validation_passed_count: int = 0
     expected_value: Optional[str] = None
+    parse_time: Optional[float] = None  # one-off parse hook time in seconds (not part of times)
+    phases: Optional[Dict[str, float]] = None  # median seconds per phase over successful runs
+    median_ci: Optional[Tuple[float, float]] = None  # confidence interval of median_time (seconds)
+    confidence: Optional[float] = None  # confidence level of median_ci
+    loops: int = 1  # calls per sample in micro mode; the times are per call
+    harness_overhead: Optional[float] = None  # seconds per call subtracted in micro mode
+    counters: Optional[Dict[str, List[float]]] = None  # hardware event counts of the successful runs
+    # Medians over the successful instrumented runs (benchmarking.resources): CPU time, RSS
+    # change and blocks from the usage pass, the traced peak from the traced pass
+    usage_runs: int = 0
+    traced_runs: int = 0
+    cpu_time: Optional[float] = None
+    rss_delta: Optional[float] = None
+    allocated_blocks: Optional[float] = None
+    traced_peak: Optional[float] = None
+
+    @property
+    def median_ci_width(self) -> Optional[float]:
+        """Width of median_ci relative to the median (0.05: the median is known within 5%)."""
+        return relative_width(self.median_ci, self.median_time)
+
+    @property
+    def median_counters(self) -> Optional[Dict[str, float]]:
+        """Median count per hardware event."""
+        if not self.counters:
+            return None
+        return {event: statistics.median(counts) for event, counts in self.counters.items() if counts}
@@ -8,11 +8,14 @@ This module provides comprehensive benchmarking capabilities at different levels
 - Full set (all available solutions)
 """
 
-import importlib.util
+import bisect
+import sqlite3
 import statistics
 import time
+from contextlib import contextmanager
+from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Union
 from datetime import datetime
 import json
 
@@ -46,9 +49,20 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-from core.input_handler import get_input
+from core.input_handler import get_input, get_puzzle_input
+from core.puzzle_input import PuzzleInput
+from core.timed_executor import TimedExecutor
+from core.parsed_input import ParsedInput, get_parsed_input_cache, has_parse_hook
+from utils.phase_timer import record_phases
+from utils.hardware_info import get_hardware_info
+from core.module_registry import get_module_registry
 from core.tracker import AOCTracker
+from .adaptive import AdaptiveSettings, is_stable, median_confidence_interval, relative_width
+from .counters import CounterGroup, format_count
+from .resources import ResourceUsage, format_bytes, measure_traced_peak, measure_usage
+from .micro import autorange, batch, harness_overhead
 from .results import BenchmarkResult, BenchmarkStats
+from .parallel import BenchmarkUnit, ParallelBenchmarkExecutor
 
 
 def create_progress_bar(current: int, total: int, width: int = 40, prefix: str = "") -> str:
@@ -84,11 +98,29 @@ def print_progress_update(message: str, overwrite: bool = True):
 class BenchmarkRunner:
     """Main benchmarking class."""
 
-    def __init__(self, tracker: AOCTracker = None, publish_to_db: bool = False, expected_values: Dict[int, str] = None):
+    def __init__(self, tracker: AOCTracker = None, publish_to_db: bool = False, expected_values: Dict[int, str] = None,
+                 adaptive: AdaptiveSettings = None, micro: bool = False, counters: bool = False,
+                 resource_runs: int = 0):
+        """
+        With adaptive settings, every problem is measured until the confidence
+        interval of its median is narrow enough (see benchmarking.adaptive)
+        instead of for a fixed number of runs. With micro, every sample times
+        a calibrated number of calls and reports the time per call (see
+        benchmarking.micro). With counters, every run also counts hardware
+        events (see benchmarking.counters; check counters.available() first).
+        With resource_runs, every problem gets that many more runs in each
+        instrumented pass measuring CPU time and memory use (see
+        benchmarking.resources).
+        """
         self.results: List[BenchmarkResult] = []
         self.tracker = tracker
         self.publish_to_db = publish_to_db
         self.expected_values = expected_values or {}
+        self.adaptive = adaptive
+        self.micro = micro
+        self.counters = CounterGroup() if counters else None
+        self.resource_runs = resource_runs
+        self.executor = TimedExecutor()
 
     def validate_result(self, result: Any, part: int) -> bool:
         """Validate result against expected value if configured."""
@@ -108,13 +140,7 @@ class BenchmarkRunner:
             raise FileNotFoundError(f"Solution file not found: {module_path}")
 
         try:
-            spec = importlib.util.spec_from_file_location(module_name, module_path)
-            if spec is None or spec.loader is None:
-                raise ImportError(f"Could not load module spec for {module_path}")
-
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            return module
+            return get_module_registry().load(module_name, module_path)
         except Exception as e:
             raise ImportError(f"Failed to load module {module_path}: {e}")
 
@@ -125,9 +151,22 @@ class BenchmarkRunner:
         except Exception as e:
             raise RuntimeError(f"Failed to get input for {year} day {day}: {e}")
 
-    def publish_result_to_db(self, result: BenchmarkResult, input_data: str, code_content: str) -> None:
-        """Publish a benchmark result to the tracking database."""
-        if not self.tracker or not self.publish_to_db:
+    def get_puzzle_input(self, year: int, day: int) -> PuzzleInput:
+        """Get the memory-mapped input file for the given year and day."""
+        try:
+            return get_puzzle_input(year, day, sample=False)
+        except Exception as e:
+            raise RuntimeError(f"Failed to get input for {year} day {day}: {e}")
+
+    def publish_result_to_db(self, result: BenchmarkResult, input_data: Union[str, PuzzleInput],
+                             code_content: str) -> None:
+        """
+        Publish a benchmark result to the tracking database.
+
+        Micro results are never published: their per-call times come from hot
+        loops and would skew the comparisons with whole-call runs.
+        """
+        if not self.tracker or not self.publish_to_db or self.micro:
             return
 
         try:
@@ -135,46 +174,67 @@ class BenchmarkRunner:
                 year=result.year,
                 day=result.day,
                 part=result.part,
-                execution_time=result.execution_time,
+                # Parse time included, like the CLI's runs (see CommandHandlers.run_part)
+                execution_time=result.execution_time + (result.parse_time or 0.0),
                 result=result.result,
                 input_data=input_data,
                 code_content=code_content,
                 success=result.success,
                 error_message=result.error_message,
-                is_sample=False  # Benchmarks are always on real data
+                is_sample=False,  # Benchmarks are always on real data
+                parse_time=result.parse_time,
+                phases=result.phases,
+                counters=result.counters
             )
         except Exception as e:
             print(f"⚠️  Failed to publish benchmark result to database: {e}")
 
-    def run_single_benchmark(self, year: int, day: int, part: int,
-                           input_data: str, module: Any, timeout: float = 30.0) -> BenchmarkResult:
-        """Run a single benchmark for a specific part with timeout."""
-        import signal
-
-        def timeout_handler(signum, frame):
-            raise TimeoutError(f"Benchmark timed out after {timeout} seconds")
+    @contextmanager
+    def publishing(self) -> Iterator[None]:
+        """Batch the results published inside this block into a single database transaction."""
+        if not self.tracker or not self.publish_to_db:
+            yield
+            return
 
         try:
-            # Set up timeout (only on Unix systems)
-            if hasattr(signal, 'SIGALRM'):
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(int(timeout))
-
-            start_time = time.perf_counter()
+            with self.tracker.bulk():
+                yield
+        except sqlite3.Error as e:
+            print(f"⚠️  Failed to publish benchmark results to database: {e}")
 
+    def run_single_benchmark(self, year: int, day: int, part: int,
+                           input_data: str, module: Any, timeout: float = 30.0,
+                           parsed_input: ParsedInput = None, loops: int = 1,
+                           overhead: float = 0.0) -> BenchmarkResult:
+        """
+        Run a single benchmark for a specific part with timeout.
+
+        With parsed_input, the solve function gets the parsed value from the
+        module's parse hook and only the solve time is measured. With loops > 1
+        the sample calls the solve function loops times; overhead (seconds for
+        the whole sample) is subtracted and the time is reported per call.
+        With the runner's counters, the hardware events of the solve call are
+        counted too (per call with loops > 1).
+        """
+        try:
             if part == 1:
-                result = module.solve_part_1(input_data)
+                func = module.solve_part_1
             elif part == 2:
-                result = module.solve_part_2(input_data)
+                func = module.solve_part_2
             else:
                 raise ValueError(f"Invalid part number: {part}")
 
-            end_time = time.perf_counter()
-            execution_time = end_time - start_time
+            solve = batch(func, loops)
+            if self.counters:
+                solve = self.counters.counted(solve)
+                self.counters.reset()
 
-            # Cancel timeout
-            if hasattr(signal, 'SIGALRM'):
-                signal.alarm(0)
+            # Timed on the executor's worker thread, so fractional timeouts work from any thread
+            with record_phases() as phase_recorder:
+                timed = self.executor.call(solve, parsed_input.value if parsed_input else input_data, timeout)
+            counts = self.counters.read() if self.counters else None
+            result = timed.result
+            execution_time = timed.execution_time
 
             # Skip if too slow
             if execution_time > timeout:
@@ -189,6 +249,15 @@ class BenchmarkRunner:
                     validation_passed=None
                 )
 
+            # Per call in micro mode
+            phases = phase_recorder.durations() or None
+            if overhead or loops > 1:
+                execution_time = max(execution_time - overhead, 0.0) / loops
+                if phases:
+                    phases = {name: seconds / loops for name, seconds in phases.items()}
+                if counts:
+                    counts = {event: count / loops for event, count in counts.items()}
+
             # Validate result if expected value is configured
             validation_passed = None
             if part in self.expected_values:
@@ -201,13 +270,14 @@ class BenchmarkRunner:
                 success=True,
                 result=result,
                 execution_time=execution_time,
-                validation_passed=validation_passed
+                validation_passed=validation_passed,
+                parse_time=parsed_input.parse_time if parsed_input else None,
+                phases=phases,
+                loops=loops,
+                counters=counts
             )
 
         except Exception as e:
-            # Cancel timeout
-            if hasattr(signal, 'SIGALRM'):
-                signal.alarm(0)
             return BenchmarkResult(
                 year=year,
                 day=day,
@@ -219,25 +289,23 @@ class BenchmarkRunner:
                 validation_passed=None
             )
 
-    def benchmark_problem(self, year: int, day: int, part: int,
-                         runs: int = 10, warmup_runs: int = 3, timeout: float = 30.0) -> BenchmarkStats:
-        """Benchmark a specific problem multiple times."""
-        print(f"Benchmarking {year} Day {day} Part {part} ({runs} runs, {warmup_runs} warmup)...")
-
-        try:
-            module = self.load_solution_module(year, day)
-            input_data = self.get_input_data(year, day)
-
-            # Get code content for database publishing
-            code_content = ""
-            if self.publish_to_db:
-                module_path = Path.cwd() / f"{year}" / f"day{day}.py"
-                if module_path.exists():
-                    code_content = module_path.read_text()
-        except Exception as e:
-            print(f"❌ Failed to setup benchmark: {e}")
-            return BenchmarkStats(0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, [])
-
+    def measure(self, year: int, day: int, part: int, input_data: str, module: Any, timeout: float,
+                parsed_input: Optional[ParsedInput], puzzle_input: PuzzleInput,
+                code_content: str, loops: int = 1, overhead: float = 0.0) -> BenchmarkResult:
+        """Run one measured benchmark run, keeping and (if configured) publishing its result."""
+        result = self.run_single_benchmark(year, day, part, input_data, module, timeout, parsed_input,
+                                           loops, overhead)
+        self.results.append(result)
+
+        # Publish to database if configured
+        if self.publish_to_db:
+            self.publish_result_to_db(result, puzzle_input, code_content)
+        return result
+
+    def run_fixed(self, year: int, day: int, part: int, input_data: str, module: Any, timeout: float,
+                  parsed_input: Optional[ParsedInput], puzzle_input: PuzzleInput, code_content: str,
+                  runs: int, warmup_runs: int, loops: int = 1, overhead: float = 0.0) -> List[BenchmarkResult]:
+        """Run warmup_runs warmup runs, then runs measured runs (of loops calls each)."""
         all_results = []
 
         # Warmup runs with progress
@@ -245,7 +313,8 @@ class BenchmarkRunner:
             progress = create_progress_bar(i, warmup_runs, prefix="  Warmup: ")
             print_progress_update(progress)
 
-            result = self.run_single_benchmark(year, day, part, input_data, module, timeout)
+            result = self.run_single_benchmark(year, day, part, input_data, module, timeout, parsed_input,
+                                               loops, overhead)
             if result.success:
                 validation_indicator = ""
                 if result.validation_passed is not None:
@@ -261,28 +330,215 @@ class BenchmarkRunner:
         clear_current_line()
         print(f"  Warmup complete ({warmup_runs} runs)")
 
-        # Actual benchmark runs with progress
-        for i in range(runs):
-            progress = create_progress_bar(i, runs, prefix="  Benchmark: ")
-            print_progress_update(progress)
+        # Actual benchmark runs with progress; published runs are written in one batch at the end
+        with self.publishing():
+            for i in range(runs):
+                progress = create_progress_bar(i, runs, prefix="  Benchmark: ")
+                print_progress_update(progress)
+
+                result = self.measure(year, day, part, input_data, module, timeout, parsed_input,
+                                      puzzle_input, code_content, loops, overhead)
+                all_results.append(result)
+
+                if result.success:
+                    validation_indicator = ""
+                    if result.validation_passed is not None:
+                        validation_indicator = " ✅" if result.validation_passed else " ❌"
+                    print(f"  Run {i+1}/{runs}: {result.execution_time*1000:.3f}ms{validation_indicator}")
+                else:
+                    print_progress_update(f"  Run {i+1}/{runs}: ❌ {result.error_message}", overwrite=False)
 
-            result = self.run_single_benchmark(year, day, part, input_data, module, timeout)
-            all_results.append(result)
+        # Clear final progress line
+        clear_current_line()
+        return all_results
 
-            # Publish to database if configured
-            if self.publish_to_db:
-                self.publish_result_to_db(result, input_data, code_content)
+    def run_adaptive(self, year: int, day: int, part: int, input_data: str, module: Any, timeout: float,
+                     parsed_input: Optional[ParsedInput], puzzle_input: PuzzleInput,
+                     code_content: str, loops: int = 1, overhead: float = 0.0) -> List[BenchmarkResult]:
+        """
+        Warm up until timings stabilise, then measure until the median's CI is narrow enough.
+
+        Warmup ends once the medians of the last two stable_window runs agree
+        (or after max_warmup_runs runs or warmup_share of the time budget).
+        Measurement ends when the CI reaches target_width after at least
+        min_runs runs, at max_runs, when the next run would overrun the time
+        budget, or at the first failed run.
+        """
+        settings = self.adaptive
+        start = time.perf_counter()
+
+        warmup_times = []
+        while len(warmup_times) < settings.max_warmup_runs:
+            result = self.run_single_benchmark(year, day, part, input_data, module, timeout, parsed_input,
+                                               loops, overhead)
+            if not result.success:
+                print_progress_update(f"  Warmup {len(warmup_times) + 1}: ❌ {result.error_message}",
+                                      overwrite=False)
+                break
+            warmup_times.append(result.execution_time)
+            if (is_stable(warmup_times, settings.stable_window, settings.stable_tolerance)
+                    or time.perf_counter() - start >= settings.warmup_share * settings.time_budget):
+                break
+        clear_current_line()
+        print(f"  Warmup complete ({len(warmup_times)} runs)")
 
-            if result.success:
-                validation_indicator = ""
-                if result.validation_passed is not None:
-                    validation_indicator = " ✅" if result.validation_passed else " ❌"
-                print(f"  Run {i+1}/{runs}: {result.execution_time*1000:.3f}ms{validation_indicator}")
-            else:
-                print_progress_update(f"  Run {i+1}/{runs}: ❌ {result.error_message}", overwrite=False)
+        all_results = []
+        times = []  # successful run times, kept sorted
+        width = None
+        last_update = 0.0
+        with self.publishing():
+            while True:
+                result = self.measure(year, day, part, input_data, module, timeout, parsed_input,
+                                      puzzle_input, code_content, loops, overhead)
+                all_results.append(result)
+                if not result.success:
+                    print_progress_update(f"  Run {len(all_results)}: ❌ {result.error_message}", overwrite=False)
+                    reason = "failed run"
+                    break
+
+                bisect.insort(times, result.execution_time)
+                median = statistics.median(times)
+                width = relative_width(median_confidence_interval(times, settings.confidence), median)
+                elapsed = time.perf_counter() - start
+
+                if len(times) >= settings.min_runs and width is not None and width <= settings.target_width:
+                    reason = "CI target reached"
+                    break
+                if len(times) >= settings.max_runs:
+                    reason = "run limit reached"
+                    break
+                # A sample takes loops calls (plus the subtracted overhead)
+                if elapsed + median * loops + overhead > settings.time_budget:
+                    reason = "time budget reached"
+                    break
+
+                # Redraw the progress line a few times per second, not after every fast run
+                if elapsed - last_update >= 0.2:
+                    last_update = elapsed
+                    width_text = f"CI width {width:.1%}" if width is not None else "CI pending"
+                    print_progress_update(f"  Benchmark: {len(times)} runs, median {format_time(median)}, "
+                                          f"{width_text}")
 
-        # Clear final progress line
         clear_current_line()
+        width_text = f", CI width {width:.1%}" if width is not None else ""
+        print(f"  Measured {len(all_results)} runs in {format_time(time.perf_counter() - start)} "
+              f"({reason}{width_text})")
+        return all_results
+
+    def run_instrumented(self, year: int, day: int, part: int, input_data: str, module: Any, timeout: float,
+                         parsed_input: Optional[ParsedInput], runs: int) -> List[BenchmarkResult]:
+        """
+        Run the usage and traced passes of runs single calls each (see benchmarking.resources).
+
+        A pass stops at its first failed run, which is usually a timeout
+        under tracemalloc's slowdown.
+        """
+        func = getattr(module, f"solve_part_{part}")
+        solve_input = parsed_input.value if parsed_input else input_data
+
+        all_results = []
+        for name, instrument in (('usage', measure_usage), ('traced', measure_traced_peak)):
+            for i in range(runs):
+                print_progress_update(create_progress_bar(i, runs, prefix=f"  Instrumented ({name}): "))
+                usage = ResourceUsage()
+                try:
+                    timed = self.executor.call(instrument(func, usage), solve_input, timeout)
+                except Exception as e:
+                    clear_current_line()
+                    print(f"  Instrumented ({name}) run {i + 1}/{runs}: ❌ {e}")
+                    all_results.append(BenchmarkResult(year, day, part, False, None, 0.0, error_message=str(e),
+                                                       instrumented=name))
+                    break
+                all_results.append(BenchmarkResult(
+                    year=year,
+                    day=day,
+                    part=part,
+                    success=True,
+                    result=timed.result,
+                    execution_time=timed.execution_time,
+                    instrumented=name,
+                    cpu_time=usage.cpu_time,
+                    rss_delta=usage.rss_delta,
+                    allocated_blocks=usage.allocated_blocks,
+                    traced_peak=usage.traced_peak
+                ))
+
+        clear_current_line()
+        return all_results
+
+    def benchmark_problem(self, year: int, day: int, part: int,
+                         runs: int = 10, warmup_runs: int = 3, timeout: float = 30.0) -> BenchmarkStats:
+        """
+        Benchmark a specific problem multiple times.
+
+        In adaptive mode runs and warmup_runs are ignored: the runner's
+        AdaptiveSettings decide when warmup and measurement end.
+        """
+        adaptive = self.adaptive
+        if adaptive:
+            print(f"Benchmarking {year} Day {day} Part {part} (adaptive: until the median's "
+                  f"{adaptive.confidence:.0%} CI is within {adaptive.target_width:.0%}, "
+                  f"{format_time(adaptive.time_budget)} budget)...")
+        else:
+            print(f"Benchmarking {year} Day {day} Part {part} ({runs} runs, {warmup_runs} warmup)...")
+
+        try:
+            module = self.load_solution_module(year, day)
+            # Solutions get the decoded text; tracking reuses the file's cached hash
+            puzzle_input = self.get_puzzle_input(year, day)
+            input_data = puzzle_input.text
+
+            # Parse once up front; runs only measure the solve function
+            parsed_input = None
+            if has_parse_hook(module):
+                parsed_input = get_parsed_input_cache().get(module, input_data, self.executor, timeout)
+                print(f"  Parse: {format_time(parsed_input.parse_time)}"
+                      f"{' (cached)' if parsed_input.cached else ''}")
+
+            # Get code content for database publishing
+            code_content = ""
+            if self.publish_to_db:
+                module_path = Path.cwd() / f"{year}" / f"day{day}.py"
+                if module_path.exists():
+                    code_content = module_path.read_text()
+
+            # Calls per sample and the time the harness adds to a sample of that many calls
+            loops, overhead = 1, 0.0
+            if self.micro:
+                func = getattr(module, f"solve_part_{part}")
+                solve_input = parsed_input.value if parsed_input else input_data
+                loops = autorange(self.executor, func, solve_input, timeout)
+                overhead = harness_overhead(self.executor, loops, timeout)
+                print(f"  Micro: {loops} calls per sample, {overhead / loops * 1e9:.0f}ns harness overhead "
+                      f"per call subtracted")
+
+            # Counters count the thread they're opened on, so open them where the solve calls run
+            if self.counters:
+                self.executor.call(lambda _: self.counters.open(), None, timeout)
+        except Exception as e:
+            print(f"❌ Failed to setup benchmark: {e}")
+            return BenchmarkStats(0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, [])
+
+        if adaptive:
+            all_results = self.run_adaptive(year, day, part, input_data, module, timeout, parsed_input,
+                                            puzzle_input, code_content, loops, overhead)
+            runs = len(all_results)
+        else:
+            all_results = self.run_fixed(year, day, part, input_data, module, timeout, parsed_input,
+                                         puzzle_input, code_content, runs, warmup_runs, loops, overhead)
+
+        # Instrumented runs come after the measured ones and never count as measurements
+        instrumented = []
+        if self.resource_runs and any(r.success for r in all_results):
+            instrumented = [r for r in self.run_instrumented(year, day, part, input_data, module, timeout,
+                                                              parsed_input, self.resource_runs) if r.success]
+            usage_runs = sum(r.instrumented == 'usage' for r in instrumented)
+            print(f"  Instrumented: {usage_runs} usage and {len(instrumented) - usage_runs} traced runs "
+                  f"measuring CPU time and memory")
+
+        def instrumented_median(field: str) -> Optional[float]:
+            values = [getattr(r, field) for r in instrumented if getattr(r, field) is not None]
+            return statistics.median(values) if values else None
 
         # Calculate statistics
         successful_times = [r.execution_time for r in all_results if r.success]
@@ -297,6 +553,23 @@ class BenchmarkRunner:
             std_dev = statistics.stdev(successful_times) if len(successful_times) > 1 else 0.0
         else:
             min_time = max_time = mean_time = median_time = std_dev = 0.0
+        confidence = adaptive.confidence if adaptive else 0.95
+        median_ci = median_confidence_interval(sorted(successful_times), confidence)
+
+        # Median duration of each recorded phase
+        phase_times: Dict[str, List[float]] = {}
+        for r in all_results:
+            if r.success and r.phases:
+                for name, seconds in r.phases.items():
+                    phase_times.setdefault(name, []).append(seconds)
+        phases = {name: statistics.median(times) for name, times in phase_times.items()} or None
+
+        # Hardware event counts of the successful runs that got any
+        counters: Dict[str, List[float]] = {}
+        for r in all_results:
+            if r.success and r.counters:
+                for event, count in r.counters.items():
+                    counters.setdefault(event, []).append(count)
 
         # Calculate validation statistics
         validation_enabled = part in self.expected_values
@@ -320,7 +593,20 @@ class BenchmarkRunner:
             times=successful_times,
             validation_enabled=validation_enabled,
             validation_passed_count=validation_passed_count,
-            expected_value=expected_value
+            expected_value=expected_value,
+            parse_time=parsed_input.parse_time if parsed_input else None,
+            phases=phases,
+            median_ci=median_ci,
+            confidence=confidence if median_ci else None,
+            loops=loops,
+            harness_overhead=overhead / loops if self.micro else None,
+            counters=counters or None,
+            usage_runs=sum(r.instrumented == 'usage' for r in instrumented),
+            traced_runs=sum(r.instrumented == 'traced' for r in instrumented),
+            cpu_time=instrumented_median('cpu_time'),
+            rss_delta=instrumented_median('rss_delta'),
+            allocated_blocks=instrumented_median('allocated_blocks'),
+            traced_peak=instrumented_median('traced_peak')
         )
 
     def benchmark_day(self, year: int, day: int, runs: int = 5, timeout: float = 30.0) -> Dict[int, BenchmarkStats]:
@@ -380,7 +666,108 @@ class BenchmarkRunner:
 
         return results
 
-    def benchmark_year(self, year: int, runs: int = 3, timeout: float = 30.0) -> Dict[int, Dict[int, BenchmarkStats]]:
+    def get_day_files(self, year: int) -> List[Path]:
+        """Get the solution files for a year, sorted by day number."""
+        year_path = Path.cwd() / str(year)
+        day_files = [f for f in year_path.glob("day*.py")]
+
+        # Sort by day number (extract numeric part)
+        return sorted(day_files, key=lambda f: int(f.stem.replace('day', '')))
+
+    def collect_units(self, years: List[int]) -> List[BenchmarkUnit]:
+        """Collect every (year, day, part) problem that has a solve function."""
+        from core.solution_loader import SolutionLoader
+        loader = SolutionLoader()
+
+        units = []
+        for year in years:
+            for day_file in self.get_day_files(year):
+                day_num = int(day_file.stem.replace('day', ''))
+                try:
+                    module = self.load_solution_module(year, day_num)
+                except Exception as e:
+                    print(f"❌ Failed to load module for {year} Day {day_num}: {e}")
+                    continue
+
+                for part in loader.get_available_parts(module):
+                    units.append((year, day_num, part))
+
+        return units
+
+    def benchmark_parallel(self, years: List[int], runs: int, timeout: float, jobs: int,
+                           cpus: List[int] = None, pin_cpus: bool = False,
+                           warmup_runs: int = 3) -> Dict[int, Dict[int, Dict[int, BenchmarkStats]]]:
+        """Benchmark all problems of the given years concurrently in a process pool."""
+        return self.benchmark_units_parallel(self.collect_units(years), runs, timeout, jobs, cpus, pin_cpus,
+                                             warmup_runs)
+
+    def benchmark_units(self, units: List[BenchmarkUnit], runs: int, timeout: float, jobs: int = 1,
+                        cpus: List[int] = None, pin_cpus: bool = False,
+                        warmup_runs: int = 3) -> Dict[int, Dict[int, Dict[int, BenchmarkStats]]]:
+        """Benchmark the given problems, concurrently in a process pool if jobs > 1."""
+        if jobs > 1:
+            return self.benchmark_units_parallel(units, runs, timeout, jobs, cpus, pin_cpus, warmup_runs)
+
+        results: Dict[int, Dict[int, Dict[int, BenchmarkStats]]] = {}
+        for year, day, part in units:
+            stats = self.benchmark_problem(year, day, part, runs, warmup_runs, timeout)
+            results.setdefault(year, {}).setdefault(day, {})[part] = stats
+        return results
+
+    def benchmark_units_parallel(self, units: List[BenchmarkUnit], runs: int, timeout: float, jobs: int,
+                                 cpus: List[int] = None, pin_cpus: bool = False,
+                                 warmup_runs: int = 3) -> Dict[int, Dict[int, Dict[int, BenchmarkStats]]]:
+        """Benchmark the given problems concurrently in a process pool."""
+        if not units:
+            print("❌ No solutions found to benchmark")
+            return {}
+
+        executor = ParallelBenchmarkExecutor(jobs, cpus=cpus, pin_cpus=pin_cpus,
+                                             expected_values=self.expected_values, adaptive=self.adaptive,
+                                             micro=self.micro, counters=self.counters is not None,
+                                             resource_runs=self.resource_runs)
+
+        placement = ""
+        if executor.pin_cpus:
+            placement = f", pinned to CPUs {','.join(map(str, executor.cpus))}"
+        elif executor.cpus:
+            placement = f", restricted to CPUs {','.join(map(str, executor.cpus))}"
+        print(f"⚙️  Running {len(units)} problems on {executor.jobs} worker processes{placement}")
+
+        completed = [0]
+
+        def on_complete(unit: BenchmarkUnit, stats: BenchmarkStats, results: List[BenchmarkResult]) -> None:
+            year, day, part = unit
+            completed[0] += 1
+            self.results.extend(results)
+
+            if self.publish_to_db and results:
+                try:
+                    puzzle_input = self.get_puzzle_input(year, day)
+                    code_content = (Path.cwd() / f"{year}" / f"day{day}.py").read_text()
+                except Exception as e:
+                    print(f"⚠️  Failed to publish {year} Day {day} Part {part}: {e}")
+                else:
+                    with self.publishing():
+                        for result in results:
+                            self.publish_result_to_db(result, puzzle_input, code_content)
+
+            clear_current_line()
+            if stats.success_count > 0:
+                print(f"  {year} Day {day:2d} Part {part}: {stats.success_count}/{stats.runs} successful, "
+                      f"median: {format_time(stats.median_time)}")
+            else:
+                print(f"  {year} Day {day:2d} Part {part}: ❌ all runs failed")
+            if sys.stdout.isatty():
+                print_progress_update(create_progress_bar(completed[0], len(units), prefix="Overall Progress: "))
+
+        results = executor.run(units, runs, warmup_runs, timeout, on_complete=on_complete)
+        clear_current_line()
+        print(f"✅ Parallel benchmarking completed ({len(units)} problems)")
+        return results
+
+    def benchmark_year(self, year: int, runs: int = 3, timeout: float = 30.0, jobs: int = 1,
+                       cpus: List[int] = None, pin_cpus: bool = False) -> Dict[int, Dict[int, BenchmarkStats]]:
         """Benchmark all available solutions for a given year."""
         year_path = Path.cwd() / str(year)
         if not year_path.exists():
@@ -388,13 +775,15 @@ class BenchmarkRunner:
             return {}
 
         # Find all day files and sort by day number
-        day_files = [f for f in year_path.glob("day*.py")]
+        day_files = self.get_day_files(year)
         if not day_files:
             print(f"❌ No solution files found in {year_path}")
             return {}
 
-        # Sort by day number (extract numeric part)
-        day_files = sorted(day_files, key=lambda f: int(f.stem.replace('day', '')))
+        if jobs > 1:
+            results = self.benchmark_parallel([year], runs, timeout, jobs, cpus, pin_cpus).get(year, {})
+            self.print_year_summary(year, results)
+            return results
 
         results = {}
 
@@ -429,7 +818,8 @@ class BenchmarkRunner:
         self.print_year_summary(year, results)
         return results
 
-    def benchmark_all(self, runs: int = 3, timeout: float = 30.0) -> Dict[int, Dict[int, Dict[int, BenchmarkStats]]]:
+    def benchmark_all(self, runs: int = 3, timeout: float = 30.0, jobs: int = 1,
+                      cpus: List[int] = None, pin_cpus: bool = False) -> Dict[int, Dict[int, Dict[int, BenchmarkStats]]]:
         """Benchmark all available solutions across all years."""
         # Find all year directories and sort by year number
         year_dirs = [d for d in Path.cwd().iterdir()
@@ -440,6 +830,14 @@ class BenchmarkRunner:
             print("❌ No year directories found")
             return {}
 
+        if jobs > 1:
+            all_results = self.benchmark_parallel([int(d.name) for d in year_dirs], runs, timeout,
+                                                  jobs, cpus, pin_cpus)
+            for year, year_results in all_results.items():
+                self.print_year_summary(year, year_results)
+            self.print_overall_summary(all_results)
+            return all_results
+
         all_results = {}
 
         print(f"\n{'='*60}")
@@ -498,7 +896,49 @@ class BenchmarkRunner:
         print(f"  Slowest:      {format_time(stats.max_time)}")
         print(f"  Mean Time:    {format_time(stats.mean_time)}")
         print(f"  Median Time:  {format_time(stats.median_time)}")
+        if stats.median_ci:
+            print(f"  Median CI:    {format_time(stats.median_ci[0])} – {format_time(stats.median_ci[1])} "
+                  f"({stats.confidence:.0%}, width {stats.median_ci_width:.1%} of the median)")
         print(f"  Std Dev:      {format_time(stats.std_dev)}")
+        if stats.loops > 1 or stats.harness_overhead is not None:
+            print(f"  Per Call:     {stats.loops} calls per sample, "
+                  f"{(stats.harness_overhead or 0.0) * 1e9:.0f}ns harness overhead per call subtracted")
+        if stats.parse_time is not None:
+            print(f"  Parse Time:   {format_time(stats.parse_time)} (once, not included above)")
+        if stats.phases:
+            for name, seconds in stats.phases.items():
+                print(f"  Phase:        {format_time(seconds)} median  {name}")
+        if stats.cpu_time is not None:
+            # Instrumented runs are single calls, so per-call (micro) times don't compare with them
+            if stats.loops > 1 or stats.harness_overhead is not None:
+                share = " (single calls)"
+            elif stats.median_time:
+                share = f" ({stats.cpu_time / stats.median_time:.0%} of the median time)"
+            else:
+                share = ""
+            print(f"  CPU Time:     {format_time(stats.cpu_time)} median of {stats.usage_runs} usage runs{share}")
+        if stats.traced_peak is not None or stats.rss_delta is not None:
+            memory = []
+            if stats.traced_peak is not None:
+                memory.append(f"{format_bytes(stats.traced_peak)} traced peak of {stats.traced_runs} traced runs")
+            usage = []
+            if stats.rss_delta is not None:
+                usage.append(f"RSS {'+' if stats.rss_delta >= 0 else ''}{format_bytes(stats.rss_delta)}")
+            if stats.allocated_blocks is not None:
+                usage.append(f"{stats.allocated_blocks:+,.0f} blocks")
+            if usage:
+                memory.append(f"{', '.join(usage)} of {stats.usage_runs} usage runs")
+            print(f"  Memory:       {'; '.join(memory)} (medians)")
+        counts = stats.median_counters
+        if counts:
+            instructions, cycles = counts.get('instructions'), counts.get('cycles')
+            ipc = f", {instructions / cycles:.2f} IPC" if instructions and cycles else ""
+            print(f"  Counters:     {format_count(instructions or 0)} instructions, "
+                  f"{format_count(cycles or 0)} cycles{ipc} (median)")
+            if instructions:
+                print(f"                {counts.get('cache_misses', 0) / instructions * 1000:.2f} cache misses, "
+                      f"{counts.get('branch_misses', 0) / instructions * 1000:.2f} branch misses "
+                      f"per 1k instructions")
 
         # Show performance consistency
         if stats.mean_time > 0:
@@ -676,7 +1116,21 @@ class BenchmarkRunner:
                 'mean_time': stats.mean_time,
                 'median_time': stats.median_time,
                 'std_dev': stats.std_dev,
-                'times': stats.times
+                'parse_time': stats.parse_time,
+                'phases': stats.phases,
+                'median_ci': stats.median_ci,
+                'confidence': stats.confidence,
+                'loops': stats.loops,
+                'harness_overhead': stats.harness_overhead,
+                'counters': stats.median_counters,
+                'times': stats.times,
+                'counter_samples': stats.counters,
+                'usage_runs': stats.usage_runs,
+                'traced_runs': stats.traced_runs,
+                'cpu_time': stats.cpu_time,
+                'rss_delta': stats.rss_delta,
+                'allocated_blocks': stats.allocated_blocks,
+                'traced_peak': stats.traced_peak
             }
 
         # Convert BenchmarkStats to dictionaries for JSON serialization
@@ -697,6 +1151,9 @@ class BenchmarkRunner:
         with open(filename, 'w') as f:
             json.dump({
                 'timestamp': datetime.now().isoformat(),
+                'hardware': get_hardware_info(),
+                # How the times were measured, so a --baseline run can measure the same way
+                'mode': {'micro': self.micro, 'adaptive': asdict(self.adaptive) if self.adaptive else None},
                 'results': serializable_results
             }, f, indent=2)
 
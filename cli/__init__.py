@@ -5,9 +5,28 @@ This package contains:
 - Argument parsing
 - Command handling
 - Help generation
+
+Submodules are imported lazily on first attribute access.
 """
 
-from .parser import ArgumentParser
-from .handlers import CommandHandlers
+from importlib import import_module
+
+_LAZY_IMPORTS = {
+    'ArgumentParser': '.parser',
+    'CommandHandlers': '.handlers'
+}
 
 __all__ = ['ArgumentParser', 'CommandHandlers']
+
+
+def __getattr__(name: str):
+    """Import public names on first access so unused dependencies are never loaded."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,12 +4,23 @@ Command handlers for various CLI operations.
 import argparse
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Tuple, Any
+from typing import Optional, Tuple, Any, TYPE_CHECKING
 import re
 
-from core import AOCTracker, AOCSubmitter, SolutionLoader, InputHandler, is_last_day, get_required_stars_for_last_day_part2, has_animation, run_animation
-from utils import DisplayFormatter, StatsGenerator, MarkdownGenerator
-from benchmarking import BenchmarkRunner
+from core.tracker import AOCTracker
+from core.solution_loader import SolutionLoader
+from core.input_handler import InputHandler
+from core.year_config import is_last_day, get_required_stars_for_last_day_part2
+from core.animation import has_animation, run_animation
+from core.timed_executor import TimedExecutor
+from core.parsed_input import ParsedInput, get_parsed_input_cache, has_parse_hook
+from utils.display import DisplayFormatter
+from utils.phase_timer import record_phases
+
+if TYPE_CHECKING:
+    # The submitter pulls in requests and BeautifulSoup; only import it where it's used
+    from core.submitter import AOCSubmitter
+    from benchmarking.runner import BenchmarkRunner
 
 
 class CommandHandlers:
@@ -19,6 +30,7 @@ class CommandHandlers:
         self.display = DisplayFormatter()
         self.solution_loader = SolutionLoader()
         self.input_handler = InputHandler()
+        self.executor = TimedExecutor()
 
     def validate_output(self, result: Any, expected: str, part_num: int) -> bool:
         """
@@ -95,7 +107,211 @@ For more examples: python benchmarking/quick.py --examples
         """
         print(help_text)
 
-    def handle_sync(self, submitter: AOCSubmitter, tracker: AOCTracker, year: int, download_puzzle: bool = False) -> None:
+    def handle_benchmark_baseline(self, args: argparse.Namespace, runner: 'BenchmarkRunner',
+                                  parallel_options: dict) -> int:
+        """
+        Benchmark the problems of a saved results file and compare each with it.
+
+        Returns:
+            Process exit code: 1 if any problem regressed or the file can't be read, else 0
+        """
+        from benchmarking.baseline import compare_with_baseline, format_comparison_table, load_baseline
+        from core.regressions import SIGNIFICANCE
+        from utils.hardware_info import format_hardware_info_compact
+
+        try:
+            baseline = load_baseline(Path(args.baseline))
+        except (OSError, ValueError) as e:
+            print(f"❌ Failed to read baseline: {e}")
+            return 1
+        if baseline.skipped:
+            print(f"⚠️  Skipped {baseline.skipped} entries saved without their year or day")
+        problems = baseline.problems
+        if not problems:
+            print(f"❌ No benchmark results in {args.baseline}")
+            return 1
+
+        print(f"📏 Comparing {len(problems)} problems with {args.baseline}"
+              f"{f' from {baseline.timestamp}' if baseline.timestamp else ''}")
+        if baseline.hardware:
+            saved_on, running_on = format_hardware_info_compact(baseline.hardware), format_hardware_info_compact()
+            if saved_on != running_on:
+                print(f"⚠️  The baseline was measured on different hardware: {saved_on}")
+
+        # Measure the way the baseline was measured; per-call and whole-call times don't compare
+        if runner.micro != baseline.micro:
+            print(f"⚠️  The baseline was measured {'with' if baseline.micro else 'without'} --micro, "
+                  f"measuring the same way")
+            runner.micro = baseline.micro
+        if not baseline.mode_saved:
+            if runner.adaptive:
+                print("⚠️  The baseline doesn't record whether it was measured with --adaptive")
+        elif runner.adaptive != baseline.adaptive:
+            if baseline.adaptive:
+                print(f"⚠️  The baseline was measured with --adaptive (--ci-width "
+                      f"{baseline.adaptive.target_width * 100:g}, --time-budget {baseline.adaptive.time_budget:g}), "
+                      f"measuring the same way")
+            else:
+                print("⚠️  The baseline was measured without --adaptive, measuring the same way")
+            runner.adaptive = baseline.adaptive
+
+        results = runner.benchmark_units(problems, runs=args.runs, timeout=args.timeout,
+                                         warmup_runs=args.warmup, **parallel_options)
+        if args.save:
+            runner.save_benchmark_results(results, None if args.save == 'auto' else args.save)
+
+        comparisons = compare_with_baseline(baseline, results, threshold=1 + args.threshold / 100)
+        print("\n" + format_comparison_table(comparisons))
+
+        regressions = [c for c in comparisons if c.is_regression]
+        counts = {}
+        for comparison in comparisons:
+            counts[comparison.status] = counts.get(comparison.status, 0) + 1
+        print("\n📊 " + ", ".join(f"{count} {status}" for status, count in sorted(counts.items())))
+        if regressions:
+            print(f"❌ {len(regressions)} of {len(comparisons)} problems regressed "
+                  f"(slower by {args.threshold:g}% or more at p < {SIGNIFICANCE}, or failing)")
+            return 1
+        print("✅ No regressions against the baseline")
+        return 0
+
+    def handle_prefetch(self, args: argparse.Namespace) -> int:
+        """
+        Download all missing puzzle inputs concurrently.
+
+        Returns:
+            Process exit code: 1 if any download failed, else 0
+        """
+        from core.prefetch import InputPrefetcher
+
+        if args.base_url:
+            self.input_handler.base_url = args.base_url.rstrip("/")
+
+        years = args.years
+        if not years:
+            years = sorted(int(d.name) for d in Path.cwd().iterdir() if d.is_dir() and d.name.isdigit())
+
+        try:
+            prefetcher = InputPrefetcher(self.input_handler, workers=args.workers, rate=args.rate,
+                                         burst=args.burst, retries=args.retries, backoff=args.backoff)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+
+        targets = prefetcher.find_missing(years, released=args.released)
+        if not targets:
+            print("✅ All inputs are already downloaded")
+            return 0
+
+        print(f"📥 {len(targets)} missing inputs for {', '.join(map(str, years))}")
+        if args.dry_run:
+            for year, day in targets:
+                print(f"  {self.input_handler.get_input_filename(year, day, False)}")
+            return 0
+
+        print(f"   Downloading with {prefetcher.workers} workers at up to {args.rate:g} requests/s "
+              f"from {self.input_handler.base_url}")
+
+        def on_complete(result) -> None:
+            label = f"{result.year} Day {result.day:2d}"
+            if result.status == 'downloaded':
+                retried = f" after {result.attempts} attempts" if result.attempts > 1 else ""
+                print(f"  ✅ {label}: {result.size:,} bytes{retried}")
+            elif result.status == 'unavailable':
+                print(f"  ⚠️  {label}: {result.error_message}")
+            elif result.status == 'failed':
+                print(f"  ❌ {label}: {result.error_message}")
+
+        results = prefetcher.prefetch(targets, on_complete=on_complete)
+
+        counts = {}
+        for result in results:
+            counts[result.status] = counts.get(result.status, 0) + 1
+
+        print(f"\n📊 Downloaded {counts.get('downloaded', 0)}/{len(results)} inputs", end="")
+        extra = [f"{counts[status]} {status}" for status in ('unavailable', 'failed', 'skipped') if counts.get(status)]
+        print(f" ({', '.join(extra)})" if extra else "")
+
+        if counts.get('skipped') or any(r.error_message and 'cookie' in r.error_message for r in results):
+            print("❌ The session cookie was rejected; update session_cookie.txt and run again")
+
+        return 1 if counts.get('failed') or counts.get('skipped') else 0
+
+    def handle_export(self, args: argparse.Namespace) -> int:
+        """
+        Export the tracking database and saved benchmark samples to a columnar directory.
+
+        Returns:
+            Process exit code
+        """
+        try:
+            from utils.columnar import export_tracking_data
+        except ImportError:
+            print("❌ Exporting requires numpy (pip install numpy)")
+            return 1
+
+        db_path = Path(args.db) if args.db else Path.cwd() / "aoc_tracking.db"
+        if not db_path.exists():
+            print(f"❌ No tracking database at {db_path}")
+            return 1
+        missing = [name for name in args.benchmark_files if not Path(name).exists()]
+        if missing:
+            print(f"❌ Benchmark results not found: {', '.join(missing)}")
+            return 1
+
+        output = Path(args.output)
+        try:
+            counts = export_tracking_data(db_path, output, [Path(name) for name in args.benchmark_files],
+                                          year=args.year, chunk_rows=args.chunk_rows)
+        except FileExistsError:
+            print(f"❌ {output} already exists, choose another --output or remove it")
+            return 1
+
+        print(f"✅ Exported {counts['runs']:,} runs, {counts['phases']:,} phases and "
+              f"{counts['samples']:,} benchmark samples to {output}/")
+        return 0
+
+    def handle_tracker(self, args: argparse.Namespace) -> int:
+        """
+        Run a tracking database maintenance action.
+
+        Returns:
+            Process exit code of the action
+        """
+        if args.tracker_command == 'audit':
+            from utils.query_audit import run_query_audit
+            db_path = Path(args.db) if args.db else None
+            return run_query_audit(rows=args.rows, db_path=db_path, verbose=args.verbose)
+
+        if args.tracker_command == 'bench-best-times':
+            from utils.query_audit import run_best_times_benchmark
+            return run_best_times_benchmark(runs_per_problem=args.runs_per_problem,
+                                            years=args.years or (2025,), repeat=args.repeat)
+
+        if args.tracker_command == 'compact':
+            db_path = Path(args.db) if args.db else Path.cwd() / "aoc_tracking.db"
+            if not db_path.exists():
+                print(f"❌ No tracking database at {db_path}")
+                return 1
+            tracker = AOCTracker(db_path)
+            try:
+                summary = tracker.compact(keep_days=args.keep_days, keep_latest=args.keep_latest,
+                                          dry_run=args.dry_run, vacuum=not args.no_vacuum)
+            finally:
+                tracker.close()
+
+            action = "Would fold" if args.dry_run else "Folded"
+            print(f"🔧 {action} {summary['runs_removed']:,} of {summary['runs_before']:,} runs "
+                  f"into {summary['buckets']:,} histogram buckets")
+            if not args.dry_run:
+                print(f"   Database size: {summary['size_before'] / 1024:,.0f} KiB → "
+                      f"{summary['size_after'] / 1024:,.0f} KiB")
+            return 0
+
+        print(f"❌ Unknown tracker action: {args.tracker_command}")
+        return 1
+
+    def handle_sync(self, submitter: 'AOCSubmitter', tracker: AOCTracker, year: int, download_puzzle: bool = False) -> None:
         """Sync completed problems from AOC website for the specified year."""
         print(f"🔄 Syncing completed problems for {year}...")
         print(f"Fetching completion data from adventofcode.com...")
@@ -137,6 +353,8 @@ For more examples: python benchmarking/quick.py --examples
 
     def handle_stats(self, tracker: AOCTracker, year_filter: Optional[int] = None) -> None:
         """Generate and display statistics."""
+        from utils.stats import StatsGenerator
+
         stats_gen = StatsGenerator(tracker)
 
         print("=" * 60)
@@ -148,8 +366,25 @@ For more examples: python benchmarking/quick.py --examples
 
         stats_content = overall_stats + "\n" + year_stats
         print(stats_content)
+
+        regressions = stats_gen.generate_regressions_table(year_filter)
+        if regressions:
+            print("\n" + regressions)
         print("=" * 60)
 
+    def handle_regressions(self, tracker: AOCTracker, year_filter: Optional[int] = None,
+                           show_all: bool = False) -> None:
+        """Compare every problem's current code version with the previous one and report slowdowns."""
+        from utils.stats import StatsGenerator
+
+        table = StatsGenerator(tracker).generate_regressions_table(year_filter, show_all=show_all)
+        if table:
+            print(table)
+        elif show_all:
+            print("No problem has runs of more than one code version on the same input.")
+        else:
+            print("✅ No significant slowdowns between code versions.")
+
     def handle_update_readme(self, tracker: AOCTracker) -> None:
         """Update README.md with the latest statistics."""
         readme_path = Path.cwd() / "README.md"
@@ -157,6 +392,8 @@ For more examples: python benchmarking/quick.py --examples
             print("❌ README.md not found")
             return
 
+        from utils.stats import StatsGenerator
+
         stats_gen = StatsGenerator(tracker)
 
         # Generate stats content
@@ -186,6 +423,8 @@ For more examples: python benchmarking/quick.py --examples
     def handle_update_markdown(self, tracker: AOCTracker, year: Optional[int] = None,
                               day: Optional[int] = None, update_all: bool = False) -> None:
         """Update markdown files based on specified scope."""
+        from utils.markdown_generator import MarkdownGenerator
+
         md_gen = MarkdownGenerator(tracker)
 
         if update_all:
@@ -222,6 +461,20 @@ For more examples: python benchmarking/quick.py --examples
 
             print(f"{timestamp} | Part {run['part']} | {success} | {execution_time:.2f}ms | {result_preview}")
 
+            # Parse and phase breakdown, if the solution recorded any
+            breakdown = []
+            if run['parse_time_ms'] is not None:
+                breakdown.append(f"parse {run['parse_time_ms']:.2f}ms")
+            breakdown.extend(f"{name} {duration:.2f}ms" for name, duration in run['phases'].items())
+            if breakdown:
+                print(f"    {' | '.join(breakdown)}")
+
+            # Hardware event counts of benchmark runs with --counters
+            if run['counters']:
+                from benchmarking.counters import format_count
+                counts = [f"{format_count(count)} {event.replace('_', ' ')}" for event, count in run['counters'].items()]
+                print(f"    {' | '.join(counts)}")
+
     def get_input_data(self, args: argparse.Namespace) -> str:
         """Get input data based on command line arguments."""
         if args.sample_input:
@@ -230,27 +483,40 @@ For more examples: python benchmarking/quick.py --examples
 
         return self.input_handler.get_input(args.year, args.day, args.sample or args.sample_input)
 
-    def run_part(self, module: Any, part_num: int, input_data: str, year: int, day: int,
-                tracker: Optional[AOCTracker], submitter: Optional[AOCSubmitter],
-                should_submit: bool, is_sample: bool, timeout: Optional[float] = None,
-                expected_value: Optional[str] = None) -> Tuple[bool, float, Any]:
-        """Run a single part of the solution with optional timeout."""
-        from time import perf_counter
+    def get_code_content(self, module: Any, year: int, day: int) -> str:
+        """Get the source of a solution module, as hashed by the tracker."""
         import inspect
-        import threading
 
-        # Get the code content for tracking
-        code_content = ""
         try:
-            code_content = inspect.getsource(module)
+            return inspect.getsource(module)
         except (OSError, TypeError):
             # Fallback: try to read the file directly
             try:
                 module_path = Path.cwd() / f"{year}" / f"day{day}.py"
                 if module_path.exists():
-                    code_content = module_path.read_text()
+                    return module_path.read_text()
             except Exception:
                 pass
+        return ""
+
+    def run_part(self, module: Any, part_num: int, input_data: str, year: int, day: int,
+                tracker: Optional[AOCTracker], submitter: Optional['AOCSubmitter'],
+                should_submit: bool, is_sample: bool, timeout: Optional[float] = None,
+                expected_value: Optional[str] = None, isolate: bool = False,
+                memory_limit_mb: Optional[int] = None,
+                parsed_input: Optional[ParsedInput] = None) -> Tuple[bool, float, Any]:
+        """
+        Run a single part of the solution with optional timeout.
+
+        With isolate, the part runs in a forked child process that is killed on
+        timeout and limited to memory_limit_mb of address space (see core.isolation).
+        With parsed_input (from the module's parse hook), the solve function gets
+        the parsed value instead of the raw input. The part's run time then
+        includes the parse time, as it did when each part parsed the input
+        itself, so it stays comparable with earlier runs; parse_time_ms is
+        tracked as its breakdown. The returned time is the solve time only.
+        """
+        code_content = self.get_code_content(module, year, day)
 
         try:
             func_name = f"solve_part_{part_num}"
@@ -261,44 +527,30 @@ For more examples: python benchmarking/quick.py --examples
             func = getattr(module, func_name)
 
             # Execute function with optional timeout
-            result = None
-            elapsed_time = 0.0
-            exception = None
-
-            if timeout is not None and timeout > 0:
-                # Use threading for cross-platform timeout support
-                result_container = [None]
-                exception_container = [None]
-
-                def run_func():
-                    try:
-                        result_container[0] = func(input_data)
-                    except Exception as e:
-                        exception_container[0] = e
-
-                start_time = perf_counter()
-                thread = threading.Thread(target=run_func, daemon=True)
-                thread.start()
-                thread.join(timeout)
-                end_time = perf_counter()
-                elapsed_time = end_time - start_time
-
-                if thread.is_alive():
-                    # Timeout occurred
-                    raise TimeoutError(f"Solution execution timed out after {timeout} seconds")
-
-                if exception_container[0]:
-                    raise exception_container[0]
-
-                result = result_container[0]
+            if isolate:
+                executor = TimedExecutor('process', memory_limit_mb=memory_limit_mb)
             else:
-                # No timeout - run directly
-                start_time = perf_counter()
-                result = func(input_data)
-                end_time = perf_counter()
-                elapsed_time = end_time - start_time
-
-            self.display.print_part_result(part_num, result, elapsed_time, tracker, year, day, code_content)
+                executor = self.executor
+            solve_input = parsed_input.value if parsed_input else input_data
+            with record_phases() as phase_recorder:
+                timed = executor.call(func, solve_input, timeout)
+            result = timed.result
+            elapsed_time = timed.execution_time
+            run_time = elapsed_time + (parsed_input.parse_time if parsed_input else 0.0)
+            peak_memory = timed.peak_rss
+            phases = phase_recorder.durations()
+
+            self.display.print_part_result(part_num, result, run_time, tracker, year, day, code_content,
+                                           peak_memory=peak_memory)
+            if phases:
+                self.display.print_phases(phases)
+
+            # Warn when this code version is significantly slower than the previous one
+            if tracker and not is_sample:
+                version_comparison = tracker.get_version_comparison(year, day, part_num, code_content,
+                                                                    input_data, run_time * 1000)
+                if version_comparison and version_comparison.is_regression:
+                    self.display.print_regression(version_comparison)
 
             # Validate output if expected value is provided
             validation_passed = True
@@ -311,12 +563,14 @@ For more examples: python benchmarking/quick.py --examples
                     year=year,
                     day=day,
                     part=part_num,
-                    execution_time=elapsed_time,
+                    execution_time=run_time,
                     result=str(result),
                     input_data=input_data,
                     code_content=code_content,
                     success=True,
-                    is_sample=is_sample
+                    is_sample=is_sample,
+                    parse_time=parsed_input.parse_time if parsed_input else None,
+                    phases=phases
                 )
 
             # Handle submission if requested
@@ -345,7 +599,138 @@ For more examples: python benchmarking/quick.py --examples
 
             return False, 0.0, None
 
-    def handle_submission(self, submitter: AOCSubmitter, tracker: Optional[AOCTracker],
+    def handle_run(self, args: argparse.Namespace, module: Any, input_data: str,
+                   tracker: Optional[AOCTracker], submitter: Optional['AOCSubmitter']) -> None:
+        """Run the requested parts of a loaded solution and print the results."""
+        is_sample = args.sample or bool(args.sample_input)
+
+        # Print header
+        title = self.display.format_title(args.year, args.day, is_sample, args.part)
+        self.display.print_header(title)
+
+        total_time = 0.0
+
+        # Determine which parts to run based on availability
+        available_parts = self.solution_loader.get_available_parts(module)
+
+        if not available_parts:
+            print(f"❌ No solve_part functions found in the solution file")
+            return
+
+        # Run requested parts
+        parts_to_run = []
+        if args.part is not None:
+            # Specific part requested
+            if args.part in available_parts:
+                parts_to_run = [args.part]
+            else:
+                print(f"❌ Part {args.part} is not available. Available parts: {', '.join(map(str, available_parts))}")
+                return
+        else:
+            # No specific part requested, run all available parts
+            parts_to_run = available_parts
+
+        # Determine timeout setting
+        timeout = None if args.no_timeout else args.timeout
+
+        # Isolated execution (a memory limit implies it)
+        memory_limit_mb = getattr(args, 'memory_limit', None)
+        isolate = getattr(args, 'isolate', False) or memory_limit_mb is not None
+        if isolate:
+            from core.isolation import is_isolation_supported
+            if not is_isolation_supported():
+                print("⚠️  Isolated execution needs fork() and is not available on this platform, "
+                      "running in-process")
+                isolate = False
+                memory_limit_mb = None
+
+        # Get expected values if provided
+        expected_values = {}
+        if hasattr(args, 'expected') and args.expected:
+            # Single expected value - use for the part being run
+            if args.part:
+                expected_values[args.part] = args.expected
+        if hasattr(args, 'expected_p1') and args.expected_p1:
+            expected_values[1] = args.expected_p1
+        if hasattr(args, 'expected_p2') and args.expected_p2:
+            expected_values[2] = args.expected_p2
+
+        # Check for animation request
+        if args.animation:
+            if has_animation(module):
+                print("\n🎬 Running animation...")
+                print("🎮 Press Ctrl+C to stop the animation")
+                print()
+
+                try:
+                    speed = 1.0  # Default speed
+                    export_gif = args.export_gif if hasattr(args, 'export_gif') else None
+
+                    animation = run_animation(module, input_data, speed, export_gif)
+
+                    if animation:
+                        print("\n✅ Animation completed!")
+                    else:
+                        print("\n❌ Animation failed to run")
+                except KeyboardInterrupt:
+                    print("\n🛑 Animation stopped by user")
+                except Exception as e:
+                    print(f"\n❌ Animation error: {e}")
+            else:
+                print(f"❌ No animation available for {args.year} Day {args.day}")
+                print("   Animations require the solution file to have a 'create_animation' function")
+            return
+
+        # Reuse the results of previous runs of this code on this input (--cached)
+        cached_results = {}
+        if getattr(args, 'cached', False) and not getattr(args, 'refresh', False):
+            if tracker is None or is_sample:
+                print("⚠️  --cached needs tracking and the actual input, running the parts")
+            else:
+                code_content = self.get_code_content(module, args.year, args.day)
+                for part_num in parts_to_run:
+                    cached = tracker.get_cached_result(args.year, args.day, part_num, code_content, input_data)
+                    if cached:
+                        cached_results[part_num] = cached
+
+        # Parse once for both parts if the solution has a parse hook
+        parsed_input = None
+        if has_parse_hook(module) and len(cached_results) < len(parts_to_run):
+            try:
+                parsed_input = get_parsed_input_cache().get(module, input_data, self.executor, timeout)
+            except Exception as e:
+                self.display.print_parse_error(e)
+                self.display.print_footer(total_time)
+                return
+
+            self.display.print_parse_result(parsed_input.parse_time, parsed_input.cached)
+            if not parsed_input.cached:
+                total_time += parsed_input.parse_time
+
+        # Run the determined parts
+        for part_num in parts_to_run:
+            expected_value = expected_values.get(part_num)
+            if part_num in cached_results:
+                # Not recorded as a run: it took no time and would skew the timing stats
+                cached_result = cached_results[part_num]['result']
+                self.display.print_cached_result(part_num, cached_results[part_num])
+                if expected_value is not None:
+                    self.validate_output(cached_result, expected_value, part_num)
+                if args.submit and submitter:
+                    self.handle_submission(submitter, tracker, args.year, args.day, part_num, cached_result)
+                continue
+
+            success, elapsed, result = self.run_part(module, part_num, input_data, args.year, args.day,
+                                              tracker, submitter, args.submit, is_sample, timeout, expected_value,
+                                              isolate=isolate, memory_limit_mb=memory_limit_mb,
+                                              parsed_input=parsed_input)
+            if success:
+                total_time += elapsed
+
+        # Print footer with total time
+        self.display.print_footer(total_time)
+
+    def handle_submission(self, submitter: 'AOCSubmitter', tracker: Optional[AOCTracker],
                          year: int, day: int, part: int, answer: Any) -> None:
         """Handle answer submission to AOC."""
         # Add a note for last day part 2 submissions
@@ -11,7 +11,8 @@ class ArgumentParser:
     def setup_parser(self) -> argparse.ArgumentParser:
         """Set up and return the command line argument parser."""
         # Check if first argument is a known subcommand
-        subcommands = ['sync', 'benchmark', 'stats', 'markdown', 'animation']
+        subcommands = ['sync', 'benchmark', 'stats', 'markdown', 'animation', 'serve', 'prefetch', 'tracker',
+                       'regressions', 'export']
         has_subcommand = len(sys.argv) > 1 and sys.argv[1] in subcommands
 
         if has_subcommand:
@@ -37,10 +38,17 @@ Examples:
   python main.py 2025 1 --expected-p1 123 --expected-p2 456
   python main.py 2025 1 --part 1 --expected 123
   
+  # Run through a warm solution daemon
+  python main.py serve                           # Start the daemon (in another terminal)
+  python main.py 2025 1 --daemon                 # Run using the daemon
+  
   # Other commands (use subcommands):
   python main.py sync 2025                       # Sync year 2025 from AOC website
+  python main.py prefetch                        # Download all missing inputs
   python main.py benchmark 2025 1                # Benchmark day 1
   python main.py stats                           # Show statistics
+  python main.py regressions                     # Find solutions that got slower
+  python main.py export                          # Columnar export for offline analysis
   python main.py markdown --all                  # Update all markdown
             """
         )
@@ -62,10 +70,20 @@ Examples:
                            help="disable run tracking and performance comparison")
         parser.add_argument("--history", action="store_true",
                            help="show recent run history for this problem")
+        parser.add_argument("--cached", action="store_true",
+                           help="reuse the result of a previous successful run of the same code "
+                                "on the same input instead of running the part")
+        parser.add_argument("--refresh", action="store_true",
+                           help="with --cached: run the parts anyway")
         parser.add_argument("--timeout", type=float, default=5.0,
                            help="timeout for solution execution in seconds (default: 5.0)")
         parser.add_argument("--no-timeout", action="store_true",
                            help="disable timeout for solution execution")
+        parser.add_argument("--isolate", action="store_true",
+                           help="run each part in a separate process that is killed on timeout "
+                                "and reports peak memory (POSIX only)")
+        parser.add_argument("--memory-limit", type=int, metavar="MB",
+                           help="cap the memory of each part at MB megabytes (implies --isolate)")
         parser.add_argument("--expected", type=str,
                            help="expected output value to validate against")
         parser.add_argument("--expected-p1", type=str,
@@ -76,6 +94,11 @@ Examples:
                            help="run animation if available for this solution")
         parser.add_argument("--export-gif", type=str, metavar="FILENAME",
                            help="export animation as GIF to specified filename (requires --animation)")
+        parser.add_argument("--daemon", "-d", action="store_true",
+                           help="run through the solution daemon (start it with 'python main.py serve')")
+
+        from utils.startup_profile import add_profile_arguments
+        add_profile_arguments(parser)
 
         return parser
 
@@ -105,7 +128,13 @@ Examples:
   python main.py benchmark 2025 1 --part 1     # Benchmark only part 1
   python main.py benchmark --year 2025         # Benchmark all of 2025
   python main.py benchmark --all               # Benchmark everything
+  python main.py benchmark --all --jobs 4      # Benchmark everything on 4 processes
+  python main.py benchmark 2025 1 --adaptive   # Run until the median is known within 5%
+  python main.py benchmark 2016 19 --micro     # Per-call times of a microsecond solution
+  python main.py benchmark 2015 18 --counters  # Instructions, cycles and cache misses per run
+  python main.py benchmark 2015 20 --resources # CPU time and memory use in extra instrumented runs
   python main.py benchmark 2025 1 --save       # Save results to file
+  python main.py benchmark --baseline FILE     # Compare with saved results, exit 1 on regressions
   python main.py benchmark 2025 1 --publish    # Publish to database
   
   # With validation
@@ -126,8 +155,37 @@ Examples:
                                      help="number of warmup runs (default: 3)")
         benchmark_parser.add_argument("--timeout", type=float, default=30.0,
                                      help="timeout for individual benchmark runs in seconds (default: 30)")
+        benchmark_parser.add_argument("--adaptive", action="store_true",
+                                     help="instead of --runs/--warmup, warm up until timings stabilise and "
+                                          "measure until the median's 95%% confidence interval is narrow enough")
+        benchmark_parser.add_argument("--ci-width", type=float, default=5.0, metavar="PCT",
+                                     help="with --adaptive: target width of the median's confidence interval "
+                                          "in percent of the median (default: 5)")
+        benchmark_parser.add_argument("--time-budget", type=float, default=10.0, metavar="SECONDS",
+                                     help="with --adaptive: time limit per part, warmup included (default: 10)")
+        benchmark_parser.add_argument("--micro", action="store_true",
+                                     help="time calibrated batches of calls per sample and report the time per call, "
+                                          "for solutions that finish in microseconds")
+        benchmark_parser.add_argument("--counters", action="store_true",
+                                     help="also count instructions, cycles, cache misses and branch misses "
+                                          "of every run with hardware performance counters (Linux only)")
+        benchmark_parser.add_argument("--resources", type=int, nargs='?', const=3, default=0, metavar="N",
+                                     help="after the timed runs, measure CPU time, memory peak, allocations and RSS "
+                                          "growth in N more runs per instrumented pass (default N: 3)")
+        benchmark_parser.add_argument("--jobs", "-j", type=int, default=1,
+                                     help="number of worker processes for --all/--year benchmarks (default: 1)")
+        benchmark_parser.add_argument("--cpus", type=str, metavar="LIST",
+                                     help="restrict benchmark workers to these CPUs, e.g. '0-3,6' (Linux only)")
+        benchmark_parser.add_argument("--pin-cpus", action="store_true",
+                                     help="pin each benchmark worker to its own dedicated CPU (Linux only)")
         benchmark_parser.add_argument("--save", type=str, nargs='?', const='auto',
                                      help="save benchmark results to file (optional filename)")
+        benchmark_parser.add_argument("--baseline", type=str, metavar="FILE",
+                                     help="benchmark the problems of results saved with --save, compare each with "
+                                          "them and exit with 1 if any regressed")
+        benchmark_parser.add_argument("--threshold", type=float, default=10.0, metavar="PCT",
+                                     help="with --baseline: slowdown of the median, in percent, at which a "
+                                          "significant slowdown counts as a regression (default: 10)")
         benchmark_parser.add_argument("--publish", action="store_true",
                                      help="publish benchmark results to tracking database (auto-updates markdown)")
         benchmark_parser.add_argument("--help-full", action="store_true",
@@ -150,6 +208,16 @@ Examples:
         stats_parser.add_argument("--no-tracking", action="store_true",
                                  help="disable run tracking and performance comparison")
 
+        # REGRESSIONS subcommand
+        regressions_parser = subparsers.add_parser('regressions',
+                                                   help='Find problems whose latest code version got slower')
+        regressions_parser.add_argument("--year", type=int,
+                                       help="only check problems of this year")
+        regressions_parser.add_argument("--all", action="store_true",
+                                       help="list every version comparison, not only regressions")
+        regressions_parser.add_argument("--no-tracking", action="store_true",
+                                       help="disable run tracking and performance comparison")
+
         # MARKDOWN subcommand
         markdown_parser = subparsers.add_parser('markdown', help='Update markdown documentation')
         markdown_parser.add_argument("--all", action="store_true",
@@ -178,4 +246,119 @@ Examples:
         animation_parser.add_argument("--no-tracking", action="store_true",
                                      help="disable run tracking and performance comparison")
 
+        # SERVE subcommand
+        serve_parser = subparsers.add_parser('serve',
+                                             help='Start a solution daemon that keeps modules and inputs loaded')
+        serve_parser.add_argument("--port", type=int, default=0,
+                                 help="local port to listen on (default: pick a free port)")
+        serve_parser.add_argument("--stop", action="store_true",
+                                 help="stop the running daemon")
+        serve_parser.add_argument("--status", action="store_true",
+                                 help="check whether a daemon is running")
+        serve_parser.add_argument("--no-tracking", action="store_true",
+                                 help="disable run tracking and performance comparison")
+
+        # PREFETCH subcommand
+        prefetch_parser = subparsers.add_parser('prefetch',
+                                                help='Download all missing puzzle inputs concurrently',
+                                                formatter_class=argparse.RawDescriptionHelpFormatter,
+                                                epilog="""
+Examples:
+  python main.py prefetch                      # Inputs for every solution file
+  python main.py prefetch --year 2025          # Inputs for 2025 solutions only
+  python main.py prefetch --year 2024 --released   # Every released 2024 puzzle
+  python main.py prefetch --dry-run            # List what would be downloaded
+                                                """)
+        prefetch_parser.add_argument("--year", type=int, action="append", dest="years", metavar="YEAR",
+                                    help="only prefetch this year (can be repeated; default: all year folders)")
+        prefetch_parser.add_argument("--released", action="store_true",
+                                    help="include every released puzzle, not only days with a solution file")
+        prefetch_parser.add_argument("--workers", type=int, default=4,
+                                    help="number of concurrent downloads (default: 4)")
+        prefetch_parser.add_argument("--rate", type=float, default=1.0,
+                                    help="maximum requests per second across all workers (default: 1.0)")
+        prefetch_parser.add_argument("--burst", type=int, default=1,
+                                    help="requests that may be sent back-to-back (default: 1)")
+        prefetch_parser.add_argument("--retries", type=int, default=3,
+                                    help="retries per input on rate limiting or server errors (default: 3)")
+        prefetch_parser.add_argument("--backoff", type=float, default=1.0,
+                                    help="initial retry delay in seconds, doubled on each retry (default: 1.0)")
+        prefetch_parser.add_argument("--base-url", type=str, default=None,
+                                    help="download from this server instead of adventofcode.com (e.g. a local stub)")
+        prefetch_parser.add_argument("--dry-run", action="store_true",
+                                    help="only list the inputs that would be downloaded")
+        prefetch_parser.add_argument("--no-tracking", action="store_true",
+                                    help="disable run tracking and performance comparison")
+
+        # EXPORT subcommand
+        export_parser = subparsers.add_parser('export',
+                                              help='Export runs and benchmark samples to NumPy column files',
+                                              formatter_class=argparse.RawDescriptionHelpFormatter,
+                                              epilog="""
+Examples:
+  python main.py export                        # Write tracking_export/
+  python main.py export --year 2025 --output runs_2025
+  python main.py export --benchmark benchmark_results_*.json   # Include saved benchmark samples
+                                              """)
+        export_parser.add_argument("--output", type=str, default="tracking_export", metavar="DIR",
+                                  help="directory to create (default: tracking_export)")
+        export_parser.add_argument("--db", type=str, metavar="PATH",
+                                  help="tracking database to export (default: aoc_tracking.db)")
+        export_parser.add_argument("--year", type=int,
+                                  help="only export runs of this year")
+        export_parser.add_argument("--benchmark", type=str, nargs='+', default=[], dest="benchmark_files",
+                                  metavar="FILE", help="benchmark results saved with benchmark --save")
+        export_parser.add_argument("--chunk-rows", type=int, default=100_000,
+                                  help="rows read and written at a time (default: 100000)")
+        export_parser.add_argument("--no-tracking", action="store_true",
+                                  help="disable run tracking and performance comparison")
+
+        # TRACKER subcommand
+        tracker_parser = subparsers.add_parser('tracker',
+                                               help='Maintain and inspect the tracking database',
+                                               formatter_class=argparse.RawDescriptionHelpFormatter,
+                                               epilog="""
+Examples:
+  python main.py tracker audit                 # Check query plans on a synthetic 1M-run database
+  python main.py tracker audit --rows 100000 -v    # Smaller database, print SQL and full plans
+  python main.py tracker bench-best-times      # Best-times query vs the previous self-join
+  python main.py tracker compact --dry-run     # How many old runs compaction would fold
+  python main.py tracker compact --keep-days 90    # Fold runs older than 90 days into buckets
+                                               """)
+        tracker_subparsers = tracker_parser.add_subparsers(dest='tracker_command', metavar='ACTION')
+        tracker_subparsers.required = True
+
+        audit_parser = tracker_subparsers.add_parser('audit',
+                                                     help='check that every tracker query uses an index')
+        audit_parser.add_argument("--rows", type=int, default=1_000_000,
+                                 help="number of synthetic runs to audit against (default: 1000000)")
+        audit_parser.add_argument("--db", type=str, metavar="PATH",
+                                 help="build the synthetic database at PATH and keep it (default: temporary file)")
+        audit_parser.add_argument("--verbose", "-v", action="store_true",
+                                 help="print the SQL and full query plan of every statement")
+
+        bench_parser = tracker_subparsers.add_parser('bench-best-times',
+                                                     help='benchmark the best-times query against the previous one')
+        bench_parser.add_argument("--runs-per-problem", type=int, default=10_000,
+                                 help="synthetic runs per day and part (default: 10000)")
+        bench_parser.add_argument("--year", type=int, action="append", dest="years", metavar="YEAR",
+                                 help="fill this year (can be repeated; default: 2025)")
+        bench_parser.add_argument("--repeat", type=int, default=3,
+                                 help="timed calls per query, the fastest counts (default: 3)")
+
+        compact_parser = tracker_subparsers.add_parser('compact',
+                                                       help='downsample old runs into histogram buckets')
+        compact_parser.add_argument("--keep-days", type=int, default=30,
+                                   help="keep every run younger than this many days (default: 30)")
+        compact_parser.add_argument("--keep-latest", type=int, default=100,
+                                   help="keep this many most recent runs per problem (default: 100)")
+        compact_parser.add_argument("--dry-run", action="store_true",
+                                   help="only report what would be compacted")
+        compact_parser.add_argument("--no-vacuum", action="store_true",
+                                   help="skip the VACUUM that returns freed space to the filesystem")
+        compact_parser.add_argument("--db", type=str, metavar="PATH",
+                                   help="database to compact (default: aoc_tracking.db)")
+        tracker_parser.add_argument("--no-tracking", action="store_true",
+                                   help="disable run tracking and performance comparison")
+
         return parser
@@ -2,25 +2,61 @@
 Core functionality for Advent of Code solutions.
 
 This package contains the fundamental components needed to run AOC solutions:
-- Input handling and downloading
-- Solution loading and execution
+- Input handling and downloading (memory-mapped input files)
+- Solution loading and execution (with a shared module registry)
 - Tracking and database operations
 - Submission handling
 - Year-specific configuration
+
+Submodules are imported lazily on first attribute access, so e.g. running a
+solution never pays for the HTTP and HTML parsing dependencies of the submitter.
 """
 
-from .input_handler import InputHandler, is_input_available
-from .solution_loader import SolutionLoader
-from .tracker import AOCTracker
-from .submitter import AOCSubmitter
-from .year_config import get_max_day, is_last_day, get_expected_parts, get_required_stars_for_last_day_part2
-from .animation import Animation, AnimationFrame, has_animation, run_animation
+from importlib import import_module
+
+_LAZY_IMPORTS = {
+    'InputHandler': '.input_handler',
+    'is_input_available': '.input_handler',
+    'PuzzleInput': '.puzzle_input',
+    'InputPrefetcher': '.prefetch',
+    'RateLimiter': '.prefetch',
+    'SolutionLoader': '.solution_loader',
+    'ParsedInputCache': '.parsed_input',
+    'get_parsed_input_cache': '.parsed_input',
+    'TimedExecutor': '.timed_executor',
+    'ModuleRegistry': '.module_registry',
+    'get_module_registry': '.module_registry',
+    'AOCTracker': '.tracker',
+    'RunStats': '.run_stats',
+    'QuantileSketch': '.run_stats',
+    'VersionComparison': '.regressions',
+    'AOCSubmitter': '.submitter',
+    'get_max_day': '.year_config',
+    'is_last_day': '.year_config',
+    'get_expected_parts': '.year_config',
+    'get_required_stars_for_last_day_part2': '.year_config',
+    'Animation': '.animation',
+    'AnimationFrame': '.animation',
+    'has_animation': '.animation',
+    'run_animation': '.animation'
+}
 
 __all__ = [
     'InputHandler',
     'is_input_available',
+    'PuzzleInput',
+    'InputPrefetcher',
+    'RateLimiter',
     'SolutionLoader',
+    'ParsedInputCache',
+    'get_parsed_input_cache',
+    'TimedExecutor',
+    'ModuleRegistry',
+    'get_module_registry',
     'AOCTracker',
+    'RunStats',
+    'QuantileSketch',
+    'VersionComparison',
     'AOCSubmitter',
     'get_max_day',
     'is_last_day',
@@ -31,3 +67,16 @@ __all__ = [
     'has_animation',
     'run_animation'
 ]
+
+
+def __getattr__(name: str):
+    """Import public names on first access so unused dependencies are never loaded."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
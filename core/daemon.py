@@ -0,0 +1,256 @@
+"""
+Persistent solution daemon.
+
+A long-lived local server process that keeps the runner's dependencies
+imported and solution modules and inputs loaded between runs. The daemon is
+started with `python main.py serve`, and `python main.py YEAR DAY --daemon`
+forwards a run to it and prints the streamed output. Solution modules are only
+re-executed when their source file changes (see module_registry).
+"""
+import argparse
+import contextlib
+import json
+import os
+import secrets
+import sys
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .module_registry import get_module_registry
+
+
+STATE_FILENAME = ".aoc_daemon.json"
+
+
+def get_state_path(root: Path = None) -> Path:
+    """Get the path of the file describing the running daemon."""
+    return (root or Path.cwd()) / STATE_FILENAME
+
+
+def read_daemon_state(root: Path = None) -> Optional[Dict]:
+    """Read the address and auth key of the running daemon, if any."""
+    state_path = get_state_path(root)
+    if not state_path.exists():
+        return None
+
+    try:
+        return json.loads(state_path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+class _ConnectionWriter:
+    """File-like object that streams everything written to it to the client."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.closed = False
+
+    def write(self, text: str) -> int:
+        if text and not self.closed:
+            try:
+                self.conn.send(('stdout', text))
+            except (OSError, EOFError):
+                # Client went away (e.g. Ctrl+C); finish the run silently
+                self.closed = True
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+
+class SolutionDaemon:
+    """Serves solution runs from a warm process."""
+
+    def __init__(self, root: Path = None, port: int = 0, tracking: bool = True):
+        """
+        Initialize the daemon.
+
+        Args:
+            root: Project directory containing the year folders (defaults to cwd)
+            port: Local TCP port to listen on (0 picks a free port)
+            tracking: Whether runs are recorded in the tracking database
+        """
+        # Imported here so the client side of this module stays lightweight
+        from cli.handlers import CommandHandlers
+        from .tracker import AOCTracker
+
+        self.root = root or Path.cwd()
+        self.port = port
+        self.handlers = CommandHandlers()
+        self.tracker = AOCTracker() if tracking else None
+        self.submitter = None
+
+    def load_module(self, year: int, day: int) -> Any:
+        """Return the solution module, re-executing it only if the source changed."""
+        # The shared module registry keys modules by content hash
+        return self.handlers.solution_loader.load_solution_module(year, day)
+
+    def get_input(self, args: argparse.Namespace) -> str:
+        """Return the input for a run, re-reading the file only if it changed."""
+        # The input handler keeps input files mapped and decoded until they change on disk
+        return self.handlers.get_input_data(args)
+
+    def run(self, args: argparse.Namespace) -> None:
+        """Execute a run request; output goes to the (redirected) stdout."""
+        tracker = None if args.no_tracking else self.tracker
+
+        submitter = None
+        if args.submit:
+            if args.part is None:
+                print("❌ Submission requires specifying a single part with --part 1 or --part 2")
+                print("Example: python main.py 2025 3 --part 1 --submit")
+                return
+            if self.submitter is None:
+                from .submitter import AOCSubmitter
+                self.submitter = AOCSubmitter()
+            submitter = self.submitter
+
+        try:
+            module = self.load_module(args.year, args.day)
+        except FileNotFoundError as e:
+            print(str(e))
+            return
+
+        input_data = self.get_input(args)
+        self.handlers.handle_run(args, module, input_data, tracker, submitter)
+
+    def _handle_connection(self, conn) -> bool:
+        """Handle a single client request. Returns False when asked to stop."""
+        try:
+            request = conn.recv()
+        except (OSError, EOFError):
+            return True
+
+        action = request.get('action')
+
+        if action == 'ping':
+            conn.send(('done', {'pid': os.getpid(), **get_module_registry().stats()}))
+            return True
+
+        if action == 'stop':
+            conn.send(('done', {'pid': os.getpid()}))
+            return False
+
+        if action != 'run':
+            conn.send(('reject', f"Unknown action: {action}"))
+            return True
+
+        if Path(request['cwd']).resolve() != self.root.resolve():
+            conn.send(('reject', f"Daemon is serving {self.root}, not {request['cwd']}"))
+            return True
+
+        args = argparse.Namespace(**request['args'])
+        writer = _ConnectionWriter(conn)
+        with contextlib.redirect_stdout(writer):
+            try:
+                self.run(args)
+            except Exception as e:
+                print(f"❌ Daemon error: {e}")
+
+        if not writer.closed:
+            try:
+                conn.send(('done', None))
+            except (OSError, EOFError):
+                pass
+        return True
+
+    def serve_forever(self) -> None:
+        """Listen for run requests until stopped."""
+        authkey = secrets.token_bytes(32)
+        state_path = get_state_path(self.root)
+
+        with Listener(('127.0.0.1', self.port), authkey=authkey) as listener:
+            host, port = listener.address
+            state_path.write_text(json.dumps({'port': port, 'authkey': authkey.hex(), 'pid': os.getpid()}))
+            print(f"🔥 Solution daemon listening on {host}:{port} (pid {os.getpid()})")
+            print("   Run solutions with: python main.py YEAR DAY --daemon")
+            print("   Stop with: python main.py serve --stop (or Ctrl+C)")
+
+            try:
+                running = True
+                while running:
+                    try:
+                        conn = listener.accept()
+                    except (OSError, EOFError) as e:
+                        # Failed handshake (e.g. wrong auth key); keep serving
+                        print(f"⚠️  Rejected connection: {e}")
+                        continue
+
+                    with conn:
+                        running = self._handle_connection(conn)
+            except KeyboardInterrupt:
+                pass
+            finally:
+                state = read_daemon_state(self.root)
+                if state and state.get('pid') == os.getpid():
+                    state_path.unlink()
+
+        print("🛑 Solution daemon stopped")
+
+
+def _connect(root: Path = None):
+    """Open a connection to the running daemon, or return None."""
+    state = read_daemon_state(root)
+    if not state:
+        return None
+
+    try:
+        return Client(('127.0.0.1', state['port']), authkey=bytes.fromhex(state['authkey']))
+    except (OSError, EOFError, KeyError, ValueError):
+        return None
+
+
+def send_daemon_command(action: str, root: Path = None) -> Optional[Any]:
+    """
+    Send a control command ('ping' or 'stop') to the daemon.
+
+    Returns:
+        The daemon's reply payload, or None if no daemon is reachable
+    """
+    conn = _connect(root)
+    if conn is None:
+        return None
+
+    with conn:
+        conn.send({'action': action})
+        try:
+            kind, payload = conn.recv()
+        except (OSError, EOFError):
+            return None
+        return payload if kind == 'done' else None
+
+
+def run_via_daemon(args: argparse.Namespace, root: Path = None) -> bool:
+    """
+    Forward a run to the daemon and print its streamed output.
+
+    Returns:
+        True if the daemon handled the run, False if it should be run locally
+    """
+    conn = _connect(root)
+    if conn is None:
+        return False
+
+    with conn:
+        conn.send({'action': 'run', 'cwd': str(root or Path.cwd()), 'args': vars(args)})
+
+        while True:
+            try:
+                kind, payload = conn.recv()
+            except (OSError, EOFError):
+                print("\n⚠️  Lost connection to the solution daemon")
+                return True
+
+            if kind == 'stdout':
+                sys.stdout.write(payload)
+                sys.stdout.flush()
+            elif kind == 'reject':
+                print(f"⚠️  {payload}")
+                return False
+            else:
+                return True
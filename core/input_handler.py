@@ -2,11 +2,18 @@
 Input handling functionality for Advent of Code solutions.
 """
 import os
-import requests
+import threading
 from datetime import datetime, timezone
+from typing import Dict
+from .puzzle_input import PuzzleInput
 from .year_config import get_max_day
 
 
+AOC_BASE_URL = "https://adventofcode.com"
+# Set a proper user agent with GitHub repo to make Eric happy
+USER_AGENT = "https://github.com/basmulder03/AdventOfCodePython"
+
+
 def is_input_available(year: int, day: int) -> bool:
     """Check if input is available for the given year and day.
 
@@ -30,8 +37,43 @@ def is_input_available(year: int, day: int) -> bool:
 class InputHandler:
     """Handles input downloading and caching for Advent of Code."""
 
-    def __init__(self, cookie_filename: str = "session_cookie.txt"):
+    def __init__(self, cookie_filename: str = "session_cookie.txt", base_url: str = AOC_BASE_URL):
         self.cookie_filename = cookie_filename
+        self.base_url = base_url.rstrip("/")
+        self._session = None
+        self._session_lock = threading.Lock()
+        # filename -> mapped input, reused until the file changes on disk
+        self._inputs: Dict[str, PuzzleInput] = {}
+
+    def get_puzzle_input(self, year: int, day: int, sample: bool = False) -> PuzzleInput:
+        """Get the memory-mapped input file for the specified year and day.
+
+        The file is mapped once and reused until it changes on disk, so its
+        decoded text and content hash are only computed once. Missing files are
+        created or downloaded like in get_input.
+
+        Args:
+            year: The AOC year
+            day: The AOC day
+            sample: Whether to get sample input instead of actual input
+
+        Returns:
+            The mapped input file
+        """
+        filename = self.get_input_filename(year, day, sample)
+
+        cached = self._inputs.get(filename)
+        if cached is not None and not cached.is_stale():
+            return cached
+
+        if not os.path.exists(filename):
+            self.get_input(year, day, sample)
+
+        puzzle_input = PuzzleInput(filename)
+        if cached is not None:
+            cached.close()
+        self._inputs[filename] = puzzle_input
+        return puzzle_input
 
     def get_input(self, year: int, day: int, sample: bool = False) -> str:
         """Get input data for the specified year and day.
@@ -44,15 +86,11 @@ class InputHandler:
         Returns:
             The input data as a string
         """
-        if sample:
-            filename = f"input/{year}/day{day}_sample.txt"
-        else:
-            filename = f"input/{year}/day{day}.txt"
+        filename = self.get_input_filename(year, day, sample)
 
         if os.path.exists(filename):
-            # Read the input data from the file
-            with open(filename, "r") as f:
-                return f.read()
+            # Read the input data from the (cached) mapped file
+            return self.get_puzzle_input(year, day, sample).text
         elif sample:
             # Create sample file if it doesn't exist
             self._ensure_directory_exists(filename)
@@ -68,38 +106,71 @@ class InputHandler:
             # Download actual input from AOC website
             return self._download_input(year, day, filename)
 
+    def get_input_filename(self, year: int, day: int, sample: bool) -> str:
+        """Get the input file path for the given year and day."""
+        if sample:
+            return f"input/{year}/day{day}_sample.txt"
+        return f"input/{year}/day{day}.txt"
+
     def _ensure_directory_exists(self, filename: str) -> None:
         """Ensure the directory structure exists for the given filename."""
-        current_dir = os.getcwd()
-        for dir in filename.split("/")[:-1]:
-            if not dir in os.listdir(current_dir):
-                os.makedirs(os.path.join(current_dir, dir))
-            current_dir = os.path.join(current_dir, dir)
+        directory = os.path.dirname(filename)
+        if directory:
+            # exist_ok: concurrent prefetch downloads may create the same year folder
+            os.makedirs(directory, exist_ok=True)
+
+    def get_session(self, pool_size: int = 10):
+        """Get the shared, authenticated HTTP session.
+
+        The session is created on first use and reused for every download, so
+        connections to the AOC server are pooled and kept alive.
+
+        Args:
+            pool_size: Maximum number of pooled connections (for concurrent downloads)
+
+        Returns:
+            The requests session
+        """
+        with self._session_lock:
+            if self._session is None:
+                # Only needed when downloading; keeps plain runs from importing the HTTP stack
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.cookies.update({"session": self._get_session_cookie()})
+                session.headers.update({"User-Agent": USER_AGENT})
+                self._session = session
+            return self._session
+
+    def get_input_url(self, year: int, day: int) -> str:
+        """Get the download URL of the input for the given year and day."""
+        return f"{self.base_url}/{year}/day/{day}/input"
+
+    def save_input(self, filename: str, input_data: str) -> None:
+        """Write downloaded input data to its file, replacing it atomically."""
+        self._ensure_directory_exists(filename)
+
+        temp_filename = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_filename, "w+") as f:
+            f.write(input_data)
+        os.replace(temp_filename, filename)
 
     def _download_input(self, year: int, day: int, filename: str) -> str:
         """Download input from the AOC website."""
-        session_cookie = self._get_session_cookie()
-
-        # Create a session and authenticate with the AOC website
-        session = requests.Session()
-        session.cookies.update({"session": session_cookie})
-        # Set a proper user agent with GitHub repo to make Eric happy
-        session.headers.update({
-            "User-Agent": "https://github.com/basmulder03/AdventOfCodePython"
-        })
+        session = self.get_session()
 
-        response = session.get(f"https://adventofcode.com/{year}/day/{day}/input")
+        response = session.get(self.get_input_url(year, day))
 
         if response.status_code == 403:
             # The cookie is no longer valid, prompt the user for a new one
             new_cookie = input(
                 "Your session cookie is no longer valid. Please enter a new one: ")
             session.cookies.update({"session": new_cookie})
-            # Ensure user agent is still set for retry request
-            session.headers.update({
-                "User-Agent": "https://github.com/basmulder03/AdventOfCodePython"
-            })
-            response = session.get(f"https://adventofcode.com/{year}/day/{day}/input")
+            response = session.get(self.get_input_url(year, day))
             # Save the new cookie to the file
             with open(self.cookie_filename, "w+") as f:
                 f.write(new_cookie)
@@ -107,11 +178,8 @@ class InputHandler:
         response.raise_for_status()
         input_data = response.text
 
-        self._ensure_directory_exists(filename)
-
         # Write the input data to the file
-        with open(filename, "w+") as f:
-            f.write(input_data)
+        self.save_input(filename, input_data)
 
         return input_data
 
@@ -133,3 +201,7 @@ _default_handler = InputHandler()
 def get_input(year: int, day: int, sample: bool = False) -> str:
     """Backward compatibility function for getting input."""
     return _default_handler.get_input(year, day, sample)
+
+def get_puzzle_input(year: int, day: int, sample: bool = False) -> PuzzleInput:
+    """Backward compatibility function for getting the mapped input file."""
+    return _default_handler.get_puzzle_input(year, day, sample)
@@ -0,0 +1,142 @@
+"""
+Subprocess-isolated solution execution.
+
+Runs a solve function in a forked child process, so a timed-out solver is
+actually killed instead of burning CPU in a leftover thread, and an optional
+RLIMIT_AS ceiling keeps a runaway solver from exhausting the machine's memory.
+The child reports its result, the execution time measured around the call,
+its peak resident set size and any recorded phases back to the parent over a
+pipe.
+
+Forking is only available on POSIX systems; use is_isolation_supported() to
+check before running.
+"""
+import multiprocessing
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from utils.phase_timer import get_active_recorder, record_phases
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def is_isolation_supported() -> bool:
+    """Check if solutions can be run in forked child processes on this platform."""
+    return resource is not None and 'fork' in multiprocessing.get_all_start_methods()
+
+
+def _peak_rss_bytes() -> int:
+    """Peak resident set size of the current process in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+@dataclass
+class IsolatedResult:
+    """Outcome of running a function in an isolated child process."""
+    result: Any
+    execution_time: float
+    peak_rss: Optional[int] = None  # bytes
+    phases: Optional[Dict[str, float]] = None  # seconds per phase (utils.phase_timer)
+
+
+class IsolationError(RuntimeError):
+    """The child process died without reporting a result (e.g. killed by the OS)."""
+
+
+def _child_main(conn, func: Callable[[str], Any], input_data: str, memory_limit: Optional[int]) -> None:
+    """Entry point of the forked child: run the solver and report back."""
+    if memory_limit:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+    # Phases recorded in the child are sent back to the parent's recorder
+    with record_phases() as recorder:
+        try:
+            start_time = time.perf_counter()
+            result = func(input_data)
+            elapsed_time = time.perf_counter() - start_time
+            message = ('ok', result, elapsed_time, _peak_rss_bytes())
+        except BaseException as e:
+            if isinstance(e, MemoryError) and memory_limit:
+                e = MemoryError(f"Solution exceeded the memory limit of {memory_limit // (1024 * 1024)} MB")
+            message = ('error', e, None, _peak_rss_bytes())
+
+    phases = recorder.durations()
+    try:
+        conn.send(message + (phases,))
+    except Exception:
+        # Unpicklable result or exception; fall back to its string form
+        kind, payload, elapsed_time, peak_rss = message
+        if kind == 'ok':
+            conn.send(('ok', str(payload), elapsed_time, peak_rss, phases))
+        else:
+            conn.send(('error', RuntimeError(f"{type(payload).__name__}: {payload}"), None, peak_rss, phases))
+    finally:
+        conn.close()
+
+
+def run_isolated(func: Callable[[str], Any], input_data: str, timeout: Optional[float] = None,
+                 memory_limit_mb: Optional[int] = None) -> IsolatedResult:
+    """
+    Run func(input_data) in a forked child process.
+
+    Args:
+        func: Solve function (inherited by the child through fork, no pickling needed)
+        input_data: Puzzle input
+        timeout: Seconds after which the child is killed (None for no limit)
+        memory_limit_mb: Address space limit for the child in megabytes (None for no limit)
+
+    Returns:
+        IsolatedResult with the returned value, execution time and peak RSS
+
+    Raises:
+        TimeoutError: If the child didn't finish within the timeout
+        IsolationError: If the child died without reporting (e.g. killed by a signal)
+        Exception: Whatever the solve function raised
+    """
+    if not is_isolation_supported():
+        raise IsolationError("Isolated execution requires a POSIX system with fork()")
+
+    context = multiprocessing.get_context('fork')
+    parent_conn, child_conn = context.Pipe(duplex=False)
+    memory_limit = memory_limit_mb * 1024 * 1024 if memory_limit_mb else None
+
+    # Flush buffered output so the child doesn't print it a second time
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    process = context.Process(target=_child_main, args=(child_conn, func, input_data, memory_limit),
+                              daemon=True)
+    process.start()
+    child_conn.close()
+
+    try:
+        if not parent_conn.poll(timeout):
+            process.kill()
+            raise TimeoutError(f"Solution execution timed out after {timeout} seconds")
+
+        try:
+            kind, payload, elapsed_time, peak_rss, phases = parent_conn.recv()
+        except EOFError:
+            process.join()
+            if process.exitcode is not None and process.exitcode < 0:
+                raise IsolationError(f"Solution process was killed by signal {-process.exitcode}")
+            raise IsolationError(f"Solution process exited with code {process.exitcode}")
+    finally:
+        parent_conn.close()
+        process.join()
+
+    recorder = get_active_recorder()
+    if recorder is not None:
+        for name, seconds in phases.items():
+            recorder.add(name, seconds)
+
+    if kind == 'error':
+        raise payload
+    return IsolatedResult(payload, elapsed_time, peak_rss, phases)
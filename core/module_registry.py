@@ -0,0 +1,104 @@
+"""
+Shared registry of loaded solution modules.
+
+Solution files are loaded by path under a synthetic module name such as
+`2015.day4`. The registry keys each loaded module by the SHA-256 of its
+source, so repeated loads within one process (handlers, animation,
+benchmarks, the daemon) return the already-executed module until the file
+contents actually change. Compiled code objects are cached by content hash as
+well, and compilation goes through the regular source loader so the on-disk
+`__pycache__` bytecode is reused across processes.
+"""
+import hashlib
+import importlib.util
+import sys
+from pathlib import Path
+from types import CodeType, ModuleType
+from typing import Dict, Tuple
+
+
+class ModuleRegistry:
+    """Content-hash keyed cache of executed solution modules."""
+
+    def __init__(self):
+        # resolved path -> (source digest, module)
+        self._modules: Dict[str, Tuple[str, ModuleType]] = {}
+        # source digest -> compiled code
+        self._code: Dict[str, CodeType] = {}
+        self.hits = 0
+        self.misses = 0
+        self.compiles = 0
+
+    def load(self, module_name: str, module_path: Path) -> ModuleType:
+        """
+        Load a module from a file, reusing the cached module if the source is unchanged.
+
+        Args:
+            module_name: Name to register the module under (e.g. "2015.day4")
+            module_path: Path of the source file
+
+        Returns:
+            The executed module
+
+        Raises:
+            FileNotFoundError: If the source file doesn't exist
+            ImportError: If no module spec can be created for the file
+        """
+        key = str(Path(module_path).resolve())
+        source = Path(module_path).read_bytes()
+        digest = hashlib.sha256(source).hexdigest()
+
+        cached = self._modules.get(key)
+        if cached and cached[0] == digest:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+
+        spec = importlib.util.spec_from_file_location(module_name, module_path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Could not load module spec for {module_path}")
+
+        code = self._code.get(digest)
+        if code is None:
+            # get_code reads and writes the __pycache__ bytecode for this file
+            code = spec.loader.get_code(module_name)
+            self._code[digest] = code
+            self.compiles += 1
+
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            exec(code, module.__dict__)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            self._modules.pop(key, None)
+            raise
+
+        self._modules[key] = (digest, module)
+        return module
+
+    def invalidate(self, module_path: Path = None) -> None:
+        """Forget a loaded module (or all modules) so the next load re-executes it."""
+        if module_path is None:
+            self._modules.clear()
+        else:
+            self._modules.pop(str(Path(module_path).resolve()), None)
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache counters."""
+        return {
+            'modules': len(self._modules),
+            'hits': self.hits,
+            'misses': self.misses,
+            'compiles': self.compiles
+        }
+
+
+# Shared by every loader in the process
+_default_registry = ModuleRegistry()
+
+
+def get_module_registry() -> ModuleRegistry:
+    """Get the process-wide module registry."""
+    return _default_registry
@@ -0,0 +1,90 @@
+"""
+Shared parsed-input cache.
+
+Solutions may define an optional `parse(input_data)` hook next to their solve
+functions. When present, the runner calls it once per input, caches the
+result keyed by the parse function and the input's content hash, and passes
+the parsed value to `solve_part_1` and `solve_part_2` instead of the raw text.
+Parse time is measured and reported separately from solve time.
+
+Both parts (and repeated benchmark runs) receive the same parsed object, so
+solutions must not mutate it; copy what needs changing.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from .puzzle_input import hash_text
+from .timed_executor import TimedExecutor
+
+
+PARSE_FUNCTION = "parse"
+
+
+def has_parse_hook(module: Any) -> bool:
+    """Check if a solution module defines a parse(input_data) hook."""
+    return callable(getattr(module, PARSE_FUNCTION, None))
+
+
+@dataclass
+class ParsedInput:
+    """Parsed input for a solution module."""
+    value: Any
+    parse_time: float  # seconds spent in parse() when the value was computed
+    cached: bool = False
+
+
+class ParsedInputCache:
+    """LRU cache of parse() results keyed by parse function and input hash."""
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, ParsedInput]" = OrderedDict()
+
+    def get(self, module: Any, input_data: str, executor: TimedExecutor = None,
+            timeout: Optional[float] = None) -> ParsedInput:
+        """
+        Get the parsed input for a module, calling its parse hook on a cache miss.
+
+        Args:
+            module: Solution module with a parse function
+            input_data: Raw puzzle input
+            executor: Executor used to time (and time-limit) the parse call
+            timeout: Time limit for parsing in seconds
+
+        Returns:
+            ParsedInput with the value and the time parse() took
+
+        Raises:
+            TimeoutError: If parsing didn't finish within the timeout
+            Exception: Whatever parse() raised
+        """
+        parse = getattr(module, PARSE_FUNCTION)
+        # A re-executed module has a new parse function, so edits invalidate the entry
+        key = (parse, hash_text(input_data))
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return ParsedInput(entry.value, entry.parse_time, cached=True)
+
+        timed = (executor or TimedExecutor()).call(parse, input_data, timeout)
+        entry = ParsedInput(timed.result, timed.execution_time)
+
+        self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        self._entries.clear()
+
+
+# Shared by the CLI, the daemon and the benchmark runner in one process
+_default_cache = ParsedInputCache()
+
+
+def get_parsed_input_cache() -> ParsedInputCache:
+    """Get the process-wide parsed-input cache."""
+    return _default_cache
@@ -0,0 +1,202 @@
+"""
+Bulk input prefetching.
+
+Downloads all missing puzzle inputs concurrently before e.g. a full
+`benchmark --all` on a fresh checkout. Downloads share one pooled HTTP
+session, go through a global token-bucket rate limiter so the AOC server is
+never hit faster than the configured rate, and are retried with exponential
+backoff on rate limiting, server errors and connection failures.
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from .input_handler import InputHandler, is_input_available
+from .year_config import get_max_day
+
+
+# Responses worth retrying: rate limited or a transient server problem
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting the global request rate."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Number of requests that may be made back-to-back
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be made."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+@dataclass
+class PrefetchResult:
+    """Outcome of prefetching a single input."""
+    year: int
+    day: int
+    status: str  # 'downloaded', 'unavailable', 'failed', 'skipped'
+    attempts: int = 0
+    size: int = 0
+    error_message: Optional[str] = None
+
+
+class InputPrefetcher:
+    """Downloads missing puzzle inputs concurrently."""
+
+    def __init__(self, input_handler: InputHandler = None, workers: int = 4, rate: float = 1.0,
+                 burst: int = 1, retries: int = 3, backoff: float = 1.0):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            input_handler: Handler providing the session, URLs and file locations
+            workers: Number of concurrent downloads
+            rate: Maximum requests per second across all workers
+            burst: Number of requests that may be made back-to-back
+            retries: Number of retries per input after the first attempt
+            backoff: Initial retry delay in seconds (doubled on every retry)
+        """
+        self.input_handler = input_handler or InputHandler()
+        self.workers = max(1, workers)
+        self.limiter = RateLimiter(rate, burst)
+        self.retries = max(0, retries)
+        self.backoff = backoff
+        # Set when the session cookie is rejected; no point in sending more requests
+        self._abort = threading.Event()
+
+    def find_missing(self, years: List[int], released: bool = False) -> List[Tuple[int, int]]:
+        """
+        Find the inputs that still need to be downloaded.
+
+        Args:
+            years: Years to check
+            released: Include every released puzzle, not only days with a solution file
+
+        Returns:
+            Sorted list of (year, day) pairs without an input file
+        """
+        missing = []
+        for year in years:
+            for day in range(1, get_max_day(year) + 1):
+                if not released and not (Path.cwd() / str(year) / f"day{day}.py").exists():
+                    continue
+                if not is_input_available(year, day):
+                    continue
+                if not os.path.exists(self.input_handler.get_input_filename(year, day, False)):
+                    missing.append((year, day))
+        return missing
+
+    def fetch(self, year: int, day: int) -> PrefetchResult:
+        """Download a single input, retrying transient failures."""
+        # Only needed when downloading; keeps plain runs from importing the HTTP stack
+        import requests
+
+        session = self.input_handler.get_session(pool_size=self.workers)
+        url = self.input_handler.get_input_url(year, day)
+        result = PrefetchResult(year, day, 'failed')
+
+        for attempt in range(self.retries + 1):
+            if self._abort.is_set():
+                result.status = 'skipped'
+                result.error_message = "Session cookie was rejected"
+                return result
+
+            if attempt > 0:
+                time.sleep(delay)
+
+            self.limiter.acquire()
+            result.attempts += 1
+            delay = self.backoff * (2 ** attempt)
+
+            try:
+                response = session.get(url, timeout=30)
+            except requests.RequestException as e:
+                result.error_message = str(e)
+                continue
+
+            if response.status_code == 200:
+                self.input_handler.save_input(self.input_handler.get_input_filename(year, day, False),
+                                              response.text)
+                result.status = 'downloaded'
+                result.size = len(response.content)
+                result.error_message = None
+                return result
+
+            if response.status_code in (400, 403):
+                # AOC answers 400 for a missing cookie and 403 for an expired one
+                self._abort.set()
+                result.error_message = f"HTTP {response.status_code}: session cookie was rejected"
+                return result
+
+            if response.status_code == 404:
+                result.status = 'unavailable'
+                result.error_message = "Puzzle not found"
+                return result
+
+            result.error_message = f"HTTP {response.status_code}"
+            if response.status_code not in RETRY_STATUSES:
+                return result
+
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+
+        return result
+
+    def prefetch(self, targets: List[Tuple[int, int]],
+                 on_complete: Callable[[PrefetchResult], None] = None) -> List[PrefetchResult]:
+        """
+        Download the given inputs concurrently.
+
+        Args:
+            targets: (year, day) pairs to download
+            on_complete: Optional callback invoked (in the calling thread) as each download finishes
+
+        Returns:
+            Results sorted by year and day
+        """
+        if not targets:
+            return []
+
+        # Create the session (and prompt for a cookie if needed) before starting workers
+        self.input_handler.get_session(pool_size=self.workers)
+        self._abort.clear()
+
+        results = []
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(self.fetch, year, day) for year, day in targets]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                if on_complete:
+                    on_complete(result)
+
+        return sorted(results, key=lambda r: (r.year, r.day))
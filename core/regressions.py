@@ -0,0 +1,111 @@
+"""
+Performance regression detection between versions of a solution.
+
+Runs are grouped by code version (the tracker's code_hash) on one input. The
+current version's run times are compared with those of the previously run
+version using a one-sided Mann-Whitney U test, which makes no assumption
+about the shape of the timing distribution and is robust to the odd slow
+outlier. A slowdown is reported when it is both significant and large
+enough to matter.
+
+Times are compared as QuantileSketch histograms, so runs compacted into
+run_buckets take part like any other run; values that share a 1% bucket
+count as ties.
+"""
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+from .run_stats import QuantileSketch
+
+# A slowdown is flagged when the test's p-value is below SIGNIFICANCE and the
+# current median is at least MIN_SLOWDOWN times the previous one
+SIGNIFICANCE = 0.01
+MIN_SLOWDOWN = 1.10
+
+# Fewer runs per version than this can't give a meaningful result
+MIN_RUNS = 5
+
+
+def mann_whitney_p_greater(sample: QuantileSketch, other: QuantileSketch) -> float:
+    """
+    One-sided Mann-Whitney U test that sample's values tend to be larger than other's.
+
+    Uses the normal approximation with tie and continuity corrections.
+
+    Returns:
+        The p-value (1.0 if either sketch is empty or all values are tied)
+    """
+    n1, n2 = sample.count, other.count
+    if not n1 or not n2:
+        return 1.0
+
+    counts = sample.histogram()
+    other_counts = other.histogram()
+
+    # U counts the (sample, other) pairs where the sample value is larger, ties as half
+    u = 0.0
+    below = 0
+    tie_term = 0
+    for bucket in sorted(set(counts) | set(other_counts)):
+        a = counts.get(bucket, 0)
+        b = other_counts.get(bucket, 0)
+        u += a * (below + b / 2)
+        below += b
+        tied = a + b
+        tie_term += tied ** 3 - tied
+
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+@dataclass
+class VersionComparison:
+    """Run times of a problem's current code version against the previous one, on one input."""
+    year: int
+    day: int
+    part: int
+    input_hash: str
+    code_hash: str
+    previous_code_hash: str
+    current: QuantileSketch
+    previous: QuantileSketch
+
+    @property
+    def runs(self) -> int:
+        return self.current.count
+
+    @property
+    def previous_runs(self) -> int:
+        return self.previous.count
+
+    @property
+    def median_ms(self) -> Optional[float]:
+        return self.current.quantile(0.5)
+
+    @property
+    def previous_median_ms(self) -> Optional[float]:
+        return self.previous.quantile(0.5)
+
+    @property
+    def slowdown(self) -> Optional[float]:
+        """Current median over previous median (above 1 means slower)."""
+        if not self.current.count or not self.previous.count:
+            return None
+        return self.median_ms / self.previous_median_ms
+
+    @property
+    def p_value(self) -> float:
+        """Significance of the current version being slower than the previous one."""
+        if self.runs < MIN_RUNS or self.previous_runs < MIN_RUNS:
+            return 1.0
+        return mann_whitney_p_greater(self.current, self.previous)
+
+    @property
+    def is_regression(self) -> bool:
+        return self.p_value < SIGNIFICANCE and self.slowdown >= MIN_SLOWDOWN
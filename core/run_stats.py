@@ -0,0 +1,201 @@
+"""
+Per-problem timing aggregates for the tracking database.
+
+The tracker keeps one `run_stats` row per (year, day, part) with the count,
+min, max, sum and sum of squares of its successful run times, a quantile
+sketch of their distribution and the best run. Runs on the sample input get
+a row of their own, so they count in summaries without mixing their times
+into the comparisons of real runs. Rows are updated as runs are recorded,
+so performance comparisons and summaries read one row per problem instead
+of scanning the run history.
+
+Old runs compacted out of the `runs` table are kept as histogram buckets in
+`run_buckets`, using the sketch's bucket indexes, so the aggregates can still
+be rebuilt after compaction.
+"""
+import json
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional
+
+
+class QuantileSketch:
+    """
+    Streaming quantile sketch over positive values with bounded relative error.
+
+    Values are counted in logarithmically sized buckets (as in DDSketch), so
+    any quantile is reported within `relative_accuracy` of a true value and
+    the sketch's size only grows with the range of the values, not their
+    number. Timings spanning a microsecond to an hour need at most ~1100
+    buckets at the default 1%; one problem's runs typically fill a few dozen.
+    """
+
+    # Values below this (in the caller's unit) share the lowest bucket
+    MIN_VALUE = 1e-6
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+
+    def bucket_index(self, value: float) -> int:
+        """Index of the bucket a value is counted in."""
+        return math.ceil(math.log(max(value, self.MIN_VALUE)) / self._log_gamma)
+
+    def bucket_value(self, bucket: int) -> float:
+        """Representative value of a bucket."""
+        # Midpoint (in relative terms) of the bucket's (gamma^(i-1), gamma^i] range
+        return 2 * self._gamma ** bucket / (self._gamma + 1)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add a value (count times)."""
+        self.add_bucket(self.bucket_index(value), count)
+
+    def add_all(self, values: Iterable[float]) -> None:
+        """Add many values at once (faster than add() in a loop)."""
+        log, ceil, minimum, log_gamma = math.log, math.ceil, self.MIN_VALUE, self._log_gamma
+        counts = Counter(ceil(log(max(value, minimum)) / log_gamma) for value in values)
+        for bucket, count in counts.items():
+            self.add_bucket(bucket, count)
+
+    def add_bucket(self, bucket: int, count: int) -> None:
+        """Add count values to a bucket by index (e.g. from a stored histogram)."""
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + count
+        self.count += count
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """Add all values of another sketch with the same accuracy."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Can only merge sketches with the same relative accuracy")
+        for bucket, count in other._buckets.items():
+            self._buckets[bucket] = self._buckets.get(bucket, 0) + count
+        self.count += other.count
+
+    def histogram(self) -> Dict[int, int]:
+        """Value count per bucket index (a copy)."""
+        return dict(self._buckets)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate q-quantile (0 <= q <= 1), or None if the sketch is empty."""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen > rank:
+                return self.bucket_value(bucket)
+        return self.bucket_value(max(self._buckets))
+
+    def count_above(self, value: float) -> int:
+        """Approximate number of values greater than value (values in its bucket count as equal)."""
+        bucket = self.bucket_index(value)
+        return sum(count for b, count in self._buckets.items() if b > bucket)
+
+    def to_json(self) -> str:
+        """Serialize the sketch for storage."""
+        return json.dumps({'accuracy': self.relative_accuracy,
+                           'buckets': {str(b): c for b, c in sorted(self._buckets.items())}},
+                          separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, data: Optional[str]) -> 'QuantileSketch':
+        """Restore a sketch serialized with to_json (an empty sketch for None)."""
+        if not data:
+            return cls()
+        state = json.loads(data)
+        sketch = cls(state['accuracy'])
+        for bucket, count in state['buckets'].items():
+            sketch._buckets[int(bucket)] = count
+            sketch.count += count
+        return sketch
+
+
+@dataclass
+class RunStats:
+    """Timing aggregates of one problem's runs (times in milliseconds)."""
+    year: int
+    day: int
+    part: int
+    is_sample: bool = False  # aggregates of the runs on the sample input
+    total_runs: int = 0  # all runs, including failed ones
+    run_count: int = 0  # successful runs; the timing fields cover only these
+    min_ms: Optional[float] = None
+    max_ms: Optional[float] = None
+    sum_ms: float = 0.0
+    sumsq_ms: float = 0.0
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+    best_run_id: Optional[int] = None
+    best_result: Optional[str] = None
+    best_timestamp: Optional[str] = None
+
+    # Column order of the run_stats table
+    COLUMNS = ('year', 'day', 'part', 'is_sample', 'total_runs', 'run_count', 'min_ms', 'max_ms',
+               'sum_ms', 'sumsq_ms', 'sketch', 'best_run_id', 'best_result', 'best_timestamp')
+
+    def add(self, run_id: int, execution_time_ms: float, success: bool,
+            result: Optional[str], timestamp: Any) -> None:
+        """Add a recorded run."""
+        self.total_runs += 1
+        if not success:
+            return
+
+        self.run_count += 1
+        self.sum_ms += execution_time_ms
+        self.sumsq_ms += execution_time_ms * execution_time_ms
+        self.sketch.add(execution_time_ms)
+        self.max_ms = execution_time_ms if self.max_ms is None else max(self.max_ms, execution_time_ms)
+        # The earliest run keeps the record on ties
+        if self.min_ms is None or execution_time_ms < self.min_ms:
+            self.min_ms = execution_time_ms
+            self.best_run_id = run_id
+            self.best_result = result
+            self.best_timestamp = str(timestamp)
+
+    def add_bucket(self, bucket: int, run_count: int, success: bool, sum_ms: float, sumsq_ms: float,
+                   min_ms: float, max_ms: float) -> None:
+        """Add runs that were downsampled into a histogram bucket (see AOCTracker.compact)."""
+        self.total_runs += run_count
+        if not success:
+            return
+
+        self.run_count += run_count
+        self.sum_ms += sum_ms
+        self.sumsq_ms += sumsq_ms
+        self.sketch.add_bucket(bucket, run_count)
+        self.max_ms = max_ms if self.max_ms is None else max(self.max_ms, max_ms)
+        # Compaction keeps the best runs as rows, so buckets only set the minimum
+        # when those rows stopped counting (e.g. after an incorrect submission)
+        if self.min_ms is None or min_ms < self.min_ms:
+            self.min_ms = min_ms
+
+    @property
+    def mean_ms(self) -> Optional[float]:
+        return self.sum_ms / self.run_count if self.run_count else None
+
+    @property
+    def std_dev_ms(self) -> Optional[float]:
+        """Sample standard deviation of the successful run times."""
+        if self.run_count < 2:
+            return 0.0 if self.run_count else None
+        variance = (self.sumsq_ms - self.sum_ms * self.sum_ms / self.run_count) / (self.run_count - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    def to_row(self) -> tuple:
+        """Values for the run_stats columns, in COLUMNS order."""
+        return (self.year, self.day, self.part, self.is_sample, self.total_runs, self.run_count,
+                self.min_ms, self.max_ms, self.sum_ms, self.sumsq_ms, self.sketch.to_json(),
+                self.best_run_id, self.best_result, self.best_timestamp)
+
+    @classmethod
+    def from_row(cls, row: tuple) -> 'RunStats':
+        """Build from a run_stats row selected in COLUMNS order."""
+        values = dict(zip(cls.COLUMNS, row))
+        values['is_sample'] = bool(values['is_sample'])
+        values['sketch'] = QuantileSketch.from_json(values['sketch'])
+        return cls(**values)
@@ -1,10 +1,10 @@
 """
 Solution loading and template creation functionality.
 """
-import importlib.util
 from pathlib import Path
 from typing import Any
 from .input_handler import InputHandler, is_input_available
+from .module_registry import get_module_registry
 from .year_config import is_last_day, get_expected_parts
 
 
@@ -28,13 +28,7 @@ class SolutionLoader:
         module_path = Path.cwd() / f"{year}" / f"day{day}.py"
 
         try:
-            spec = importlib.util.spec_from_file_location(module_name, module_path)
-            if spec is None or spec.loader is None:
-                raise ImportError(f"Could not load module spec for {module_path}")
-
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            return module
+            return get_module_registry().load(module_name, module_path)
         except (FileNotFoundError, ImportError, AttributeError):
             self.create_solution_file(year, day)
             raise FileNotFoundError(f"Solution file created at {module_path}. Please implement the functions.")
@@ -0,0 +1,167 @@
+"""
+Timed execution of solve functions.
+
+TimedExecutor runs a call with an optional (fractional) time limit and is
+shared by the CLI runner and the benchmark runner. It doesn't rely on signals,
+so it works from any thread and inside worker processes:
+
+- Without a timeout the function is called directly, adding no overhead.
+- The 'thread' backend hands calls to a persistent worker thread. The time is
+  measured inside the worker around the call itself, so the hand-off doesn't
+  show up in the measurement. On timeout the worker is cancelled by raising an
+  exception in it asynchronously and replaced by a fresh one for later calls.
+- The 'process' backend runs every call in a forked child that is killed on
+  timeout and can be memory-limited (see core.isolation).
+"""
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+
+@dataclass
+class TimedCall:
+    """Outcome of a timed call."""
+    result: Any
+    execution_time: float
+    peak_rss: Optional[int] = None  # bytes, process backend only
+
+
+class ExecutionCancelled(BaseException):
+    """Raised inside a timed-out worker to stop it (a BaseException so solutions can't swallow it)."""
+
+
+def _cancel_thread(thread: threading.Thread) -> bool:
+    """Asynchronously raise ExecutionCancelled in a thread. Returns False if not supported."""
+    try:
+        import ctypes
+        set_async_exc = ctypes.pythonapi.PyThreadState_SetAsyncExc
+    except (ImportError, AttributeError):
+        return False
+
+    affected = set_async_exc(ctypes.c_ulong(thread.ident), ctypes.py_object(ExecutionCancelled))
+    if affected > 1:
+        # Should never happen; undo to avoid hitting other threads
+        set_async_exc(ctypes.c_ulong(thread.ident), None)
+        return False
+    return affected == 1
+
+
+class _Worker:
+    """Persistent thread that executes one call at a time."""
+
+    def __init__(self):
+        self._request = None
+        self._outcome = None
+        self._ready = threading.Condition()
+        self._done = threading.Event()
+        self.thread = threading.Thread(target=self._loop, name="timed-executor", daemon=True)
+        self.thread.start()
+
+    def _loop(self) -> None:
+        # A cancellation can also arrive after the call finished, while waiting for the next
+        # request, when the timeout expired just as the call returned; it ends the worker either way
+        try:
+            while True:
+                with self._ready:
+                    while self._request is None:
+                        self._ready.wait()
+                    func, arg = self._request
+                    self._request = None
+
+                try:
+                    start_time = time.perf_counter()
+                    result = func(arg)
+                    elapsed_time = time.perf_counter() - start_time
+                    self._outcome = (True, result, elapsed_time)
+                except ExecutionCancelled:
+                    raise
+                except BaseException as e:
+                    self._outcome = (False, e, None)
+                self._done.set()
+        except ExecutionCancelled:
+            return
+
+    def submit(self, func: Callable[[Any], Any], arg: Any) -> None:
+        self._outcome = None
+        self._done.clear()
+        with self._ready:
+            self._request = (func, arg)
+            self._ready.notify()
+
+    def wait(self, timeout: Optional[float]) -> Optional[tuple]:
+        """Wait for the outcome; None if the timeout expired first."""
+        if not self._done.wait(timeout):
+            return None
+        return self._outcome
+
+
+class TimedExecutor:
+    """Runs solve functions with an optional time limit."""
+
+    BACKENDS = ('thread', 'process')
+
+    def __init__(self, backend: str = 'thread', memory_limit_mb: Optional[int] = None):
+        """
+        Initialize the executor.
+
+        Args:
+            backend: 'thread' (persistent worker thread) or 'process' (forked child per call)
+            memory_limit_mb: Memory limit per call, process backend only
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+        self.backend = backend
+        self.memory_limit_mb = memory_limit_mb
+        self._worker: Optional[_Worker] = None
+        self._lock = threading.Lock()
+
+    def call(self, func: Callable[[Any], Any], arg: Any, timeout: Optional[float] = None) -> TimedCall:
+        """
+        Call func(arg), measuring its execution time.
+
+        Args:
+            func: Function to call
+            arg: Its single argument (the puzzle input)
+            timeout: Time limit in seconds; None or <= 0 for no limit
+
+        Returns:
+            TimedCall with the result and execution time
+
+        Raises:
+            TimeoutError: If the call didn't finish within the timeout
+            Exception: Whatever func raised
+        """
+        if timeout is not None and timeout <= 0:
+            timeout = None
+
+        if self.backend == 'process':
+            from .isolation import run_isolated
+            isolated = run_isolated(func, arg, timeout, self.memory_limit_mb)
+            # Phases recorded in the child are merged into the caller's recorder by run_isolated
+            return TimedCall(isolated.result, isolated.execution_time, isolated.peak_rss)
+
+        if timeout is None:
+            start_time = time.perf_counter()
+            result = func(arg)
+            return TimedCall(result, time.perf_counter() - start_time)
+
+        with self._lock:
+            if self._worker is None:
+                self._worker = _Worker()
+            worker = self._worker
+
+            worker.submit(func, arg)
+            outcome = worker.wait(timeout)
+
+            if outcome is None:
+                # Stop the runaway call; it is abandoned either way and a new worker serves later calls
+                _cancel_thread(worker.thread)
+                self._worker = None
+                raise TimeoutError(f"Solution execution timed out after {timeout} seconds")
+
+        success, value, elapsed_time = outcome
+        if not success:
+            raise value
+        return TimedCall(value, elapsed_time)
+
@@ -1,25 +1,219 @@
 """
 Run tracking and submission management for Advent of Code solutions.
 """
+import atexit
+import os
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-import hashlib
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .puzzle_input import PuzzleInput, hash_text
+from .regressions import VersionComparison
+from .run_stats import QuantileSketch, RunStats
 
 
 class AOCTracker:
-    """Tracks runs, submissions, and performance for Advent of Code solutions."""
+    """
+    Tracks runs, submissions, and performance for Advent of Code solutions.
+
+    The tracker keeps one WAL-mode connection open for its lifetime. Inside a
+    bulk() session record_run only buffers its rows; they are written with
+    executemany in a single transaction when the session ends (or when a query
+    needs to see them), instead of one connect and commit per run.
+
+    Timing aggregates per problem are kept in the run_stats table, updated in
+    the same transaction as the runs they cover (see core.run_stats).
+    """
+
+    # Buffered runs written at once, even inside a bulk session
+    MAX_PENDING_RUNS = 500
+
+    # sqlite3.Connection subclass used for the persistent connection
+    connection_factory = sqlite3.Connection
 
     def __init__(self, db_path: Path = None):
         if db_path is None:
             db_path = Path.cwd() / "aoc_tracking.db"
         self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._bulk_depth = 0
+        # (runs row, phases, counters) tuples waiting to be written
+        self._pending: List[Tuple[tuple, Optional[Dict[str, float]], Optional[Dict[str, float]]]] = []
         self._init_database()
 
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get the persistent connection, opening it on first use."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, factory=self.connection_factory)
+            # WAL lets readers (e.g. --stats in another shell) proceed during writes;
+            # NORMAL sync is durable across application crashes, only not power loss
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+            # Closing the last connection checkpoints the WAL and removes the -wal/-shm files
+            atexit.register(self.close)
+        return self._conn
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Use the persistent connection for one transaction.
+
+        Buffered runs are written first so queries always see them. The
+        transaction is committed on success and rolled back on error.
+        """
+        with self._lock:
+            conn = self._get_connection()
+            if self._pending:
+                self._write_pending(conn)
+            with conn:
+                yield conn
+
+    def _write_pending(self, conn: sqlite3.Connection) -> int:
+        """Write all buffered runs, their phases and counters in a single transaction, returning the last run id."""
+        pending, self._pending = self._pending, []
+        with conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO runs (year, day, part, timestamp, execution_time_ms, 
+                                result, input_hash, code_hash, success, error_message, is_sample,
+                                parse_time_ms)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [row for row, _, _ in pending])
+
+            # The transaction holds the write lock, so the batch got consecutive ids
+            cursor.execute("SELECT last_insert_rowid()")
+            last_id = cursor.fetchone()[0]
+
+            first_id = last_id - len(pending) + 1
+            if any(phases for _, phases, _ in pending):
+                cursor.executemany("""
+                    INSERT INTO run_phases (run_id, name, duration_ms) VALUES (?, ?, ?)
+                """, [(first_id + i, name, seconds * 1000)
+                      for i, (_, phases, _) in enumerate(pending) if phases
+                      for name, seconds in phases.items()])
+
+            if any(counters for _, _, counters in pending):
+                cursor.executemany("""
+                    INSERT INTO run_counters (run_id, event, count) VALUES (?, ?, ?)
+                """, [(first_id + i, event, count)
+                      for i, (_, _, counters) in enumerate(pending) if counters
+                      for event, count in counters.items()])
+
+            self._update_run_stats(cursor, [(first_id + i, row) for i, (row, _, _) in enumerate(pending)])
+
+        return last_id
+
+    def _load_run_stats(self, cursor: sqlite3.Cursor, year: int, day: int, part: int,
+                        is_sample: bool = False) -> RunStats:
+        """Get the stored aggregates of a problem's real or sample runs (empty if it has none yet)."""
+        cursor.execute(f"""
+            SELECT {', '.join(RunStats.COLUMNS)} FROM run_stats
+            WHERE year = ? AND day = ? AND part = ? AND is_sample = ?
+        """, (year, day, part, is_sample))
+        row = cursor.fetchone()
+        return RunStats.from_row(row) if row else RunStats(year, day, part, is_sample)
+
+    def _save_run_stats(self, cursor: sqlite3.Cursor, stats: List[RunStats]) -> None:
+        """Store aggregates, replacing the previous rows of their problems."""
+        cursor.executemany(f"""
+            INSERT OR REPLACE INTO run_stats ({', '.join(RunStats.COLUMNS)})
+            VALUES ({', '.join('?' * len(RunStats.COLUMNS))})
+        """, [s.to_row() for s in stats])
+
+    def _update_run_stats(self, cursor: sqlite3.Cursor, runs: List[Tuple[int, tuple]]) -> None:
+        """Fold newly inserted (run id, runs row) pairs into the aggregates of their problems."""
+        stats: Dict[Tuple[int, int, int, bool], RunStats] = {}
+        for run_id, (year, day, part, timestamp, execution_time_ms, result, _, _,
+                     success, _, is_sample, _) in runs:
+            key = (year, day, part, bool(is_sample))
+            if key not in stats:
+                stats[key] = self._load_run_stats(cursor, *key)
+            stats[key].add(run_id, execution_time_ms, success, result, timestamp)
+        self._save_run_stats(cursor, list(stats.values()))
+
+    def _rebuild_run_stats(self, cursor: sqlite3.Cursor, year: int = None, day: int = None,
+                           part: int = None) -> None:
+        """Recompute aggregates from the run history (rows and compacted buckets), for one problem or all."""
+        problem_clause = ""
+        params = []
+        if year is not None:
+            problem_clause = "AND year = ? AND day = ? AND part = ?"
+            params = [year, day, part]
+
+        cursor.execute(f"DELETE FROM run_stats WHERE 1 {problem_clause}", params)
+        cursor.execute(f"""
+            SELECT id, year, day, part, is_sample, execution_time_ms, success, result, timestamp
+            FROM runs
+            WHERE 1 {problem_clause}
+            ORDER BY id
+        """, params)
+
+        stats: Dict[Tuple[int, int, int, bool], RunStats] = {}
+        for run_id, year, day, part, is_sample, execution_time_ms, success, result, timestamp in cursor.fetchall():
+            key = (year, day, part, bool(is_sample))
+            if key not in stats:
+                stats[key] = RunStats(*key)
+            stats[key].add(run_id, execution_time_ms, success, result, timestamp)
+
+        # Runs downsampled by compact() (never sample runs)
+        cursor.execute(f"""
+            SELECT year, day, part, bucket, run_count, success, sum_ms, sumsq_ms, min_ms, max_ms
+            FROM run_buckets
+            WHERE 1 {problem_clause}
+        """, params)
+        for year, day, part, bucket, run_count, success, sum_ms, sumsq_ms, min_ms, max_ms in cursor.fetchall():
+            key = (year, day, part, False)
+            if key not in stats:
+                stats[key] = RunStats(year, day, part)
+            stats[key].add_bucket(bucket, run_count, success, sum_ms, sumsq_ms, min_ms, max_ms)
+
+        self._save_run_stats(cursor, list(stats.values()))
+
+    @contextmanager
+    def bulk(self) -> Iterator['AOCTracker']:
+        """
+        Buffer record_run calls and write them in one transaction at the end.
+
+        Sessions can be nested; the rows are written when the outermost one
+        exits, including when it exits with an exception.
+
+            with tracker.bulk():
+                for result in results:
+                    tracker.record_run(...)
+        """
+        with self._lock:
+            self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._bulk_depth -= 1
+                if self._bulk_depth == 0:
+                    self.flush()
+
+    def flush(self) -> None:
+        """Write any buffered runs to the database."""
+        with self._lock:
+            if self._pending:
+                self._write_pending(self._get_connection())
+
+    def close(self) -> None:
+        """Write buffered runs and close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self.flush()
+                self._conn.close()
+                self._conn = None
+                atexit.unregister(self.close)
+
     def _init_database(self) -> None:
         """Initialize the SQLite database with required tables."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             # Runs table - tracks each execution
@@ -67,83 +261,312 @@ class AOCTracker:
                 )
             """)
 
+            # Run phases table - per-phase durations recorded by utils.phase_timer
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS run_phases (
+                    run_id INTEGER NOT NULL REFERENCES runs(id),
+                    name TEXT NOT NULL,
+                    duration_ms REAL NOT NULL,
+                    PRIMARY KEY (run_id, name)
+                )
+            """)
+
+            # Run counters table - hardware event counts of benchmark runs (see benchmarking.counters)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS run_counters (
+                    run_id INTEGER NOT NULL REFERENCES runs(id),
+                    event TEXT NOT NULL,
+                    count REAL NOT NULL,
+                    PRIMARY KEY (run_id, event)
+                )
+            """)
+
+            # Run stats table - per-problem timing aggregates (see core.run_stats)
+            # and, in rows of their own, of its sample runs
+            cursor.execute("PRAGMA table_info(run_stats)")
+            run_stats_columns = [column[1] for column in cursor.fetchall()]
+            if run_stats_columns and 'is_sample' not in run_stats_columns:
+                # Migration: Tables from before sample rows are rebuilt below
+                cursor.execute("DROP TABLE run_stats")
+                run_stats_columns = []
+            run_stats_exists = bool(run_stats_columns)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS run_stats (
+                    year INTEGER NOT NULL,
+                    day INTEGER NOT NULL,
+                    part INTEGER NOT NULL,
+                    is_sample BOOLEAN NOT NULL,
+                    total_runs INTEGER NOT NULL,
+                    run_count INTEGER NOT NULL,
+                    min_ms REAL,
+                    max_ms REAL,
+                    sum_ms REAL NOT NULL,
+                    sumsq_ms REAL NOT NULL,
+                    sketch TEXT NOT NULL,
+                    best_run_id INTEGER,
+                    best_result TEXT,
+                    best_timestamp DATETIME,
+                    PRIMARY KEY (year, day, part, is_sample)
+                )
+            """)
+
+            # Run buckets table - old runs downsampled by compact(), one histogram bucket
+            # (of the run_stats sketch) per code version, input, result and outcome
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS run_buckets (
+                    year INTEGER NOT NULL,
+                    day INTEGER NOT NULL,
+                    part INTEGER NOT NULL,
+                    code_hash TEXT NOT NULL,
+                    input_hash TEXT NOT NULL,
+                    result TEXT,
+                    success BOOLEAN NOT NULL,
+                    bucket INTEGER NOT NULL,
+                    run_count INTEGER NOT NULL,
+                    sum_ms REAL NOT NULL,
+                    sumsq_ms REAL NOT NULL,
+                    min_ms REAL NOT NULL,
+                    max_ms REAL NOT NULL,
+                    first_timestamp DATETIME NOT NULL,
+                    last_timestamp DATETIME NOT NULL
+                )
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_run_buckets_problem ON run_buckets (year, day, part)
+            """)
+
             # Migration: Add is_sample column if it doesn't exist
             cursor.execute("PRAGMA table_info(runs)")
             columns = [column[1] for column in cursor.fetchall()]
             if 'is_sample' not in columns:
                 cursor.execute("ALTER TABLE runs ADD COLUMN is_sample BOOLEAN NOT NULL DEFAULT 0")
 
+            # Migration: Add parse_time_ms column (time spent in the solution's parse hook)
+            if 'parse_time_ms' not in columns:
+                cursor.execute("ALTER TABLE runs ADD COLUMN parse_time_ms REAL")
+
+            # Migration: Indexes for the per-problem queries. The first covers the timing
+            # comparisons and summaries without touching the table; the second serves
+            # recent-run history in timestamp order.
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_runs_problem_time
+                ON runs (year, day, part, success, execution_time_ms, is_sample)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_runs_problem_recent
+                ON runs (year, day, part, timestamp)
+            """)
+
+            # Migration: Index for comparing code versions on an input (see core.regressions),
+            # covering their run times
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_runs_problem_version
+                ON runs (year, day, part, input_hash, code_hash, success, is_sample, execution_time_ms)
+            """)
+
+            # Migration: Backfill run_stats from the existing history
+            if not run_stats_exists:
+                self._rebuild_run_stats(cursor)
+
             conn.commit()
 
-    def _hash_content(self, content: str) -> str:
+    def _hash_content(self, content: Union[str, PuzzleInput]) -> str:
         """Create a hash of content for tracking changes."""
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        if isinstance(content, PuzzleInput):
+            # Hashed once per mapped file, straight from the mapping
+            return content.sha256[:16]
+        return hash_text(content)
 
     def record_run(self, year: int, day: int, part: int, execution_time: float,
-                   result: Any, input_data: str, code_content: str,
-                   success: bool, error_message: str = None, is_sample: bool = False) -> int:
-        """Record a solution run in the database."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+                   result: Any, input_data: Union[str, PuzzleInput], code_content: str,
+                   success: bool, error_message: str = None, is_sample: bool = False,
+                   parse_time: float = None, phases: Dict[str, float] = None,
+                   counters: Dict[str, float] = None) -> Optional[int]:
+        """
+        Record a solution run in the database.
 
-            input_hash = self._hash_content(input_data)
-            code_hash = self._hash_content(code_content)
+        execution_time is the run time in seconds, including parse_time, the time
+        spent in the solution's parse hook if it has one. phases maps phase names
+        to seconds, as collected by utils.phase_timer, and counters hardware event
+        names to counts, as collected by benchmarking.counters.
 
-            cursor.execute("""
-                INSERT INTO runs (year, day, part, timestamp, execution_time_ms, 
-                                result, input_hash, code_hash, success, error_message, is_sample)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (year, day, part, datetime.now(), execution_time * 1000,
-                  str(result) if result is not None else None, input_hash,
-                  code_hash, success, error_message, is_sample))
+        Returns the new run's id, or None when the run was buffered by bulk().
+        """
+        row = (year, day, part, datetime.now(), execution_time * 1000,
+               str(result) if result is not None else None, self._hash_content(input_data),
+               self._hash_content(code_content), success, error_message, is_sample,
+               parse_time * 1000 if parse_time is not None else None)
+
+        with self._lock:
+            self._pending.append((row, phases, counters))
+            if self._bulk_depth:
+                if len(self._pending) >= self.MAX_PENDING_RUNS:
+                    self.flush()
+                return None
 
-            return cursor.lastrowid
+            return self._write_pending(self._get_connection())
 
     def get_performance_comparison(self, year: int, day: int, part: int,
                                  current_time: float, code_content: str) -> Optional[Dict]:
-        """Get performance comparison with previous runs."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            code_hash = self._hash_content(code_content)
+        """
+        Get performance comparison with previous runs.
 
-            # Get statistics for this problem (excluding sample runs)
-            cursor.execute("""
-                SELECT MIN(execution_time_ms), AVG(execution_time_ms), COUNT(*) 
-                FROM runs 
-                WHERE year = ? AND day = ? AND part = ? AND success = 1 AND is_sample = 0
+        Reads the problem's run_stats row; the percentile (share of previous
+        runs slower than current_time, in ms) comes from its quantile sketch.
+        """
+        stats = self.get_problem_stats(year, day, part)
+        if stats is None or not stats.run_count:
+            return None
+
+        return {
+            'is_best': current_time <= stats.min_ms,
+            'percentile': stats.sketch.count_above(current_time) / stats.run_count * 100,
+            'avg_time': stats.mean_ms,
+            'best_time': stats.min_ms,
+            'run_count': stats.run_count
+        }
+
+    def get_problem_stats(self, year: int, day: int, part: int) -> Optional[RunStats]:
+        """Get the timing aggregates of a problem's (non-sample) runs, or None if it has no runs."""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {', '.join(RunStats.COLUMNS)} FROM run_stats
+                WHERE year = ? AND day = ? AND part = ? AND is_sample = 0
             """, (year, day, part))
+            row = cursor.fetchone()
+            return RunStats.from_row(row) if row else None
+
+    def _version_times(self, cursor: sqlite3.Cursor, year: int, day: int, part: int,
+                       input_hash: str, code_hash: str) -> QuantileSketch:
+        """Successful run times of one code version on one input, including compacted runs."""
+        sketch = QuantileSketch()
+        cursor.execute("""
+            SELECT execution_time_ms FROM runs
+            WHERE year = ? AND day = ? AND part = ? AND input_hash = ? AND code_hash = ?
+                  AND success = 1 AND is_sample = 0
+        """, (year, day, part, input_hash, code_hash))
+        sketch.add_all(execution_time_ms for (execution_time_ms,) in cursor.fetchall())
+
+        cursor.execute("""
+            SELECT bucket, SUM(run_count) FROM run_buckets
+            WHERE year = ? AND day = ? AND part = ? AND input_hash = ? AND code_hash = ? AND success = 1
+            GROUP BY bucket
+        """, (year, day, part, input_hash, code_hash))
+        for bucket, run_count in cursor.fetchall():
+            sketch.add_bucket(bucket, run_count)
+        return sketch
+
+    def _compare_versions(self, cursor: sqlite3.Cursor, year: int, day: int, part: int,
+                          input_hash: str, code_hash: str) -> Optional[VersionComparison]:
+        """Compare a code version with the previous one on an input (None if there is none)."""
+        # The previous version is the other version with the latest run on this input
+        cursor.execute("""
+            SELECT code_hash, MAX(id) as last_run_id FROM runs
+            WHERE year = ? AND day = ? AND part = ? AND input_hash = ? AND code_hash != ?
+                  AND success = 1 AND is_sample = 0
+            GROUP BY code_hash
+            ORDER BY last_run_id DESC
+            LIMIT 1
+        """, (year, day, part, input_hash, code_hash))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+
+        previous_code_hash = row[0]
+        return VersionComparison(
+            year=year, day=day, part=part, input_hash=input_hash,
+            code_hash=code_hash, previous_code_hash=previous_code_hash,
+            current=self._version_times(cursor, year, day, part, input_hash, code_hash),
+            previous=self._version_times(cursor, year, day, part, input_hash, previous_code_hash)
+        )
+
+    def get_version_comparison(self, year: int, day: int, part: int, code_content: str,
+                               input_data: Union[str, PuzzleInput],
+                               current_time: float = None) -> Optional[VersionComparison]:
+        """
+        Compare the run times of a code version with the version run before it, on the same input.
 
-            stats_result = cursor.fetchone()
-            if not stats_result or stats_result[0] is None:
-                return None
+        current_time (in ms) is counted as one more run of code_content, so a
+        run can be checked before it is recorded. Returns None if no other
+        version has successful runs on this input.
+        """
+        with self._connect() as conn:
+            comparison = self._compare_versions(conn.cursor(), year, day, part,
+                                                self._hash_content(input_data),
+                                                self._hash_content(code_content))
+        if comparison is not None and current_time is not None:
+            comparison.current.add(current_time)
+        return comparison
+
+    def get_version_comparisons(self, year: int = None) -> List[VersionComparison]:
+        """
+        Compare every problem's current code version with its previous one.
 
-            best_time, avg_time, run_count = stats_result
+        A problem's latest successful run decides its current code version and
+        input. Problems with a single version on that input are left out.
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
 
-            # Check if current time is the best
-            is_best = current_time <= best_time
+            where_clause = "WHERE run_count > 0 AND is_sample = 0"
+            params = []
+            if year:
+                where_clause += " AND year = ?"
+                params.append(year)
+            cursor.execute(f"""
+                SELECT year, day, part FROM run_stats
+                {where_clause}
+                ORDER BY year DESC, day, part
+            """, params)
 
-            # Calculate percentile (how many runs were slower than current)
-            cursor.execute("""
-                SELECT COUNT(*) 
-                FROM runs 
-                WHERE year = ? AND day = ? AND part = ? AND success = 1 AND is_sample = 0 AND execution_time_ms > ?
-            """, (year, day, part, current_time))
+            comparisons = []
+            for problem_year, day, part in cursor.fetchall():
+                cursor.execute("""
+                    SELECT input_hash, code_hash FROM runs
+                    WHERE year = ? AND day = ? AND part = ? AND success = 1 AND is_sample = 0
+                    ORDER BY timestamp DESC
+                    LIMIT 1
+                """, (problem_year, day, part))
+                latest = cursor.fetchone()
+                if latest is None:
+                    continue
+                comparison = self._compare_versions(cursor, problem_year, day, part, *latest)
+                if comparison is not None:
+                    comparisons.append(comparison)
+            return comparisons
+
+    def get_cached_result(self, year: int, day: int, part: int, code_content: str,
+                          input_data: Union[str, PuzzleInput]) -> Optional[Dict]:
+        """
+        Get the result of the latest successful run of this exact code on this exact input.
 
-            slower_count = cursor.fetchone()[0]
-            percentile = (slower_count / run_count * 100) if run_count > 0 else 0
+        Runs are matched by code and input hash, so the result is only reused
+        while neither changed. Returns None if there is no such run.
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT id, result, execution_time_ms, timestamp FROM runs
+                WHERE year = ? AND day = ? AND part = ? AND input_hash = ? AND code_hash = ?
+                      AND success = 1 AND is_sample = 0
+                ORDER BY id DESC
+                LIMIT 1
+            """, (year, day, part, self._hash_content(input_data), self._hash_content(code_content)))
+            row = cursor.fetchone()
+            if row is None:
+                return None
 
             return {
-                'is_best': is_best,
-                'percentile': percentile,
-                'avg_time': avg_time,
-                'best_time': best_time,
-                'run_count': run_count
+                'run_id': row[0],
+                'result': row[1],
+                'execution_time_ms': row[2],
+                'timestamp': row[3]
             }
 
     def can_submit(self, year: int, day: int, part: int) -> Tuple[bool, Optional[datetime]]:
         """Check if we can submit for this problem (respects timeout after wrong answers)."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -161,7 +584,7 @@ class AOCTracker:
                          status: str, response_message: str = None,
                          wait_minutes: int = None) -> None:
         """Record a submission attempt."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             wait_until = None
@@ -187,6 +610,14 @@ class AOCTracker:
                     SET success = 1 
                     WHERE year = ? AND day = ? AND part = ? AND result = ? AND success = 0
                 """, (year, day, part, answer))
+                changed = cursor.rowcount
+                cursor.execute("""
+                    UPDATE run_buckets 
+                    SET success = 1 
+                    WHERE year = ? AND day = ? AND part = ? AND result = ? AND success = 0
+                """, (year, day, part, answer))
+                if changed + cursor.rowcount > 0:
+                    self._rebuild_run_stats(cursor, year, day, part)
             
             # If incorrect, mark runs with the same result as unsuccessful
             elif status == 'incorrect':
@@ -195,12 +626,20 @@ class AOCTracker:
                     SET success = 0 
                     WHERE year = ? AND day = ? AND part = ? AND result = ?
                 """, (year, day, part, answer))
+                changed = cursor.rowcount
+                cursor.execute("""
+                    UPDATE run_buckets 
+                    SET success = 0 
+                    WHERE year = ? AND day = ? AND part = ? AND result = ?
+                """, (year, day, part, answer))
+                if changed + cursor.rowcount > 0:
+                    self._rebuild_run_stats(cursor, year, day, part)
 
             conn.commit()
 
     def get_correct_answer(self, year: int, day: int, part: int) -> Optional[str]:
         """Get the known correct answer for this problem."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT answer FROM correct_answers 
@@ -212,7 +651,7 @@ class AOCTracker:
 
     def has_been_submitted(self, year: int, day: int, part: int, answer: str) -> bool:
         """Check if this exact answer has been submitted before."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT 1 FROM submissions 
@@ -223,7 +662,7 @@ class AOCTracker:
 
     def get_run_history(self, year: int, day: int, part: int, limit: int = 10) -> List[Dict]:
         """Get recent run history for a problem (excluding sample runs)."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT timestamp, execution_time_ms, result, success, error_message
@@ -244,48 +683,97 @@ class AOCTracker:
                 for row in cursor.fetchall()
             ]
 
+    def get_recent_runs(self, year: int, day: int, part: int = None, limit: int = 10) -> List[Dict]:
+        """
+        Get recent runs for a problem (excluding sample runs), newest first.
+
+        Each run includes its parse time, recorded phase durations (in ms) and
+        hardware event counts (of benchmark runs with counters).
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+
+            # Filtering on part only when given keeps the (year, day, part, timestamp) index usable
+            where_clause = "WHERE year = ? AND day = ? AND is_sample = 0"
+            params = [year, day]
+            if part is not None:
+                where_clause += " AND part = ?"
+                params.append(part)
+            params.append(limit)
+
+            cursor.execute(f"""
+                SELECT id, part, timestamp, execution_time_ms, result, success, error_message, parse_time_ms
+                FROM runs 
+                {where_clause}
+                ORDER BY timestamp DESC 
+                LIMIT ?
+            """, params)
+
+            runs = [
+                {
+                    'id': row[0],
+                    'part': row[1],
+                    'timestamp': row[2],
+                    'execution_time_ms': row[3],
+                    'result': row[4],
+                    'success': bool(row[5]),
+                    'error_message': row[6],
+                    'parse_time_ms': row[7],
+                    'phases': {},
+                    'counters': {}
+                }
+                for row in cursor.fetchall()
+            ]
+            if not runs:
+                return runs
+
+            by_id = {run['id']: run for run in runs}
+            placeholders = ",".join("?" * len(by_id))
+            cursor.execute(f"""
+                SELECT run_id, name, duration_ms FROM run_phases
+                WHERE run_id IN ({placeholders})
+                ORDER BY rowid
+            """, list(by_id))
+            for run_id, name, duration_ms in cursor.fetchall():
+                by_id[run_id]['phases'][name] = duration_ms
+
+            cursor.execute(f"""
+                SELECT run_id, event, count FROM run_counters
+                WHERE run_id IN ({placeholders})
+                ORDER BY rowid
+            """, list(by_id))
+            for run_id, event, count in cursor.fetchall():
+                by_id[run_id]['counters'][event] = count
+
+            return runs
+
     def get_best_times_by_year(self, year: int = None) -> List[Dict]:
-        """Get best execution times for each day/part, optionally filtered by year."""
-        with sqlite3.connect(self.db_path) as conn:
+        """
+        Get best execution times for each day/part, optionally filtered by year.
+
+        Reads the per-problem run_stats, so compacted history still counts;
+        when several runs tie for the best time, the earliest of them provides
+        the result and timestamp.
+        """
+        with self._connect() as conn:
             cursor = conn.cursor()
 
-            where_clause = "WHERE success = 1 AND is_sample = 0"
+            where_clause = "WHERE run_count > 0 AND is_sample = 0"
             params = []
             if year:
                 where_clause += " AND year = ?"
                 params.append(year)
 
             cursor.execute(f"""
-                WITH best_runs AS (
-                    SELECT 
-                        year, day, part,
-                        MIN(execution_time_ms) as best_time_ms
-                    FROM runs 
-                    {where_clause}
-                    GROUP BY year, day, part
-                )
                 SELECT 
-                    br.year, br.day, br.part,
-                    br.best_time_ms,
-                    COUNT(r.id) as total_runs,
-                    r.result,
-                    r.timestamp as best_run_timestamp
-                FROM best_runs br
-                JOIN runs r ON (
-                    r.year = br.year AND 
-                    r.day = br.day AND 
-                    r.part = br.part AND 
-                    r.execution_time_ms = br.best_time_ms AND
-                    r.success = 1
-                )
-                LEFT JOIN runs r2 ON (
-                    r2.year = br.year AND 
-                    r2.day = br.day AND 
-                    r2.part = br.part AND 
-                    r2.success = 1
-                )
-                GROUP BY br.year, br.day, br.part, r.result, r.timestamp
-                ORDER BY br.year DESC, br.day ASC, br.part ASC
+                    year, day, part,
+                    min_ms as best_time_ms,
+                    run_count as total_runs,
+                    best_result,
+                    best_timestamp as best_run_timestamp
+                FROM run_stats 
+                {where_clause}
+                ORDER BY year DESC, day ASC, part ASC
             """, params)
 
             return [
@@ -301,9 +789,30 @@ class AOCTracker:
                 for row in cursor.fetchall()
             ]
 
-    def get_year_summary(self, year: int = None) -> Dict:
-        """Get summary statistics for a year or all years."""
-        with sqlite3.connect(self.db_path) as conn:
+    @staticmethod
+    def _format_year_summary(total_solved: int, total_runs: int, successful_runs: int,
+                             fastest: Optional[float], slowest: Optional[float], sum_ms: float,
+                             stars: int) -> Dict:
+        """Build a summary dict from summed run_stats columns and a star count."""
+        return {
+            'total_solved': total_solved,
+            'total_runs': total_runs,
+            'successful_runs': successful_runs,
+            'success_rate': (successful_runs / total_runs * 100) if total_runs > 0 else 0,
+            'fastest_time_ms': fastest if fastest else 0,
+            'slowest_time_ms': slowest if slowest else 0,
+            'average_time_ms': sum_ms / successful_runs if successful_runs and sum_ms else 0,
+            'stars': stars
+        }
+
+    def get_year_summaries(self, year: int = None) -> Dict[Optional[int], Dict]:
+        """
+        Get the summary statistics of every year (or only year) in one grouped pass.
+
+        Returns a get_year_summary() dict per year, newest first, and the
+        combined summary of the returned years under the key None.
+        """
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             where_clause = ""
@@ -312,68 +821,60 @@ class AOCTracker:
                 where_clause = "WHERE year = ?"
                 params.append(year)
 
-            # Total problems solved
-            additional_where = " AND success = 1"
-            if where_clause:
-                full_where = where_clause + additional_where
-            else:
-                full_where = "WHERE success = 1"
-
-            cursor.execute(f"""
-                SELECT COUNT(DISTINCT year || '-' || day || '-' || part)
-                FROM runs 
-                {full_where}
-            """, params)
-            total_solved = cursor.fetchone()[0]
-
-            # Total runs
-            cursor.execute(f"""
-                SELECT COUNT(*), SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END)
-                FROM runs 
-                {where_clause if where_clause else ""}
-            """, params)
-            total_runs, successful_runs = cursor.fetchone()
-
-            # Best times
-            success_where = " AND success = 1"
-            if where_clause:
-                times_where = where_clause + success_where
-            else:
-                times_where = "WHERE success = 1"
-
             cursor.execute(f"""
                 SELECT 
-                    MIN(execution_time_ms) as fastest,
-                    MAX(execution_time_ms) as slowest,
-                    AVG(execution_time_ms) as average
-                FROM runs 
-                {times_where}
+                    year,
+                    COUNT(DISTINCT CASE WHEN run_count > 0 THEN day || '-' || part END) as total_solved,
+                    SUM(total_runs),
+                    SUM(run_count),
+                    MIN(min_ms) as fastest,
+                    MAX(max_ms) as slowest,
+                    SUM(sum_ms)
+                FROM run_stats 
+                {where_clause}
+                GROUP BY year
             """, params)
-            times = cursor.fetchone()
+            totals = {row[0]: row[1:] for row in cursor.fetchall()}
 
             # Stars (correct submissions)
             cursor.execute(f"""
-                SELECT COUNT(*) FROM correct_answers
-                {where_clause if where_clause else ""}
+                SELECT year, COUNT(*) FROM correct_answers
+                {where_clause}
+                GROUP BY year
             """, params)
-            stars = cursor.fetchone()[0]
+            stars = dict(cursor.fetchall())
+
+        summaries = {}
+        overall = [0, 0, 0, None, None, 0.0, 0]
+        for summary_year in sorted(set(totals) | set(stars), reverse=True):
+            solved, total_runs, successful_runs, fastest, slowest, sum_ms = totals.get(
+                summary_year, (0, 0, 0, None, None, 0.0))
+            year_stars = stars.get(summary_year, 0)
+            summaries[summary_year] = self._format_year_summary(solved, total_runs, successful_runs,
+                                                                fastest, slowest, sum_ms, year_stars)
+
+            overall[0] += solved
+            overall[1] += total_runs
+            overall[2] += successful_runs
+            if fastest is not None:
+                overall[3] = fastest if overall[3] is None else min(overall[3], fastest)
+            if slowest is not None:
+                overall[4] = slowest if overall[4] is None else max(overall[4], slowest)
+            overall[5] += sum_ms or 0.0
+            overall[6] += year_stars
+
+        summaries[None] = self._format_year_summary(*overall)
+        return summaries
 
-            return {
-                'total_solved': total_solved,
-                'total_runs': total_runs,
-                'successful_runs': successful_runs,
-                'success_rate': (successful_runs / total_runs * 100) if total_runs > 0 else 0,
-                'fastest_time_ms': times[0] if times[0] else 0,
-                'slowest_time_ms': times[1] if times[1] else 0,
-                'average_time_ms': times[2] if times[2] else 0,
-                'stars': stars
-            }
+    def get_year_summary(self, year: int = None) -> Dict:
+        """Get summary statistics for a year or all years (from the per-problem run_stats)."""
+        return self.get_year_summaries(year)[None]
 
     def get_available_years(self) -> List[int]:
         """Get all years that have tracked data."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT DISTINCT year FROM runs ORDER BY year DESC")
+            cursor.execute("SELECT DISTINCT year FROM run_stats ORDER BY year DESC")
             return [row[0] for row in cursor.fetchall()]
 
     def get_completion_status(self, year: int) -> Dict[int, Dict[int, bool]]:
@@ -383,7 +884,7 @@ class AOCTracker:
         Returns:
             Dict mapping day -> part -> is_correct (True if correct answer exists, False if only attempted)
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             # Get all correct answers for the year
@@ -393,10 +894,10 @@ class AOCTracker:
             """, (year,))
             correct = {(row[0], row[1]) for row in cursor.fetchall()}
 
-            # Get all attempted parts (with successful runs)
+            # Get all attempted parts (with successful runs, on sample inputs too)
             cursor.execute("""
-                SELECT DISTINCT day, part FROM runs
-                WHERE year = ? AND success = 1
+                SELECT DISTINCT day, part FROM run_stats
+                WHERE year = ? AND run_count > 0
             """, (year,))
             attempted = {(row[0], row[1]) for row in cursor.fetchall()}
 
@@ -424,7 +925,7 @@ class AOCTracker:
         """
         new_answers_count = 0
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
 
             for day, day_data in completed_data.items():
@@ -469,3 +970,123 @@ class AOCTracker:
 
         return new_answers_count
 
+
+    def _database_size(self) -> int:
+        """Size of the database file and its write-ahead log in bytes."""
+        return sum(os.path.getsize(path) for path in (str(self.db_path), f"{self.db_path}-wal")
+                   if os.path.exists(path))
+
+    def compact(self, keep_days: int = 30, keep_latest: int = 100, dry_run: bool = False,
+                vacuum: bool = True) -> Dict:
+        """
+        Downsample old run history into histogram buckets.
+
+        Kept as full rows: runs from the last keep_days, the latest keep_latest
+        runs of every problem, the best successful run of every code version
+        (year, day, part, code_hash) and all sample runs. Every other run is
+        folded into run_buckets, one row per code version, input, result,
+        outcome and run_stats sketch bucket, keeping count, sum, sum of squares,
+        min and max. run_stats is left as it is, so stats and markdown output
+        don't change, and can still be rebuilt from rows and buckets.
+
+        Args:
+            keep_days: Keep every run younger than this many days
+            keep_latest: Keep this many most recent runs per problem
+            dry_run: Only count what would be compacted
+            vacuum: VACUUM the database afterwards to return the freed space
+
+        Returns:
+            Dict with runs_before, runs_removed, buckets (rows in run_buckets
+            afterwards) and size_before / size_after in bytes
+        """
+        size_before = self._database_size()
+        cutoff = datetime.now() - timedelta(days=keep_days)
+        sketch = QuantileSketch()
+
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM runs")
+            runs_before = cursor.fetchone()[0]
+
+            cursor.execute("DROP TABLE IF EXISTS temp.compacted_runs")
+            cursor.execute("""
+                CREATE TEMP TABLE compacted_runs AS
+                SELECT id FROM (
+                    SELECT 
+                        id, timestamp, is_sample,
+                        ROW_NUMBER() OVER (PARTITION BY year, day, part
+                                           ORDER BY timestamp DESC, id DESC) as recency,
+                        CASE WHEN success = 1 THEN
+                            ROW_NUMBER() OVER (PARTITION BY year, day, part, code_hash, success
+                                               ORDER BY execution_time_ms, id)
+                        END as version_rank
+                    FROM runs
+                )
+                WHERE is_sample = 0 AND timestamp < ? AND recency > ?
+                      AND (version_rank IS NULL OR version_rank > 1)
+            """, (cutoff, keep_latest))
+
+            cursor.execute("""
+                SELECT year, day, part, code_hash, input_hash, result, success, execution_time_ms, timestamp
+                FROM runs
+                WHERE id IN (SELECT id FROM compacted_runs)
+            """)
+            removed = cursor.fetchall()
+
+            # Merge into the existing buckets: key -> [count, sum, sumsq, min, max, first, last]
+            buckets: Dict[tuple, list] = {}
+            cursor.execute("""
+                SELECT year, day, part, code_hash, input_hash, result, success, bucket,
+                       run_count, sum_ms, sumsq_ms, min_ms, max_ms, first_timestamp, last_timestamp
+                FROM run_buckets
+            """)
+            for row in cursor.fetchall():
+                key, values = row[:8], list(row[8:])
+                if key in buckets:
+                    current = buckets[key]
+                    values = [current[0] + values[0], current[1] + values[1], current[2] + values[2],
+                              min(current[3], values[3]), max(current[4], values[4]),
+                              min(current[5], values[5]), max(current[6], values[6])]
+                buckets[key] = values
+
+            for year, day, part, code_hash, input_hash, result, success, time_ms, timestamp in removed:
+                key = (year, day, part, code_hash, input_hash, result, success, sketch.bucket_index(time_ms))
+                current = buckets.get(key)
+                if current is None:
+                    buckets[key] = [1, time_ms, time_ms * time_ms, time_ms, time_ms, timestamp, timestamp]
+                else:
+                    current[0] += 1
+                    current[1] += time_ms
+                    current[2] += time_ms * time_ms
+                    current[3] = min(current[3], time_ms)
+                    current[4] = max(current[4], time_ms)
+                    current[5] = min(current[5], timestamp)
+                    current[6] = max(current[6], timestamp)
+
+            if not dry_run and removed:
+                cursor.execute("DELETE FROM run_phases WHERE run_id IN (SELECT id FROM compacted_runs)")
+                cursor.execute("DELETE FROM run_counters WHERE run_id IN (SELECT id FROM compacted_runs)")
+                cursor.execute("DELETE FROM runs WHERE id IN (SELECT id FROM compacted_runs)")
+                cursor.execute("DELETE FROM run_buckets")
+                cursor.executemany("""
+                    INSERT INTO run_buckets (year, day, part, code_hash, input_hash, result, success, bucket,
+                                             run_count, sum_ms, sumsq_ms, min_ms, max_ms,
+                                             first_timestamp, last_timestamp)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, [key + tuple(values) for key, values in buckets.items()])
+
+            cursor.execute("DROP TABLE temp.compacted_runs")
+
+        if vacuum and not dry_run:
+            with self._lock:
+                conn = self._get_connection()
+                conn.execute("VACUUM")
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+        return {
+            'runs_before': runs_before,
+            'runs_removed': len(removed),
+            'buckets': len(buckets),
+            'size_before': size_before,
+            'size_after': self._database_size()
+        }
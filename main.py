@@ -4,35 +4,97 @@ Advent of Code Solution Runner
 
 A streamlined main entry point that coordinates the modular components
 for running, benchmarking, and tracking AOC solutions.
+
+Heavy dependencies (requests, BeautifulSoup, the benchmark runner) are only
+imported on the code paths that need them, so plain solution runs start fast.
+Use --profile-startup to see where startup time goes.
 """
+import sys
+from pathlib import Path
 
-from cli import ArgumentParser, CommandHandlers
-from core import AOCTracker, AOCSubmitter
-from benchmarking import BenchmarkRunner
+from cli.parser import ArgumentParser
 
 
 def main() -> None:
     """Main entry point for the Advent of Code solution runner."""
+    # Startup profiling re-runs the command in a child interpreter
+    from utils.startup_profile import extract_profile_options, profile_startup
+    profile_options, argv = extract_profile_options(sys.argv[1:])
+    if profile_options.profile_startup:
+        sys.exit(profile_startup(argv, top=profile_options.profile_top,
+                                 budget_ms=profile_options.startup_budget))
+    sys.argv[1:] = argv
+
     # Set up argument parsing
     arg_parser = ArgumentParser()
     parser = arg_parser.setup_parser()
     args = parser.parse_args()
 
+    # Get command (if any)
+    command = getattr(args, 'command', None)
+
+    # Forward plain runs to the solution daemon when requested
+    if command is None and args.daemon and args.year is not None and args.day is not None:
+        if args.history or args.animation:
+            print("⚠️  --history and --animation are not supported through the daemon, running locally")
+        else:
+            from core.daemon import run_via_daemon
+            if run_via_daemon(args):
+                return
+            print("⚠️  No solution daemon reachable (start one with 'python main.py serve'), running locally")
+
+    # SERVE command
+    if command == 'serve':
+        from core.daemon import SolutionDaemon, send_daemon_command
+
+        if args.stop:
+            if send_daemon_command('stop') is None:
+                print("No solution daemon is running")
+            else:
+                print("🛑 Solution daemon stopped")
+            return
+
+        if args.status:
+            reply = send_daemon_command('ping')
+            if reply is None:
+                print("No solution daemon is running")
+            else:
+                print(f"🔥 Solution daemon running (pid {reply['pid']}, {reply['modules']} modules loaded, "
+                      f"{reply['hits']} cache hits, {reply['misses']} misses)")
+            return
+
+        SolutionDaemon(port=args.port, tracking=not args.no_tracking).serve_forever()
+        return
+
+    from cli.handlers import CommandHandlers
+    from core.tracker import AOCTracker
+
     # Initialize command handlers
     handlers = CommandHandlers()
 
+    # PREFETCH command
+    if command == 'prefetch':
+        sys.exit(handlers.handle_prefetch(args))
+
+    # EXPORT command
+    if command == 'export':
+        sys.exit(handlers.handle_export(args))
+
+    # TRACKER command
+    if command == 'tracker':
+        sys.exit(handlers.handle_tracker(args))
+
     # Initialize tracking (can be disabled with --no-tracking)
     tracker = None if args.no_tracking else AOCTracker()
 
-    # Get command (if any)
-    command = getattr(args, 'command', None)
-
     # SYNC command
     if command == 'sync':
         if not tracker:
             print("Sync requires tracking to be enabled (remove --no-tracking)")
             return
 
+        from core.submitter import AOCSubmitter
+
         submitter = AOCSubmitter()
         if not submitter.is_configured():
             print("Session cookie is required for syncing. Please add your session cookie to session_cookie.txt")
@@ -43,6 +105,9 @@ def main() -> None:
 
     # BENCHMARK command
     if command == 'benchmark':
+        from benchmarking.runner import BenchmarkRunner
+        from benchmarking.parallel import parse_cpu_list
+
         # Handle full help
         if hasattr(args, 'help_full') and args.help_full:
             handlers.handle_benchmark_help()
@@ -63,22 +128,64 @@ def main() -> None:
         if hasattr(args, 'expected_p2') and args.expected_p2:
             expected_values[2] = args.expected_p2
 
-        runner = BenchmarkRunner(tracker=benchmark_tracker, publish_to_db=publish, expected_values=expected_values)
+        # Adaptive run counts replace --runs and --warmup
+        adaptive = None
+        if args.adaptive:
+            from benchmarking.adaptive import AdaptiveSettings
+            adaptive = AdaptiveSettings(target_width=args.ci_width / 100, time_budget=args.time_budget)
+
+        # Hardware counters need Linux and a CPU whose counters the kernel exposes
+        counters = args.counters
+        if counters:
+            from benchmarking.counters import available
+            reason = available()
+            if reason:
+                print(f"⚠️  Hardware counters are unavailable: {reason}")
+                print("   Continuing without counters...")
+                counters = False
+
+        # Per-call times of hot loops would skew the whole-call run history
+        if publish and args.micro:
+            print("⚠️  --micro times are per call and can't be published to the database")
+            print("   Continuing without database publishing...")
+            publish = False
+            benchmark_tracker = None
+
+        runner = BenchmarkRunner(tracker=benchmark_tracker, publish_to_db=publish, expected_values=expected_values,
+                                 adaptive=adaptive, micro=args.micro, counters=counters,
+                                 resource_runs=args.resources)
         results = None
 
         if publish and not tracker:
             print("⚠️  Database publishing requires tracking to be enabled (remove --no-tracking)")
             print("   Continuing without database publishing...")
-            runner = BenchmarkRunner(expected_values=expected_values)
+            runner = BenchmarkRunner(expected_values=expected_values, adaptive=adaptive, micro=args.micro,
+                                     counters=counters, resource_runs=args.resources)
+
+        # Parallel execution options (only used for --all and --year)
+        cpus = None
+        if args.cpus:
+            try:
+                cpus = parse_cpu_list(args.cpus)
+            except ValueError:
+                print(f"❌ Invalid CPU list: {args.cpus}")
+                return
+        parallel_options = {'jobs': args.jobs, 'cpus': cpus, 'pin_cpus': args.pin_cpus}
+
+        # Compare the problems of a saved results file with it; the exit code gates on regressions
+        if args.baseline:
+            sys.exit(handlers.handle_benchmark_baseline(args, runner, parallel_options))
 
         # Determine scope
         if args.all:
             # Benchmark all available solutions
-            results = runner.benchmark_all(runs=args.runs, timeout=args.timeout)
+            results = runner.benchmark_all(runs=args.runs, timeout=args.timeout, **parallel_options)
 
         elif args.year_flag:
             # Benchmark specific year (using --year flag)
-            results = runner.benchmark_year(args.year_flag, runs=args.runs, timeout=args.timeout)
+            year_results = runner.benchmark_year(args.year_flag, runs=args.runs, timeout=args.timeout,
+                                                 **parallel_options)
+            results = {args.year_flag: year_results} if year_results else None
 
         elif args.year and args.day:
             # Benchmark specific day
@@ -94,7 +201,8 @@ def main() -> None:
                 results = {args.year: {args.day: {args.part: stats}}}
             else:
                 # Benchmark full day (both parts)
-                results = {args.year: runner.benchmark_day(args.year, args.day, runs=args.runs, timeout=args.timeout)}
+                results = {args.year: {args.day: runner.benchmark_day(args.year, args.day, runs=args.runs,
+                                                                     timeout=args.timeout)}}
         else:
             print("❌ Benchmark requires specifying scope")
             print("Examples:")
@@ -137,6 +245,15 @@ def main() -> None:
 
         return
 
+    # REGRESSIONS command
+    if command == 'regressions':
+        if not tracker:
+            print("Regression checks require tracking to be enabled (remove --no-tracking)")
+            return
+
+        handlers.handle_regressions(tracker, args.year, show_all=args.all)
+        return
+
     # MARKDOWN command
     if command == 'markdown':
         if not tracker:
@@ -192,8 +309,6 @@ def main() -> None:
         return
 
     # Check if puzzle HTML needs to be downloaded
-    from pathlib import Path
-
     # Check if we need to download puzzle parts
     puzzle_part1_file = Path.cwd() / ".puzzle_html" / str(args.year) / f"day{args.day}" / "part1.txt"
     puzzle_part2_file = Path.cwd() / ".puzzle_html" / str(args.year) / f"day{args.day}" / "part2.txt"
@@ -203,8 +318,15 @@ def main() -> None:
     # 2. Part 1 exists but part 2 doesn't (need to refresh for part 2)
     needs_download = not puzzle_part1_file.exists() or (puzzle_part1_file.exists() and not puzzle_part2_file.exists())
 
+    # Without a session cookie the download is skipped anyway, so don't load the submitter for it
+    if not (Path.cwd() / "session_cookie.txt").exists():
+        needs_download = False
+
     # Initialize submitter only if needed
-    submitter = AOCSubmitter() if (args.submit or needs_download) else None
+    submitter = None
+    if args.submit or needs_download:
+        from core.submitter import AOCSubmitter
+        submitter = AOCSubmitter()
 
     # Download puzzle HTML if needed (silently)
     if needs_download and submitter and submitter.is_configured():
@@ -224,86 +346,8 @@ def main() -> None:
 
     # Get input data
     input_data = handlers.get_input_data(args)
-    is_sample = args.sample or bool(args.sample_input)
-
-    # Print header
-    title = handlers.display.format_title(args.year, args.day, is_sample, args.part)
-    handlers.display.print_header(title)
-
-    total_time = 0.0
-
-    # Determine which parts to run based on availability
-    available_parts = handlers.solution_loader.get_available_parts(module)
-
-    if not available_parts:
-        print(f"❌ No solve_part functions found in the solution file")
-        return
-
-    # Run requested parts
-    parts_to_run = []
-    if args.part is not None:
-        # Specific part requested
-        if args.part in available_parts:
-            parts_to_run = [args.part]
-        else:
-            print(f"❌ Part {args.part} is not available. Available parts: {', '.join(map(str, available_parts))}")
-            return
-    else:
-        # No specific part requested, run all available parts
-        parts_to_run = available_parts
-
-    # Determine timeout setting
-    timeout = None if args.no_timeout else args.timeout
-
-    # Get expected values if provided
-    expected_values = {}
-    if hasattr(args, 'expected') and args.expected:
-        # Single expected value - use for the part being run
-        if args.part:
-            expected_values[args.part] = args.expected
-    if hasattr(args, 'expected_p1') and args.expected_p1:
-        expected_values[1] = args.expected_p1
-    if hasattr(args, 'expected_p2') and args.expected_p2:
-        expected_values[2] = args.expected_p2
-
-    # Check for animation request
-    if args.animation:
-        from core import has_animation, run_animation
-
-        if has_animation(module):
-            print("\n🎬 Running animation...")
-            print("🎮 Press Ctrl+C to stop the animation")
-            print()
-
-            try:
-                speed = 1.0  # Default speed
-                export_gif = args.export_gif if hasattr(args, 'export_gif') else None
-
-                animation = run_animation(module, input_data, speed, export_gif)
-
-                if animation:
-                    print("\n✅ Animation completed!")
-                else:
-                    print("\n❌ Animation failed to run")
-            except KeyboardInterrupt:
-                print("\n🛑 Animation stopped by user")
-            except Exception as e:
-                print(f"\n❌ Animation error: {e}")
-        else:
-            print(f"❌ No animation available for {args.year} Day {args.day}")
-            print("   Animations require the solution file to have a 'create_animation' function")
-        return
-
-    # Run the determined parts
-    for part_num in parts_to_run:
-        expected_value = expected_values.get(part_num)
-        success, elapsed, result = handlers.run_part(module, part_num, input_data, args.year, args.day,
-                                          tracker, submitter, args.submit, is_sample, timeout, expected_value)
-        if success:
-            total_time += elapsed
 
-    # Print footer with total time
-    handlers.display.print_footer(total_time)
+    handlers.handle_run(args, module, input_data, tracker, submitter)
 
 
 if __name__ == "__main__":
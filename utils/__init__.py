@@ -6,13 +6,37 @@ This package contains helper functions for:
 - Statistics generation
 - Output styling
 - Time formatting
+
+Submodules are imported lazily on first attribute access.
 """
 
-from .display import DisplayFormatter
-from .stats import StatsGenerator
-from .time_utils import format_time
-from .markdown_generator import MarkdownGenerator
-from .hardware_info import get_hardware_info, format_hardware_info, format_hardware_info_compact
+from importlib import import_module
+
+_LAZY_IMPORTS = {
+    'DisplayFormatter': '.display',
+    'StatsGenerator': '.stats',
+    'format_time': '.time_utils',
+    'MarkdownGenerator': '.markdown_generator',
+    'get_hardware_info': '.hardware_info',
+    'format_hardware_info': '.hardware_info',
+    'format_hardware_info_compact': '.hardware_info',
+    'ColumnarTable': '.columnar',
+    'open_export': '.columnar'
+}
 
 __all__ = ['DisplayFormatter', 'StatsGenerator', 'format_time', 'MarkdownGenerator',
-           'get_hardware_info', 'format_hardware_info', 'format_hardware_info_compact']
+           'get_hardware_info', 'format_hardware_info', 'format_hardware_info_compact',
+           'ColumnarTable', 'open_export']
+
+
+def __getattr__(name: str):
+    """Import public names on first access so unused dependencies are never loaded."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
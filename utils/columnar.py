@@ -0,0 +1,318 @@
+"""
+Columnar export of tracking data for offline analysis.
+
+`python main.py export` streams the tracker's runs and run phases, and the
+timing samples of saved benchmark results (benchmark --save), into a
+directory with one table per subdirectory: a `.npy` file per column plus a
+`meta.json`. Text columns (hashes, results, error messages, hosts) are
+dictionary encoded as int32 codes, as in Arrow, with -1 for missing values;
+missing numbers and timestamps are NaN and NaT.
+
+ColumnarTable maps the columns read-only, so filtering and aggregating
+millions of rows are NumPy operations that never build a Python object per
+row:
+
+    runs = open_export("tracking_export")['runs']
+    mask = runs.where(year=2025, success=True)
+    mask &= runs['timestamp'] >= np.datetime64('2025-12-01')
+    per_problem = runs.aggregate('execution_time_ms', by=('day', 'part'), where=mask)
+"""
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.tracker import AOCTracker
+from .hardware_info import format_hardware_info_compact
+
+FORMAT_NAME = "aoc-columnar"
+FORMAT_VERSION = 1
+
+# Column name and NumPy dtype per table, in export order; 'dict' marks dictionary-encoded text
+RUNS_COLUMNS = (('id', 'int64'), ('year', 'int16'), ('day', 'int8'), ('part', 'int8'),
+                ('timestamp', 'datetime64[us]'), ('execution_time_ms', 'float64'),
+                ('parse_time_ms', 'float64'), ('success', 'bool'), ('is_sample', 'bool'),
+                ('code_hash', 'dict'), ('input_hash', 'dict'), ('result', 'dict'),
+                ('error_message', 'dict'))
+PHASES_COLUMNS = (('run_id', 'int64'), ('name', 'dict'), ('duration_ms', 'float64'))
+SAMPLES_COLUMNS = (('source', 'dict'), ('host', 'dict'), ('saved_at', 'datetime64[us]'),
+                   ('year', 'int16'), ('day', 'int8'), ('part', 'int8'), ('sample', 'int32'),
+                   ('time_ms', 'float64'))
+
+# Code that matches no value of a dictionary column (-1 is a missing value)
+_NO_MATCH = -2
+
+
+class _TableWriter:
+    """Writes a table of known length chunk by chunk into preallocated .npy files."""
+
+    def __init__(self, directory: Path, columns: Sequence[Tuple[str, str]], rows: int):
+        directory.mkdir(parents=True)
+        self.directory = directory
+        self.columns = columns
+        self.rows = rows
+        self._offset = 0
+        self._arrays = {}
+        self._dictionaries: Dict[str, Dict[str, int]] = {}
+        for name, dtype in columns:
+            if dtype == 'dict':
+                self._dictionaries[name] = {}
+                dtype = 'int32'
+            self._arrays[name] = np.lib.format.open_memmap(directory / f"{name}.npy", mode='w+',
+                                                           dtype=dtype, shape=(rows,))
+
+    def append(self, rows: Sequence[tuple]) -> None:
+        """Write the next rows (tuples in column order)."""
+        if not rows:
+            return
+        end = self._offset + len(rows)
+        for (name, dtype), values in zip(self.columns, zip(*rows)):
+            target = self._arrays[name]
+            if dtype == 'dict':
+                codes = self._dictionaries[name]
+                target[self._offset:end] = [-1 if value is None else codes.setdefault(str(value), len(codes))
+                                            for value in values]
+            else:
+                # None becomes NaN / NaT
+                target[self._offset:end] = np.array(values, dtype=dtype)
+        self._offset = end
+
+    def close(self) -> int:
+        """Flush the columns and write meta.json; returns the number of rows written."""
+        if self._offset != self.rows:
+            raise ValueError(f"{self.directory.name}: wrote {self._offset} of {self.rows} rows")
+        columns = []
+        for name, dtype in self.columns:
+            self._arrays[name].flush()
+            column = {'name': name, 'dtype': dtype}
+            if dtype == 'dict':
+                column['dictionary'] = list(self._dictionaries[name])
+            columns.append(column)
+        self._arrays.clear()
+
+        with open(self.directory / "meta.json", 'w') as f:
+            json.dump({'format': FORMAT_NAME, 'version': FORMAT_VERSION, 'table': self.directory.name,
+                       'rows': self.rows, 'columns': columns}, f)
+        return self.rows
+
+
+def _export_query(conn: sqlite3.Connection, directory: Path, columns: Sequence[Tuple[str, str]],
+                  count_sql: str, select_sql: str, params: Sequence[Any], chunk_rows: int) -> int:
+    """Export the rows of a query in chunks of chunk_rows."""
+    rows = conn.execute(count_sql, params).fetchone()[0]
+    writer = _TableWriter(directory, columns, rows)
+    cursor = conn.execute(select_sql, params)
+    while True:
+        chunk = cursor.fetchmany(chunk_rows)
+        if not chunk:
+            break
+        writer.append(chunk)
+    return writer.close()
+
+
+def _benchmark_samples(path: Path) -> Iterator[tuple]:
+    """Timing samples of a saved benchmark results file, as SAMPLES_COLUMNS rows."""
+    with open(path) as f:
+        saved = json.load(f)
+    hardware = saved.get('hardware')
+    host = format_hardware_info_compact(hardware) if hardware else None
+    saved_at = saved.get('timestamp')
+
+    for year, days in saved.get('results', {}).items():
+        for day, parts in days.items():
+            if 'times' in parts:
+                # Older single-day files saved {year: {part: stats}}; their day is unknown (0)
+                day, parts = 0, {day: parts}
+            for part, stats in parts.items():
+                for sample, seconds in enumerate(stats.get('times') or []):
+                    yield (path.name, host, saved_at, int(year), int(day), int(part), sample, seconds * 1000)
+
+
+def export_tracking_data(db_path: Path, output: Path, benchmark_files: Sequence[Path] = (),
+                         year: int = None, chunk_rows: int = 100_000) -> Dict[str, int]:
+    """
+    Export the tracking database and saved benchmark results to a columnar directory.
+
+    Runs and phases are read in one snapshot and written chunk_rows at a
+    time into memory-mapped files, so only one chunk at a time is held as
+    Python objects.
+
+    Args:
+        db_path: Tracking database
+        output: Directory to create (must not exist)
+        benchmark_files: JSON files written by benchmark --save
+        year: Only export runs (and their phases) of this year
+        chunk_rows: Rows fetched and written at a time
+
+    Returns:
+        Number of rows written per table
+    """
+    if output.exists():
+        raise FileExistsError(f"{output} already exists")
+
+    # Bring an older database up to the current schema first
+    AOCTracker(db_path).close()
+
+    year_clause = "WHERE year = ?" if year else ""
+    params = [year] if year else []
+    counts = {}
+
+    output.mkdir(parents=True)
+    conn = sqlite3.connect(db_path)
+    try:
+        # One read transaction, so the counts match the rows even while runs are recorded
+        conn.execute("BEGIN")
+        counts['runs'] = _export_query(
+            conn, output / "runs", RUNS_COLUMNS,
+            f"SELECT COUNT(*) FROM runs {year_clause}",
+            f"""
+                SELECT {', '.join(name for name, _ in RUNS_COLUMNS)}
+                FROM runs {year_clause}
+                ORDER BY id
+            """, params, chunk_rows)
+        counts['phases'] = _export_query(
+            conn, output / "phases", PHASES_COLUMNS,
+            f"SELECT COUNT(*) FROM run_phases WHERE run_id IN (SELECT id FROM runs {year_clause})",
+            f"""
+                SELECT run_id, name, duration_ms
+                FROM run_phases
+                WHERE run_id IN (SELECT id FROM runs {year_clause})
+                ORDER BY run_id
+            """, params, chunk_rows)
+        conn.rollback()
+    finally:
+        conn.close()
+
+    # Benchmark files are read twice (count, then write) rather than held in memory
+    rows = sum(1 for path in benchmark_files for _ in _benchmark_samples(path))
+    writer = _TableWriter(output / "samples", SAMPLES_COLUMNS, rows)
+    for path in benchmark_files:
+        chunk = []
+        for row in _benchmark_samples(path):
+            chunk.append(row)
+            if len(chunk) == chunk_rows:
+                writer.append(chunk)
+                chunk = []
+        writer.append(chunk)
+    counts['samples'] = writer.close()
+
+    return counts
+
+
+class ColumnarTable:
+    """A table of an export, with its columns memory-mapped on first access."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        with open(self.directory / "meta.json") as f:
+            meta = json.load(f)
+        if meta.get('format') != FORMAT_NAME:
+            raise ValueError(f"{self.directory} is not a columnar tracking export")
+        self.name = meta['table']
+        self.rows = meta['rows']
+        self._meta = {column['name']: column for column in meta['columns']}
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._codes: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._meta)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """A column as a read-only array (int32 codes for dictionary-encoded text)."""
+        if name not in self._arrays:
+            if name not in self._meta:
+                raise KeyError(f"{self.name} has no column {name!r}")
+            self._arrays[name] = np.load(self.directory / f"{name}.npy", mmap_mode='r')
+        return self._arrays[name]
+
+    def is_dictionary(self, name: str) -> bool:
+        return self._meta[name]['dtype'] == 'dict'
+
+    def dictionary(self, name: str) -> List[str]:
+        """The distinct values of a dictionary-encoded column, indexed by code."""
+        return self._meta[name]['dictionary']
+
+    def encode(self, name: str, value: Optional[str]) -> int:
+        """The code of a text value (-1 for None, -2 if the value never occurs)."""
+        if value is None:
+            return -1
+        if name not in self._codes:
+            self._codes[name] = {text: code for code, text in enumerate(self.dictionary(name))}
+        return self._codes[name].get(value, _NO_MATCH)
+
+    def decode(self, name: str, codes: Iterable[int]) -> List[Optional[str]]:
+        """The text values of codes (e.g. the group keys of aggregate())."""
+        dictionary = self.dictionary(name)
+        return [dictionary[code] if code >= 0 else None for code in codes]
+
+    def where(self, mask: Optional[np.ndarray] = None, **equals: Any) -> np.ndarray:
+        """
+        Boolean row mask of column == value conditions (and an optional starting mask).
+
+        A list, tuple or set value matches any of its values. Text values of
+        dictionary-encoded columns are compared by code.
+        """
+        result = np.ones(self.rows, dtype=bool) if mask is None else np.array(mask, dtype=bool)
+        for name, value in equals.items():
+            column = self[name]
+            many = isinstance(value, (list, tuple, set))
+            if self.is_dictionary(name):
+                value = [self.encode(name, v) for v in value] if many else self.encode(name, value)
+            if many:
+                result &= np.isin(column, list(value))
+            else:
+                result &= column == value
+        return result
+
+    def aggregate(self, value: str, by: Sequence[str] = ('year', 'day', 'part'),
+                  where: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Count, min, max, mean and median of a numeric column per group.
+
+        Rows outside the where mask and missing (NaN) values are left out.
+
+        Returns:
+            Arrays with one entry per group, in key order: the `by` columns
+            (codes for dictionary-encoded text) and count, min, max, mean, median
+        """
+        values = self[value]
+        selected = ~np.isnan(values)
+        if where is not None:
+            selected &= where
+        values = values[selected]
+        keys = [self[name][selected] for name in by]
+
+        # Sort by the group keys (the first is the primary key), then by value within a group
+        order = np.lexsort((values, *reversed(keys)))
+        values = values[order]
+        keys = [key[order] for key in keys]
+
+        starts_group = np.zeros(len(values), dtype=bool)
+        if len(values):
+            starts_group[0] = True
+        for key in keys:
+            starts_group[1:] |= key[1:] != key[:-1]
+        starts = np.flatnonzero(starts_group)
+        ends = np.append(starts[1:], len(values)) if len(starts) else starts
+        counts = ends - starts
+
+        result = {name: key[starts] for name, key in zip(by, keys)}
+        result['count'] = counts
+        result['min'] = values[starts]
+        result['max'] = values[ends - 1]
+        result['mean'] = np.add.reduceat(values, starts) / counts if len(starts) else values[:0].astype(float)
+        result['median'] = (values[starts + (counts - 1) // 2] + values[starts + counts // 2]) / 2
+        return result
+
+
+def open_export(path: Path) -> Dict[str, ColumnarTable]:
+    """Open the tables of an export directory by name (runs, phases, samples)."""
+    path = Path(path)
+    return {table.name: ColumnarTable(table) for table in sorted(path.iterdir())
+            if (table / "meta.json").exists()}
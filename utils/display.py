@@ -1,7 +1,7 @@
 """
 Display formatting utilities for console output.
 """
-from typing import Optional, Any
+from typing import Dict, Optional, Any
 
 try:
     from colorama import init, Fore, Style
@@ -52,16 +52,18 @@ class DisplayFormatter:
         return title
 
     def print_part_result(self, part_num: int, result: Any, elapsed_time: float,
-                         tracker=None, year: int = None, day: int = None, code_content: str = "") -> None:
-        """Print the result of running a part."""
+                         tracker=None, year: int = None, day: int = None, code_content: str = "",
+                         peak_memory: int = None) -> None:
+        """Print the result of running a part (peak_memory in bytes, if measured)."""
+        memory_text = f", {peak_memory / (1024 * 1024):.1f} MB peak" if peak_memory is not None else ""
         if self.color_support:
             part_header = f"{Fore.CYAN}{Style.BRIGHT}Part {part_num}:{Style.RESET_ALL}"
             result_text = f"{Fore.GREEN}{Style.BRIGHT}{result}{Style.RESET_ALL}"
-            time_text = f"{Fore.YELLOW}{elapsed_time * 1000:.2f}ms{Style.RESET_ALL}"
+            time_text = f"{Fore.YELLOW}{elapsed_time * 1000:.2f}ms{Style.RESET_ALL}{memory_text}"
         else:
             part_header = f"Part {part_num}:"
             result_text = str(result)
-            time_text = f"{elapsed_time * 1000:.2f}ms"
+            time_text = f"{elapsed_time * 1000:.2f}ms{memory_text}"
 
         print(f"{part_header} {result_text} ({time_text})")
 
@@ -94,6 +96,55 @@ class DisplayFormatter:
                 print(f"    {perf_text}")
                 print(f"    Average: {avg_time_text}, Best: {best_time_text} (from {comparison['run_count']} runs)")
 
+    def print_cached_result(self, part_num: int, cached: Dict[str, Any]) -> None:
+        """Print a result reused from a previous run (see AOCTracker.get_cached_result)."""
+        source_text = (f"cached from a {cached['execution_time_ms']:.2f}ms run "
+                       f"on {str(cached['timestamp'])[:19]}")
+        if self.color_support:
+            part_header = f"{Fore.CYAN}{Style.BRIGHT}Part {part_num}:{Style.RESET_ALL}"
+            result_text = f"{Fore.GREEN}{Style.BRIGHT}{cached['result']}{Style.RESET_ALL}"
+            print(f"{part_header} {result_text} {Fore.MAGENTA}♻️  ({source_text}){Style.RESET_ALL}")
+        else:
+            print(f"Part {part_num}: {cached['result']} ♻️  ({source_text})")
+
+    def print_regression(self, comparison) -> None:
+        """Print a warning that the code version being run is slower than the previous one."""
+        regression_text = (f"🐢 Slower than the previous version: median {comparison.median_ms:.2f}ms "
+                           f"vs {comparison.previous_median_ms:.2f}ms "
+                           f"(+{(comparison.slowdown - 1) * 100:.0f}%, p={comparison.p_value:.2g}, "
+                           f"{comparison.runs} vs {comparison.previous_runs} runs)")
+        if self.color_support:
+            print(f"    {Fore.RED}{regression_text}{Style.RESET_ALL}")
+        else:
+            print(f"    {regression_text}")
+
+    def print_phases(self, phases: Dict[str, float]) -> None:
+        """Print the phase durations (in seconds) recorded during a part."""
+        phase_text = ", ".join(f"{name} {seconds * 1000:.2f}ms" for name, seconds in phases.items())
+        if self.color_support:
+            print(f"    {Fore.BLUE}Phases:{Style.RESET_ALL} {phase_text}")
+        else:
+            print(f"    Phases: {phase_text}")
+
+    def print_parse_result(self, parse_time: float, cached: bool = False) -> None:
+        """Print the time spent in a solution's parse() hook."""
+        status = " (cached)" if cached else ""
+        if self.color_support:
+            parse_header = f"{Fore.CYAN}{Style.BRIGHT}Parse:{Style.RESET_ALL}"
+            time_text = f"{Fore.YELLOW}{parse_time * 1000:.2f}ms{Style.RESET_ALL}{status}"
+        else:
+            parse_header = "Parse:"
+            time_text = f"{parse_time * 1000:.2f}ms{status}"
+
+        print(f"{parse_header} {time_text}")
+
+    def print_parse_error(self, error: Exception) -> None:
+        """Print an error raised by a solution's parse() hook."""
+        if self.color_support:
+            print(f"{Fore.RED}{Style.BRIGHT}Parse Error:{Style.RESET_ALL} {Fore.RED}{str(error)}{Style.RESET_ALL}")
+        else:
+            print(f"Parse Error: {str(error)}")
+
     def print_part_error(self, part_num: int, error: Exception) -> None:
         """Print an error that occurred while running a part."""
         if self.color_support:
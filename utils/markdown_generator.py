@@ -25,9 +25,12 @@ class MarkdownGenerator:
         output.append("| Year | Stars ⭐ | Problems 🧩 | Runs 🏃 | Success Rate | Avg Time ⚡ | Fastest 🚀 | Slowest 🐌 |")
         output.append("|------|----------|-------------|---------|--------------|-------------|------------|------------|")
 
+        # Summaries of all years (and their totals) in one pass
+        summaries = self.tracker.get_year_summaries()
+
         # Collect data for each year
         for year in sorted(available_years, reverse=True):
-            year_summary = self.tracker.get_year_summary(year)
+            year_summary = summaries[year]
 
             output.append(
                 f"| [{year}](./docs/{year}-results.md) | "
@@ -43,7 +46,7 @@ class MarkdownGenerator:
         output.append("")
 
         # Add overall totals
-        overall_summary = self.tracker.get_year_summary()
+        overall_summary = summaries[None]
         output.append("### Overall Totals")
         output.append(f"- ⭐ **Total Stars**: {overall_summary['stars']}")
         output.append(f"- 🧩 **Total Problems Solved**: {overall_summary['total_solved']}")
@@ -189,23 +192,38 @@ class MarkdownGenerator:
         output.append(f"[← Back to {year} Results](../docs/{year}-results.md)")
         output.append("")
 
-        # Get best times for each part
-        best_times = {}
-        part_results = {}
-        for run in history:
-            part = run['part']
-            if run['success']:
-                if part not in best_times or run['execution_time_ms'] < best_times[part]:
-                    best_times[part] = run['execution_time_ms']
-                    part_results[part] = run['result']
-
-        # Summary
+        # Summary of all runs of each part, from the tracker's per-problem aggregates
         output.append("## Summary")
         output.append("")
-        for part in sorted(best_times.keys()):
+        for part in (1, 2):
+            stats = self.tracker.get_problem_stats(year, day, part)
+            if stats is None or not stats.run_count:
+                continue
             output.append(f"### Part {part}")
-            output.append(f"- ⚡ **Best Time**: {format_time(best_times[part])}")
-            output.append(f"- ✅ **Result**: `{part_results[part]}`")
+            output.append(f"- ⚡ **Best Time**: {format_time(stats.min_ms)}")
+            output.append(f"- 📊 **Median Time**: {format_time(stats.sketch.quantile(0.5))} "
+                          f"over {stats.run_count} runs")
+            output.append(f"- ✅ **Result**: `{stats.best_result}`")
+            output.append("")
+
+        # Parse and phase breakdown of the latest successful run of each part
+        breakdowns = {}
+        for run in history:
+            if run['success'] and run['part'] not in breakdowns and (run['phases'] or run['parse_time_ms'] is not None):
+                breakdowns[run['part']] = run
+
+        if breakdowns:
+            output.append("## Phase Breakdown")
+            output.append("")
+            output.append("| Part | Phase | Time |")
+            output.append("|------|-------|------|")
+            for part in sorted(breakdowns):
+                run = breakdowns[part]
+                if run['parse_time_ms'] is not None:
+                    output.append(f"| {part} | parse | {format_time(run['parse_time_ms'])} |")
+                for name, duration in run['phases'].items():
+                    output.append(f"| {part} | {name} | {format_time(duration)} |")
+                output.append(f"| {part} | **total** | {format_time(run['execution_time_ms'])} |")
             output.append("")
 
         # Run History
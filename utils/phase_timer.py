@@ -0,0 +1,104 @@
+"""
+Lightweight phase timing for solutions.
+
+Solutions can mark the phases of their work with `phase`, used either as a
+context manager or as a decorator:
+
+    from utils.phase_timer import phase
+
+    def solve_part_1(input_data):
+        with phase("build graph"):
+            graph = build(input_data)
+        with phase("search"):
+            return search(graph)
+
+    @phase("simulate")
+    def simulate(state): ...
+
+The runner and the benchmark runner collect the phase durations of each run
+with `record_phases()` and store them in the tracker's `run_phases` table.
+Outside a recording (e.g. when a solution module is imported directly) a
+phase only checks a module-level variable and adds no timing overhead.
+Phases with the same name are summed; nested phases are recorded separately
+and are also included in their enclosing phase's time.
+"""
+import functools
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+
+
+class PhaseRecorder:
+    """Accumulates phase durations for a single run."""
+
+    def __init__(self):
+        # name -> total seconds, in order of first use
+        self._phases: Dict[str, float] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add a measured duration to a phase."""
+        self._phases[name] = self._phases.get(name, 0.0) + seconds
+
+    def durations(self) -> Dict[str, float]:
+        """Total seconds per phase, in order of first use."""
+        return dict(self._phases)
+
+    def __bool__(self) -> bool:
+        return bool(self._phases)
+
+
+# Recorder of the run in progress. Module-level rather than thread-local on
+# purpose: the timed executor runs solutions on its own worker thread.
+_active_recorder: Optional[PhaseRecorder] = None
+
+
+@contextmanager
+def record_phases() -> Iterator[PhaseRecorder]:
+    """Collect the phases of the code run inside this block."""
+    global _active_recorder
+    previous = _active_recorder
+    recorder = PhaseRecorder()
+    _active_recorder = recorder
+    try:
+        yield recorder
+    finally:
+        _active_recorder = previous
+
+
+def get_active_recorder() -> Optional[PhaseRecorder]:
+    """Get the recorder of the run in progress, if any."""
+    return _active_recorder
+
+
+class phase:
+    """Time a named phase of a solution (context manager or decorator)."""
+
+    __slots__ = ('name', '_recorder', '_start')
+
+    def __init__(self, name: str):
+        self.name = name
+        self._recorder = None
+        self._start = 0.0
+
+    def __enter__(self) -> 'phase':
+        self._recorder = _active_recorder
+        if self._recorder is not None:
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if self._recorder is not None:
+            self._recorder.add(self.name, time.perf_counter() - self._start)
+            self._recorder = None
+        return False
+
+    def __call__(self, func: Callable) -> Callable:
+        name = self.name
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # A fresh phase per call keeps the decorated function reentrant
+            with phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper
@@ -0,0 +1,418 @@
+"""
+Query plan audit and query benchmarks for the tracking database.
+
+The audit builds a synthetic tracking database (a million runs by default),
+calls every AOCTracker query method against it while recording the SQL they
+execute, and checks each statement's `EXPLAIN QUERY PLAN`: per-problem queries
+must search the `runs`, `run_phases` and `run_counters` tables through an
+index, and whole-history queries may at most scan an index, never the table
+itself.
+
+The best-times benchmark compares get_best_times_by_year against the previous
+self-join query on a synthetic database with many runs per problem, checking
+that both return the same rows.
+
+    python main.py tracker audit
+    python main.py tracker audit --rows 200000
+    python main.py tracker bench-best-times
+"""
+import random
+import re
+import sqlite3
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from core.tracker import AOCTracker
+
+
+# Tables that grow with every run; the audit rules apply to these
+LARGE_TABLES = ('runs', 'run_phases', 'run_counters')
+
+# Statements worth planning; inserts of literal rows and schema changes aren't
+_PLANNED_STATEMENT = re.compile(r'^\s*(SELECT|WITH|UPDATE|DELETE|INSERT\s+.*\bSELECT\b)', re.IGNORECASE | re.DOTALL)
+_TABLE_REFERENCE = re.compile(r'\b(?:FROM|JOIN|UPDATE)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?', re.IGNORECASE)
+_SCAN = re.compile(r'^SCAN (?:TABLE )?(\w+)(?: AS (\w+))?(.*)$')
+_SQL_KEYWORDS = {'where', 'on', 'join', 'left', 'inner', 'group', 'order', 'limit', 'set', 'using', 'natural'}
+
+
+class _RecordingCursor(sqlite3.Cursor):
+    """Cursor that records the statements it executes on its connection."""
+
+    def execute(self, sql, parameters=()):
+        self.connection.statements.append((sql, tuple(parameters)))
+        return super().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        seq_of_parameters = list(seq_of_parameters)
+        if seq_of_parameters:
+            self.connection.statements.append((sql, tuple(seq_of_parameters[0])))
+        return super().executemany(sql, seq_of_parameters)
+
+
+class _RecordingConnection(sqlite3.Connection):
+    """Connection whose statements are recorded for planning."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.statements: List[Tuple[str, tuple]] = []
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or _RecordingCursor)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+
+class _AuditTracker(AOCTracker):
+    connection_factory = _RecordingConnection
+
+
+@dataclass
+class PlannedStatement:
+    """A statement run by a tracker method and its query plan."""
+    sql: str
+    plan: List[str]
+    problems: List[str] = field(default_factory=list)
+
+
+@dataclass
+class AuditEntry:
+    """Audit outcome for a single tracker call."""
+    label: str
+    whole_history: bool
+    elapsed: float  # seconds for the call on the synthetic database
+    statements: List[PlannedStatement]
+
+    @property
+    def passed(self) -> bool:
+        return not any(statement.problems for statement in self.statements)
+
+
+def build_synthetic_database(db_path: Path, rows: int, seed: int = 2015,
+                             years: Sequence[int] = range(2015, 2026)) -> None:
+    """
+    Fill a new tracking database with synthetic benchmark runs.
+
+    Runs are spread evenly over every day and part of the given years, roughly 5%
+    fail, every tenth run has phase timings, and half of the problems have a
+    correct answer and submissions. The tracker's indexes and run_stats are
+    built by its own migration after loading, as on an existing database.
+    """
+    rng = random.Random(seed)
+    AOCTracker(db_path).close()
+
+    # Loading without the indexes and letting the tracker's migration rebuild them is much
+    # faster; the migration also backfills run_stats from the loaded runs
+    with sqlite3.connect(db_path) as conn:
+        indexes = conn.execute("""
+            SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'runs' AND sql IS NOT NULL
+        """).fetchall()
+        for (name,) in indexes:
+            conn.execute(f"DROP INDEX {name}")
+        conn.execute("DROP TABLE run_stats")
+
+    problems = [(year, day, part) for year in years for day in range(1, 26) for part in (1, 2)]
+    base_times = {problem: rng.uniform(0.05, 500.0) for problem in problems}
+    start = datetime(2024, 1, 1)
+
+    with sqlite3.connect(db_path) as conn:
+        chunk = []
+        phases = []
+        for i in range(rows):
+            year, day, part = problem = problems[i % len(problems)]
+            success = rng.random() > 0.05
+            chunk.append((i + 1, year, day, part, start + timedelta(seconds=i),
+                          base_times[problem] * rng.lognormvariate(0, 0.2),
+                          f"{year}{day:02d}{part}" if success else None,
+                          f"{year}-{day}", f"code-{i % 7}", success,
+                          None if success else "Synthetic failure", False, None))
+            if i % 10 == 0:
+                phases.append((i + 1, "parse", rng.uniform(0.01, 5.0)))
+                phases.append((i + 1, "solve", rng.uniform(0.01, 50.0)))
+
+            if len(chunk) == 50_000 or i == rows - 1:
+                conn.executemany("""
+                    INSERT INTO runs (id, year, day, part, timestamp, execution_time_ms, result,
+                                      input_hash, code_hash, success, error_message, is_sample, parse_time_ms)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, chunk)
+                conn.executemany("INSERT INTO run_phases (run_id, name, duration_ms) VALUES (?, ?, ?)", phases)
+                chunk, phases = [], []
+
+        for year, day, part in problems[::2]:
+            answer = f"{year}{day:02d}{part}"
+            conn.execute("INSERT INTO correct_answers (year, day, part, answer) VALUES (?, ?, ?, ?)",
+                         (year, day, part, answer))
+            conn.execute("""
+                INSERT INTO submissions (year, day, part, timestamp, answer, status, response_message, wait_until)
+                VALUES (?, ?, ?, ?, ?, 'correct', NULL, NULL)
+            """, (year, day, part, start, answer))
+
+    AOCTracker(db_path).close()
+
+
+def _table_aliases(sql: str) -> dict:
+    """Map the names a statement uses for the large tables (including aliases) to the table."""
+    aliases = {}
+    for table, alias in _TABLE_REFERENCE.findall(sql):
+        if table.lower() in LARGE_TABLES:
+            aliases[table.lower()] = table.lower()
+            if alias and alias.lower() not in _SQL_KEYWORDS:
+                aliases[alias.lower()] = table.lower()
+    return aliases
+
+
+def check_plan(sql: str, plan: List[str], whole_history: bool) -> List[str]:
+    """
+    Check a query plan against the audit rules.
+
+    Returns:
+        Descriptions of the rule violations (empty if the plan is fine)
+    """
+    aliases = _table_aliases(sql)
+    problems = []
+    for detail in plan:
+        match = _SCAN.match(detail)
+        if not match:
+            continue
+        name = (match.group(2) or match.group(1)).lower()
+        table = aliases.get(name) or aliases.get(match.group(1).lower())
+        if table is None:
+            continue  # CTEs, subqueries and small tables
+
+        uses_index = 'USING' in match.group(3) and 'INDEX' in match.group(3)
+        if not uses_index:
+            problems.append(f"full table scan of {table}")
+        elif not whole_history:
+            problems.append(f"full index scan of {table} in a per-problem query")
+    return problems
+
+
+def _tracker_calls() -> List[Tuple[str, bool, Callable[[AOCTracker], Any]]]:
+    """Every tracker query method as (label, reads whole history, call)."""
+    return [
+        ("get_performance_comparison", False,
+         lambda t: t.get_performance_comparison(2025, 1, 1, 10.0, "code-1")),
+        ("get_problem_stats", False, lambda t: t.get_problem_stats(2025, 1, 1)),
+        ("get_version_comparison", False,
+         lambda t: t.get_version_comparison(2025, 1, 1, "code", "input", 10.0)),
+        ("get_cached_result", False, lambda t: t.get_cached_result(2025, 1, 1, "code", "input")),
+        ("record_run", False,
+         lambda t: t.record_run(2025, 1, 1, 0.01, "2025011", "input", "code", True, phases={'solve': 0.01})),
+        ("get_run_history", False, lambda t: t.get_run_history(2025, 1, 1)),
+        ("get_recent_runs (part)", False, lambda t: t.get_recent_runs(2025, 1, 1)),
+        ("get_recent_runs (both parts)", False, lambda t: t.get_recent_runs(2025, 1, None, limit=100)),
+        ("get_best_times_by_year (year)", False, lambda t: t.get_best_times_by_year(2025)),
+        ("get_year_summary (year)", False, lambda t: t.get_year_summary(2025)),
+        ("get_completion_status", False, lambda t: t.get_completion_status(2025)),
+        ("get_correct_answer", False, lambda t: t.get_correct_answer(2025, 1, 1)),
+        ("has_been_submitted", False, lambda t: t.has_been_submitted(2025, 1, 1, "123")),
+        ("can_submit", False, lambda t: t.can_submit(2025, 1, 1)),
+        ("record_submission", False,
+         lambda t: t.record_submission(2025, 2, 1, "wrong", 'incorrect', "Synthetic", wait_minutes=1)),
+        ("sync_completed_problems", False,
+         lambda t: t.sync_completed_problems(2025, {3: {'completed_parts': [1], 'answers': {1: "42"}}})),
+        ("get_best_times_by_year (all)", True, lambda t: t.get_best_times_by_year()),
+        ("get_year_summary (all)", True, lambda t: t.get_year_summary()),
+        ("get_year_summaries", True, lambda t: t.get_year_summaries()),
+        ("get_available_years", True, lambda t: t.get_available_years()),
+        ("get_version_comparisons", True, lambda t: t.get_version_comparisons()),
+    ]
+
+
+def audit_tracker_queries(db_path: Path) -> List[AuditEntry]:
+    """
+    Run every tracker query against a database and plan the statements it executes.
+
+    The database is modified (submissions are recorded), so only audit a
+    synthetic database or a copy.
+    """
+    tracker = _AuditTracker(db_path)
+    conn = tracker._get_connection()
+    entries = []
+
+    try:
+        for label, whole_history, call in _tracker_calls():
+            conn.statements.clear()
+            start = time.perf_counter()
+            call(tracker)
+            elapsed = time.perf_counter() - start
+
+            statements = []
+            seen = set()
+            for sql, parameters in list(conn.statements):
+                if sql in seen or not _PLANNED_STATEMENT.match(sql):
+                    continue
+                seen.add(sql)
+                rows = sqlite3.Connection.execute(conn, f"EXPLAIN QUERY PLAN {sql}", parameters).fetchall()
+                plan = [row[3] for row in rows]
+                statements.append(PlannedStatement(" ".join(sql.split()), plan,
+                                                   check_plan(sql, plan, whole_history)))
+            entries.append(AuditEntry(label, whole_history, elapsed, statements))
+    finally:
+        tracker.close()
+
+    return entries
+
+
+def run_query_audit(rows: int = 1_000_000, db_path: Path = None, verbose: bool = False) -> int:
+    """
+    Build a synthetic database and audit the tracker's query plans against it.
+
+    Args:
+        rows: Number of synthetic runs
+        db_path: Where to build the database (default: a temporary file, removed afterwards)
+        verbose: Print the SQL and full plan of every statement
+
+    Returns:
+        Process exit code: 1 if any query violates the audit rules, else 0
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if db_path is None:
+            db_path = Path(temp_dir) / "audit_tracking.db"
+        elif db_path.exists():
+            print(f"❌ {db_path} already exists; the audit needs a new file to fill with synthetic data")
+            return 1
+
+        print(f"🔧 Building synthetic tracking database with {rows:,} runs...")
+        start = time.perf_counter()
+        build_synthetic_database(db_path, rows)
+        print(f"   Built in {time.perf_counter() - start:.1f}s")
+
+        entries = audit_tracker_queries(db_path)
+
+    print(f"\n🔎 Tracker query plan audit ({rows:,} runs)")
+    print("=" * 60)
+    for entry in entries:
+        status = "✅" if entry.passed else "❌"
+        scope = " [whole history]" if entry.whole_history else ""
+        print(f"{status} {entry.label:<32} {entry.elapsed * 1000:9.2f}ms{scope}")
+        for statement in entry.statements:
+            if verbose:
+                print(f"     {statement.sql}")
+            for detail in statement.plan:
+                if verbose or statement.problems or detail.startswith(("SCAN", "SEARCH")):
+                    print(f"       {detail}")
+            for problem in statement.problems:
+                print(f"     ⚠️  {problem}")
+
+    failed = [entry for entry in entries if not entry.passed]
+    print()
+    if failed:
+        print(f"❌ {len(failed)} of {len(entries)} tracker queries don't use an index")
+        return 1
+    print(f"✅ All {len(entries)} tracker queries use indexes")
+    return 0
+
+
+# get_best_times_by_year before it was rewritten: joins runs to itself twice and
+# groups on result and timestamp, returning a row per tied best run
+LEGACY_BEST_TIMES_SQL = """
+    WITH best_runs AS (
+        SELECT year, day, part, MIN(execution_time_ms) as best_time_ms
+        FROM runs
+        {where_clause}
+        GROUP BY year, day, part
+    )
+    SELECT br.year, br.day, br.part, br.best_time_ms, COUNT(r.id) as total_runs,
+           r.result, r.timestamp as best_run_timestamp
+    FROM best_runs br
+    JOIN runs r ON (
+        r.year = br.year AND r.day = br.day AND r.part = br.part AND
+        r.execution_time_ms = br.best_time_ms AND r.success = 1
+    )
+    LEFT JOIN runs r2 ON (
+        r2.year = br.year AND r2.day = br.day AND r2.part = br.part AND r2.success = 1
+    )
+    GROUP BY br.year, br.day, br.part, r.result, r.timestamp
+    ORDER BY br.year DESC, br.day ASC, br.part ASC
+"""
+
+_BEST_TIMES_KEYS = ('year', 'day', 'part', 'best_time_ms', 'total_runs', 'result', 'best_run_timestamp')
+
+
+def _legacy_best_times(conn: sqlite3.Connection, year: int = None) -> List[Dict]:
+    where_clause = "WHERE success = 1 AND is_sample = 0"
+    params = []
+    if year:
+        where_clause += " AND year = ?"
+        params.append(year)
+    rows = conn.execute(LEGACY_BEST_TIMES_SQL.format(where_clause=where_clause), params).fetchall()
+    return [dict(zip(_BEST_TIMES_KEYS, row)) for row in rows]
+
+
+def _best_of(repeat: int, func: Callable[[], Any]) -> Tuple[float, Any]:
+    """Fastest of repeat calls in seconds, and the last result."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run_best_times_benchmark(runs_per_problem: int = 10_000, years: Sequence[int] = (2025,),
+                             repeat: int = 3) -> int:
+    """
+    Benchmark get_best_times_by_year against the legacy self-join query.
+
+    Args:
+        runs_per_problem: Synthetic runs for each day and part
+        years: Years to fill (50 problems each)
+        repeat: Timed calls per query; the fastest counts
+
+    Returns:
+        Process exit code: 1 if the two queries disagree on a database without ties, else 0
+    """
+    rows = runs_per_problem * 50 * len(years)
+    exit_code = 0
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = Path(temp_dir) / "bench_tracking.db"
+        print(f"🔧 Building synthetic tracking database with {rows:,} runs "
+              f"({runs_per_problem:,} per problem)...")
+        build_synthetic_database(db_path, rows, years=years)
+
+        tracker = AOCTracker(db_path)
+        legacy_conn = sqlite3.connect(db_path)
+        try:
+            print(f"\n⏱️  get_best_times_by_year, fastest of {repeat}")
+            print("=" * 60)
+            for year in [years[0], None]:
+                scope = f"year {year}" if year else "all years"
+                legacy_time, legacy = _best_of(repeat, lambda: _legacy_best_times(legacy_conn, year))
+                current_time, current = _best_of(repeat, lambda: tracker.get_best_times_by_year(year))
+                same = legacy == current
+                print(f"{'✅' if same else '❌'} {scope:<10} legacy {legacy_time * 1000:9.2f}ms   "
+                      f"current {current_time * 1000:9.2f}ms   ({legacy_time / current_time:.1f}x)"
+                      f"   {len(current)} rows {'identical' if same else 'DIFFER'}")
+                if not same:
+                    exit_code = 1
+
+            # Tie every problem's best run with a copy; the legacy query then returns a row per copy
+            tracker.close()
+            with sqlite3.connect(db_path) as conn:
+                conn.execute("""
+                    INSERT INTO runs (year, day, part, timestamp, execution_time_ms, result, input_hash,
+                                      code_hash, success, error_message, is_sample, parse_time_ms)
+                    SELECT year, day, part, datetime(timestamp, '+1 day'), execution_time_ms, result,
+                           input_hash, code_hash, success, error_message, is_sample, parse_time_ms
+                    FROM runs WHERE id IN (SELECT best_run_id FROM run_stats WHERE is_sample = 0)
+                """)
+                # Reopening the tracker rebuilds run_stats with the copies
+                conn.execute("DROP TABLE run_stats")
+            tracker = AOCTracker(db_path)
+            legacy = _legacy_best_times(legacy_conn)
+            current = tracker.get_best_times_by_year()
+            print(f"\nWith every best time tied: legacy {len(legacy)} rows, current {len(current)} rows "
+                  f"(one per problem, earliest run)")
+        finally:
+            legacy_conn.close()
+            tracker.close()
+
+    return exit_code
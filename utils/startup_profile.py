@@ -0,0 +1,182 @@
+"""
+Startup-time profiling for the command-line entry point.
+
+Re-runs a command in a child interpreter with `-X importtime` and summarises
+where the import time goes, optionally failing when it exceeds a budget.
+
+Run as `python -m utils.startup_profile` it is a regression check for CI: it
+profiles a plain solution run and exits non-zero when the run path imports
+exceed the budget or pull in one of the heavy modules that must stay lazy.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence, Set, Tuple
+
+
+MAIN_SCRIPT = Path(__file__).resolve().parent.parent / "main.py"
+
+# Defaults for the CI check: a plain run must stay well within the budget and never import these
+CHECK_COMMAND = ["2025", "1", "--no-tracking"]
+CHECK_BUDGET_MS = 150.0
+LAZY_MODULES = ("requests", "bs4", "benchmarking.runner")
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the startup profiling options to a parser."""
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print an import time breakdown of this command instead of its output "
+                             "(works with any command)")
+    parser.add_argument("--startup-budget", type=float, metavar="MS", default=None,
+                        help="with --profile-startup: exit non-zero if run path imports exceed MS milliseconds")
+    parser.add_argument("--profile-top", type=int, metavar="N", default=20,
+                        help="with --profile-startup: number of packages and modules to list (default: 20)")
+
+
+def extract_profile_options(argv: List[str]) -> Tuple[argparse.Namespace, List[str]]:
+    """
+    Split the startup profiling options from the remaining command-line arguments.
+
+    Returns:
+        Tuple of (profiling options, remaining arguments)
+    """
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    add_profile_arguments(parser)
+    return parser.parse_known_args(argv)
+
+
+def parse_importtime(stderr: str) -> List[Tuple[int, int, int, str]]:
+    """
+    Parse `-X importtime` output.
+
+    Returns:
+        List of (depth, self_us, cumulative_us, module) in import order
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # Header line
+
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        entries.append((depth, int(parts[0]), int(parts[1]), stripped))
+    return entries
+
+
+def _interpreter_baseline() -> Set[str]:
+    """Modules the bare interpreter imports before running any code."""
+    import subprocess
+
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "pass"],
+                            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True)
+    return {entry[3] for entry in parse_importtime(result.stderr)}
+
+
+def profile_startup(argv: List[str], top: int = 20, budget_ms: float = None,
+                    forbidden: Sequence[str] = ()) -> int:
+    """
+    Profile the imports of running `main.py` with the given arguments.
+
+    Args:
+        argv: Arguments for main.py (without the profiling options)
+        top: Number of slowest modules to list
+        budget_ms: Optional import time budget in milliseconds
+        forbidden: Modules that must not be imported by the command
+
+    Returns:
+        Process exit code: 1 if the budget was exceeded, a forbidden module was
+        imported or the command failed, else 0
+    """
+    import subprocess
+
+    baseline = _interpreter_baseline()
+
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", str(MAIN_SCRIPT)] + argv,
+                            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    entries = parse_importtime(result.stderr)
+
+    # Only top-level imports that the bare interpreter doesn't already do count towards the run path
+    run_path = [e for e in entries if e[0] == 0 and e[3] not in baseline]
+    interpreter_ms = sum(e[2] for e in entries if e[0] == 0 and e[3] in baseline) / 1000
+    import_ms = sum(e[2] for e in run_path) / 1000
+
+    by_package: Dict[str, int] = {}
+    for depth, self_us, cumulative_us, name in entries:
+        if name in baseline:
+            continue
+        package = name.split(".")[0]
+        by_package[package] = by_package.get(package, 0) + self_us
+
+    command = " ".join(["main.py"] + argv)
+    print(f"⏱️  Startup profile: {command}")
+    print("=" * 60)
+    print(f"Wall time:            {wall_ms:8.1f}ms")
+    print(f"Interpreter imports:  {interpreter_ms:8.1f}ms")
+    print(f"Run path imports:     {import_ms:8.1f}ms ({len(run_path)} top-level imports)")
+
+    print(f"\nImport time by package (self time):")
+    for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:top]:
+        print(f"  {self_us / 1000:8.2f}ms  {package}")
+
+    print(f"\nSlowest imports (cumulative | self):")
+    slowest = sorted((e for e in entries if e[3] not in baseline), key=lambda e: -e[2])[:top]
+    for depth, self_us, cumulative_us, name in slowest:
+        print(f"  {cumulative_us / 1000:8.2f}ms | {self_us / 1000:7.2f}ms  {'  ' * depth}{name}")
+
+    exit_code = 0
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        print(f"\n⚠️  Command exited with code {result.returncode}")
+        for line in errors[-10:]:
+            print(f"   {line}")
+        exit_code = 1
+
+    if budget_ms is not None:
+        if import_ms > budget_ms:
+            print(f"\n❌ Run path import time {import_ms:.1f}ms exceeds budget of {budget_ms:.1f}ms")
+            exit_code = 1
+        else:
+            print(f"\n✅ Run path import time {import_ms:.1f}ms is within budget of {budget_ms:.1f}ms")
+
+    imported = {e[3] for e in entries}
+    leaked = [module for module in forbidden if module in imported]
+    if leaked:
+        print(f"\n❌ Command imports modules that should be lazy: {', '.join(leaked)}")
+        exit_code = 1
+
+    return exit_code
+
+
+def main() -> int:
+    """Startup regression check, for CI."""
+    parser = argparse.ArgumentParser(
+        prog="python -m utils.startup_profile",
+        description="Fail if a plain solution run imports too slowly or loads heavy modules eagerly")
+    parser.add_argument("--budget", type=float, metavar="MS", default=CHECK_BUDGET_MS,
+                        help=f"run path import budget in milliseconds (default: {CHECK_BUDGET_MS:g})")
+    parser.add_argument("--top", type=int, metavar="N", default=10,
+                        help="number of packages and modules to list (default: 10)")
+    parser.add_argument("command", nargs=argparse.REMAINDER,
+                        help=f"arguments for main.py (default: {' '.join(CHECK_COMMAND)}); "
+                             f"the input must already be downloaded")
+    args = parser.parse_args()
+
+    command = args.command
+    if command and command[0] == "--":
+        command = command[1:]
+    return profile_startup(command or CHECK_COMMAND, top=args.top, budget_ms=args.budget,
+                           forbidden=LAZY_MODULES)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -53,11 +53,12 @@ class StatsGenerator:
                 years_data[y][day] = {}
             years_data[y][day][entry['part']] = entry
 
+        summaries = self.tracker.get_year_summaries(year)
         output = []
 
         for year_key in sorted(years_data.keys(), reverse=True):
             year_data = years_data[year_key]
-            year_summary = self.tracker.get_year_summary(year_key)
+            year_summary = summaries[year_key]
 
             output.append(f"\n## {year_key} Statistics")
             output.append(f"\n**Year Summary:**")
@@ -108,7 +109,7 @@ class StatsGenerator:
 
     def generate_overall_stats(self) -> str:
         """Generate overall statistics across all years."""
-        overall_summary = self.tracker.get_year_summary()
+        overall_summary = self.tracker.get_year_summaries()[None]
         available_years = self.tracker.get_available_years()
 
         if not available_years:
@@ -127,3 +128,37 @@ class StatsGenerator:
         output.append("")
 
         return "\n".join(output)
+
+    def generate_regressions_table(self, year: int = None, show_all: bool = False) -> str:
+        """
+        Generate a table of problems whose current code version is slower than the previous one.
+
+        With show_all, every problem with a previous version on the same input
+        is listed, whether or not it regressed.
+        """
+        comparisons = self.tracker.get_version_comparisons(year)
+        if not show_all:
+            comparisons = [c for c in comparisons if c.is_regression]
+        if not comparisons:
+            return ""
+
+        table_rows = []
+        for comparison in comparisons:
+            problem = f"{comparison.year} Day {comparison.day} Part {comparison.part}"
+            if show_all:
+                problem = f"{'🐢' if comparison.is_regression else '  '} {problem}"
+            table_rows.append([
+                problem,
+                f"{comparison.previous_code_hash[:8]} → {comparison.code_hash[:8]}",
+                f"{format_time(comparison.previous_median_ms)} → {format_time(comparison.median_ms)}",
+                f"{(comparison.slowdown - 1) * 100:+.0f}%",
+                f"{comparison.p_value:.2g}",
+                f"{comparison.previous_runs} → {comparison.runs}"
+            ])
+
+        output = []
+        output.append("## 🐢 Performance Regressions" if not show_all else "## 🔎 Code Version Comparisons")
+        output.append("")
+        headers = ["Problem", "Version", "Median", "Change", "p-value", "Runs"]
+        output.append(self.format_table_for_terminal(headers, table_rows))
+        return "\n".join(output)